@@ -0,0 +1,115 @@
+import os
+import tracemalloc
+
+import numpy as np
+
+from trajectory_planning_helpers import (
+    calc_splines,
+    interp_splines,
+    path_matching_global,
+    FrenetFrame,
+)
+
+
+def replay(
+    path_cl: np.ndarray,
+    ego_positions: np.ndarray,
+    s_ego: np.ndarray,
+    use_s_expected: bool,
+    trace_allocations: bool = False,
+) -> tuple:
+    # replay the ego trajectory and collect runtime (via the timing callback) and peak allocations of every query
+    runtimes = []
+    allocations = np.zeros(ego_positions.shape[0])
+    s_tot = path_cl[-1, 0]
+    s_prev = s_ego[0]
+
+    for i in range(ego_positions.shape[0]):
+        if use_s_expected:
+            # predict the s position on the basis of the last match and the travelled distance
+            s_expected = np.mod(s_prev + s_ego[i] - s_ego[max(i - 1, 0)], s_tot)
+        else:
+            s_expected = None
+
+        if trace_allocations:
+            tracemalloc.reset_peak()
+            mem_start = tracemalloc.get_traced_memory()[0]
+
+        s_prev = path_matching_global(
+            path_cl=path_cl,
+            ego_position=ego_positions[i],
+            s_expected=s_expected,
+            timing_callback=runtimes.append,
+        )[0]
+
+        if trace_allocations:
+            allocations[i] = tracemalloc.get_traced_memory()[1] - mem_start
+
+    return np.array(runtimes), allocations
+
+
+if __name__ == "__main__":
+
+    # --- PARAMETERS ---
+    STEPSIZE_PATH = 1.0  # stepsize of the path used for matching in m
+    V_EGO = 30.0  # ego velocity in m/s
+    DT = 0.01  # cycle time of the matching in s
+    NO_LAPS = 2
+
+    # --- IMPORT TRACK AND CREATE PATH ---
+    csv_data_temp = np.loadtxt(
+        os.path.join(os.path.dirname(__file__), "example_files/berlin_2018.csv"),
+        comments="#",
+        delimiter=",",
+    )
+    refline_cl = np.vstack((csv_data_temp[:, 0:2], csv_data_temp[0, 0:2]))
+    coeffs_x, coeffs_y = calc_splines(path=refline_cl, closed=True)[:2]
+
+    path_interp, _, _, s_interp = interp_splines(
+        coeffs_x=coeffs_x,
+        coeffs_y=coeffs_y,
+        closed=False,
+        stepsize_approx=STEPSIZE_PATH,
+    )
+    path_cl = np.column_stack((s_interp, path_interp))
+
+    # --- CREATE SYNTHETIC EGO TRAJECTORY (WEAVING AROUND THE PATH) ---
+    frenet_frame = FrenetFrame(coeffs_x=coeffs_x, coeffs_y=coeffs_y, closed=True)
+    s_ego = np.arange(0.0, NO_LAPS * frenet_frame.s_tot, V_EGO * DT)
+    d_ego = 1.5 * np.sin(s_ego / 50.0) + np.random.default_rng(0).normal(
+        0.0, 0.05, s_ego.size
+    )
+    ego_positions = frenet_frame.frenet2cart(s=s_ego, d=d_ego)[0]
+
+    # --- BENCHMARK ---
+    print("Path with %i points, %i queries per run" % (path_cl.shape[0], s_ego.size))
+
+    for use_s_expected in (False, True):
+        runtimes = replay(
+            path_cl=path_cl,
+            ego_positions=ego_positions,
+            s_ego=s_ego,
+            use_s_expected=use_s_expected,
+        )[0]
+
+        tracemalloc.start()
+        allocations = replay(
+            path_cl=path_cl,
+            ego_positions=ego_positions,
+            s_ego=s_ego,
+            use_s_expected=use_s_expected,
+            trace_allocations=True,
+        )[1]
+        tracemalloc.stop()
+
+        print(
+            "s_expected %-5s: latency p50 %.1fus, p99 %.1fus, max %.1fus | peak allocations p50 %.1fkB, max %.1fkB"
+            % (
+                use_s_expected,
+                np.percentile(runtimes, 50) * 1e6,
+                np.percentile(runtimes, 99) * 1e6,
+                np.amax(runtimes) * 1e6,
+                np.percentile(allocations, 50) / 1e3,
+                np.amax(allocations) / 1e3,
+            )
+        )
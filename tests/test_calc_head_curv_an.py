@@ -0,0 +1,123 @@
+import math
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+from trajectory_planning_helpers import calc_head_curv_an, calc_splines
+
+if __name__ == "__main__":
+
+    # --- IMPORT TRACK AND CALCULATE SPLINES ---
+    csv_data_temp = np.loadtxt(
+        os.path.join(os.path.dirname(__file__), "example_files/berlin_2018.csv"),
+        comments="#",
+        delimiter=",",
+    )
+    refline = csv_data_temp[:, 0:2]
+    coeffs_x, coeffs_y = calc_splines(
+        path=np.vstack((refline, refline[0])), closed=True
+    )[:2]
+
+    # append a straight spline heading in negative x direction, i.e. arctan2() returns exactly pi
+    coeffs_x = np.vstack((coeffs_x, [0.0, -1.0, 0.0, 0.0]))
+    coeffs_y = np.vstack((coeffs_y, [0.0, 0.0, 0.0, 0.0]))
+
+    no_points = 10000
+    ind_spls = np.random.randint(0, coeffs_x.shape[0], no_points)
+    ind_spls[-1] = coeffs_x.shape[0] - 1
+    t_spls = np.random.rand(no_points)
+
+    # --- REFERENCE: NEWLY ALLOCATED OUTPUTS ---
+    psi, kappa, dkappa = calc_head_curv_an(
+        coeffs_x=coeffs_x,
+        coeffs_y=coeffs_y,
+        ind_spls=ind_spls,
+        t_spls=t_spls,
+        calc_dcurv=True,
+    )
+
+    if not math.isclose(psi[-1], -math.pi):
+        raise RuntimeError("Heading pi was not mapped to -pi!")
+
+    # --- OUTPUTS WRITTEN INTO MEMORY-MAPPED BUFFERS (NDARRAY SUBCLASS) ---
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        buffers = np.memmap(
+            os.path.join(tmp_dir, "buffers.dat"),
+            dtype=np.float64,
+            mode="w+",
+            shape=(3, no_points),
+        )
+
+        psi_mm, kappa_mm, dkappa_mm = calc_head_curv_an(
+            coeffs_x=coeffs_x,
+            coeffs_y=coeffs_y,
+            ind_spls=ind_spls,
+            t_spls=t_spls,
+            calc_dcurv=True,
+            psi_out=buffers[0],
+            kappa_out=buffers[1],
+            dkappa_out=buffers[2],
+        )
+
+        if not (
+            np.array_equal(psi_mm, psi)
+            and np.array_equal(kappa_mm, kappa)
+            and np.array_equal(dkappa_mm, dkappa)
+            and np.array_equal(buffers, np.vstack((psi, kappa, dkappa)))
+        ):
+            raise RuntimeError("Outputs written into the buffers differ!")
+
+        del buffers, psi_mm, kappa_mm, dkappa_mm
+
+    print("Outputs written into memory-mapped buffers match the allocated outputs.")
+
+    # --- FEW POINTS ON A LARGE NUMBER OF SPLINES ---
+    NO_LAPS = 1000
+    coeffs_x_large = np.tile(coeffs_x, (NO_LAPS, 1))
+    coeffs_y_large = np.tile(coeffs_y, (NO_LAPS, 1))
+
+    # same points on the last lap
+    ind_spls_large = ind_spls[:10] + (NO_LAPS - 1) * coeffs_x.shape[0]
+    psi_large, kappa_large = calc_head_curv_an(
+        coeffs_x=coeffs_x_large,
+        coeffs_y=coeffs_y_large,
+        ind_spls=ind_spls_large,
+        t_spls=t_spls[:10],
+    )
+
+    if not (
+        np.array_equal(psi_large, psi[:10]) and np.array_equal(kappa_large, kappa[:10])
+    ):
+        raise RuntimeError("Outputs for few points on many splines differ!")
+
+    # the runtime must depend on the number of points, not on the number of splines (i.e. it must be far below the
+    # time required to copy the coefficient matrices once)
+    t_query = min(
+        timeit.repeat(
+            lambda: calc_head_curv_an(
+                coeffs_x=coeffs_x_large,
+                coeffs_y=coeffs_y_large,
+                ind_spls=ind_spls_large,
+                t_spls=t_spls[:10],
+            ),
+            number=10,
+            repeat=5,
+        )
+    )
+    t_copy = min(
+        timeit.repeat(
+            lambda: (np.copy(coeffs_x_large), np.copy(coeffs_y_large)),
+            number=10,
+            repeat=5,
+        )
+    )
+
+    print(
+        "10 points on %i splines: %.3fms (copy of coefficients: %.3fms)"
+        % (coeffs_x_large.shape[0], t_query * 100.0, t_copy * 100.0)
+    )
+
+    if t_query > 0.5 * t_copy:
+        raise RuntimeError("Runtime for few points depends on the number of splines!")
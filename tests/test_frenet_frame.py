@@ -0,0 +1,55 @@
+import os
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from trajectory_planning_helpers import calc_splines, FrenetFrame
+
+if __name__ == "__main__":
+
+    # --- IMPORT TRACK ---
+    csv_data_temp = np.loadtxt(
+        os.path.join(os.path.dirname(__file__), "example_files/berlin_2018.csv"),
+        comments="#",
+        delimiter=",",
+    )
+    refline = csv_data_temp[:, 0:2]
+
+    # --- CREATE FRENET FRAME ---
+    coeffs_x, coeffs_y = calc_splines(
+        path=np.vstack((refline, refline[0])), closed=True
+    )[:2]
+    frenet_frame = FrenetFrame(coeffs_x=coeffs_x, coeffs_y=coeffs_y, closed=True)
+
+    # --- TRANSFORM RANDOM SAMPLES FORTH AND BACK ---
+    rng = np.random.default_rng(0)
+    s_samples = rng.uniform(0.0, frenet_frame.s_tot, 5000)
+    d_samples = rng.uniform(-3.0, 3.0, 5000)
+
+    t_start = time.perf_counter()
+    pos_samples, psi_samples = frenet_frame.frenet2cart(s=s_samples, d=d_samples)[:2]
+    t_inv = time.perf_counter() - t_start
+
+    t_start = time.perf_counter()
+    s_matched, d_matched = frenet_frame.cart2frenet(pos=pos_samples)[:2]
+    t_fwd = time.perf_counter() - t_start
+
+    s_error = np.abs(
+        np.mod(s_matched - s_samples + frenet_frame.s_tot / 2, frenet_frame.s_tot)
+        - frenet_frame.s_tot / 2
+    )
+    print(
+        "Runtime frenet2cart: %.2fms, cart2frenet: %.2fms" % (t_inv * 1e3, t_fwd * 1e3)
+    )
+    print(
+        "Max. errors after round trip: s %.2em, d %.2em"
+        % (np.amax(s_error), np.amax(np.abs(d_matched - d_samples)))
+    )
+
+    # --- PLOT RESULTS ---
+    plt.plot(refline[:, 0], refline[:, 1], "k")
+    plt.scatter(pos_samples[:, 0], pos_samples[:, 1], c=d_samples, s=2)
+    plt.colorbar(label="d in m")
+    plt.axis("equal")
+    plt.show()
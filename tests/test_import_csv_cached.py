@@ -0,0 +1,137 @@
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from trajectory_planning_helpers import import_csv_cached
+
+
+class CountingValidation:
+    # validation function that counts its calls, i.e. the number of times the csv file was parsed
+    def __init__(self):
+        self.no_calls = 0
+
+    def __call__(self, data: np.ndarray) -> np.ndarray:
+        self.no_calls += 1
+
+        if np.any(data < 0.0):
+            raise RuntimeError("Negative values in csv file!")
+
+        return data
+
+
+def check(condition: bool, msg: str) -> None:
+    if not condition:
+        raise RuntimeError(msg)
+
+    print("OK: " + msg)
+
+
+if __name__ == "__main__":
+
+    ggv_path = os.path.join(os.path.dirname(__file__), "example_files/ggv.csv")
+    ggv = np.loadtxt(ggv_path, comments="#", delimiter=",")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "ggv.csv")
+        shutil.copyfile(ggv_path, csv_path)
+        npy_path = csv_path + ".npy"
+        meta_path = csv_path + ".json"
+        validate = CountingValidation()
+
+        # --- CACHE MISS, THEN HIT ---
+        data_1 = import_csv_cached(csv_path=csv_path, validate=validate)
+        data_2 = import_csv_cached(csv_path=csv_path, validate=validate)
+
+        check(
+            validate.no_calls == 1 and os.path.exists(npy_path),
+            "csv file is parsed once and cached",
+        )
+        check(
+            np.array_equal(data_1, ggv) and np.array_equal(data_2, ggv),
+            "cached data equals csv data",
+        )
+        check(
+            type(data_1) is type(data_2) is np.memmap
+            and not data_1.flags.writeable
+            and not data_2.flags.writeable,
+            "first and later imports return read-only memory-mapped arrays",
+        )
+
+        del data_1, data_2
+
+        # --- TOUCHED BUT UNCHANGED CSV FILE ---
+        mtime_ns = os.stat(csv_path).st_mtime_ns + 10**9
+        os.utime(csv_path, ns=(mtime_ns, mtime_ns))
+        data = import_csv_cached(csv_path=csv_path, validate=validate)
+
+        with open(meta_path, "r") as fh:
+            meta = json.load(fh)
+
+        check(
+            validate.no_calls == 1 and np.array_equal(data, ggv),
+            "touched csv file is not parsed again (same hash)",
+        )
+        check(meta["mtime_ns"] == mtime_ns, "key is updated after touching")
+
+        del data
+
+        # --- CHANGED CSV FILE ---
+        with open(csv_path, "a") as fh:
+            fh.write("100.0,1.0,1.0\n")
+
+        data = import_csv_cached(csv_path=csv_path, validate=validate)
+        check(
+            validate.no_calls == 2 and data.shape[0] == ggv.shape[0] + 1,
+            "changed csv file is parsed again",
+        )
+
+        del data
+
+        # --- STALE SIDECAR (E.G. WRITTEN CONCURRENTLY FOR ANOTHER KEY) ---
+        np.save(npy_path, np.zeros((2, 2)))
+        data = import_csv_cached(csv_path=csv_path, validate=validate)
+        check(
+            validate.no_calls == 3 and data.shape == (ggv.shape[0] + 1, 3),
+            "sidecar not matching its key is rejected and rewritten",
+        )
+
+        del data
+
+        # --- VALIDATION ERROR ---
+        invalid_path = os.path.join(tmp_dir, "invalid.csv")
+        np.savetxt(invalid_path, -ggv, delimiter=",")
+
+        try:
+            import_csv_cached(csv_path=invalid_path, validate=validate)
+            raised = False
+        except RuntimeError:
+            raised = True
+
+        check(
+            raised
+            and not os.path.exists(invalid_path + ".npy")
+            and not os.path.exists(invalid_path + ".json"),
+            "validation error is raised and no sidecar is written",
+        )
+
+        # --- READ-ONLY CACHE DIRECTORY ---
+        ro_dir = os.path.join(tmp_dir, "read_only")
+        os.mkdir(ro_dir)
+        os.chmod(ro_dir, 0o555)
+
+        # permissions are not enforced for privileged users -> use a path below a file, which is never writable
+        if os.access(ro_dir, os.W_OK):
+            ro_dir = os.path.join(csv_path, "read_only")
+
+        data = import_csv_cached(csv_path=ggv_path, cache_dir=ro_dir)
+        check(
+            np.array_equal(data, ggv) and not data.flags.writeable,
+            "read-only cache directory falls back to a parsed (read-only) array",
+        )
+
+        if os.path.isdir(ro_dir):
+            check(not os.listdir(ro_dir), "nothing is written to read-only directory")
+            os.chmod(ro_dir, 0o755)
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+import types
+
+# modules that must not be loaded by importing the package (only by using the functions that require them)
+HEAVY_MODULES = [
+    "scipy",
+    "matplotlib",
+    "quadprog",
+]
+
+# maximum allowed import time of the package in s (measured in a fresh interpreter)
+IMPORT_TIME_MAX = 0.2
+
+if __name__ == "__main__":
+
+    # --- IMPORT PACKAGE IN A FRESH INTERPRETER ---
+    code = (
+        "import sys, time\n"
+        "t_start = time.perf_counter()\n"
+        "import trajectory_planning_helpers\n"
+        "print(time.perf_counter() - t_start)\n"
+        "print(','.join(m for m in %r if m in sys.modules))\n" % HEAVY_MODULES
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+
+    import_time = float(output[0])
+    heavy_modules_loaded = output[1]
+
+    print("Import time of the package: %.1fms" % (import_time * 1000.0))
+
+    if heavy_modules_loaded:
+        raise RuntimeError(
+            "Importing the package loads the modules: " + heavy_modules_loaded
+        )
+
+    if import_time > IMPORT_TIME_MAX:
+        raise RuntimeError(
+            "Importing the package takes longer than %.1fs!" % IMPORT_TIME_MAX
+        )
+
+    # --- CHECK THAT FUNCTIONS ARE NOT SHADOWED BY THEIR SUBMODULES ---
+    import trajectory_planning_helpers as tph
+
+    tph.create_raceline  # imports further submodules, e.g. calc_splines
+    for name in tph.__all__:
+        if not callable(getattr(tph, name)):
+            raise RuntimeError("%s is not callable!" % name)
+
+    print("All %i attributes of the package can be accessed." % len(tph.__all__))
+
+    # --- CHECK THAT SUBMODULES NAMED DIFFERENTLY FROM THEIR FUNCTIONS CAN BE ACCESSED ---
+    for name in ("splunif", "signal_filt", "spline_evaluator", "trajectory_file"):
+        if not isinstance(getattr(tph, name), types.ModuleType):
+            raise RuntimeError("%s is not a submodule!" % name)
+
+    if tph.frenet_frame.FrenetFrame is not tph.FrenetFrame:
+        raise RuntimeError("Submodule frenet_frame does not define FrenetFrame!")
+
+    print("Submodules of the package can be accessed as attributes.")
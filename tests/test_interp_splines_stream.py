@@ -0,0 +1,76 @@
+import os
+import tempfile
+
+import numpy as np
+
+from trajectory_planning_helpers import (
+    calc_head_curv_an,
+    calc_splines,
+    interp_splines,
+    interp_splines_stream,
+)
+
+if __name__ == "__main__":
+
+    # --- PARAMETERS ---
+    STEPSIZE = 0.5  # stepsize of the interpolated path in m
+    BLOCK_SIZE = 1000  # number of points per block
+    NO_LAPS = 10
+
+    # --- IMPORT TRACK AND CREATE MULTI-LAP PATH ---
+    csv_data_temp = np.loadtxt(
+        os.path.join(os.path.dirname(__file__), "example_files/berlin_2018.csv"),
+        comments="#",
+        delimiter=",",
+    )
+    refline = csv_data_temp[:, 0:2]
+    coeffs_x, coeffs_y = calc_splines(
+        path=np.vstack((refline, refline[0])), closed=True
+    )[:2]
+    coeffs_x = np.tile(coeffs_x, (NO_LAPS, 1))
+    coeffs_y = np.tile(coeffs_y, (NO_LAPS, 1))
+
+    # --- STORE COEFFICIENTS AND MEMORY-MAP THEM ---
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        np.save(os.path.join(tmp_dir, "coeffs_x.npy"), coeffs_x)
+        np.save(os.path.join(tmp_dir, "coeffs_y.npy"), coeffs_y)
+        coeffs_x_mm = np.load(os.path.join(tmp_dir, "coeffs_x.npy"), mmap_mode="r")
+        coeffs_y_mm = np.load(os.path.join(tmp_dir, "coeffs_y.npy"), mmap_mode="r")
+
+        # --- STREAMING PIPELINE: INTERPOLATION -> HEADING AND CURVATURE ---
+        kappa_max = 0.0
+        s_blocks = []
+
+        for path_block, inds_block, t_block, s_block in interp_splines_stream(
+            coeffs_x=coeffs_x_mm,
+            coeffs_y=coeffs_y_mm,
+            stepsize_approx=STEPSIZE,
+            closed=True,
+            block_size=BLOCK_SIZE,
+        ):
+            kappa_block = calc_head_curv_an(
+                coeffs_x=coeffs_x_mm,
+                coeffs_y=coeffs_y_mm,
+                ind_spls=inds_block,
+                t_spls=t_block,
+            )[1]
+            kappa_max = max(kappa_max, np.amax(np.abs(kappa_block)))
+            s_blocks.append(s_block)
+
+        del coeffs_x_mm, coeffs_y_mm
+
+    # --- COMPARE AGAINST NON-STREAMING VERSION ---
+    path_interp, spline_inds, t_values, s_interp = interp_splines(
+        coeffs_x=coeffs_x, coeffs_y=coeffs_y, closed=True, stepsize_approx=STEPSIZE
+    )
+    kappa = calc_head_curv_an(
+        coeffs_x=coeffs_x, coeffs_y=coeffs_y, ind_spls=spline_inds, t_spls=t_values
+    )[1]
+
+    s_stream = np.concatenate(s_blocks)
+    print("Number of blocks: %i, number of points: %i" % (len(s_blocks), s_stream.size))
+    print("Max. deviation of s: %.2em" % np.amax(np.abs(s_stream - s_interp)))
+    print(
+        "Max. curvature stream: %.6frad/m, full path: %.6frad/m"
+        % (kappa_max, np.amax(np.abs(kappa)))
+    )
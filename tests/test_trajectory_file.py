@@ -0,0 +1,109 @@
+import os
+import tempfile
+
+import numpy as np
+
+from trajectory_planning_helpers import (
+    calc_ax_profile,
+    calc_head_curv_an,
+    calc_normal_vectors,
+    calc_splines,
+    calc_vel_profile,
+    create_raceline,
+    import_veh_dyn_info,
+    read_trajectory,
+    write_trajectory,
+)
+
+if __name__ == "__main__":
+
+    # --- IMPORT TRACK AND VEHICLE DYNAMICS INFORMATION ---
+    example_dir = os.path.join(os.path.dirname(__file__), "example_files")
+    csv_data_temp = np.loadtxt(
+        os.path.join(example_dir, "berlin_2018.csv"), comments="#", delimiter=","
+    )
+    refline = csv_data_temp[:, 0:2]
+    ggv, ax_max_machines = import_veh_dyn_info(
+        ggv_import_path=os.path.join(example_dir, "ggv.csv"),
+        ax_max_machines_import_path=os.path.join(example_dir, "ax_max_machines.csv"),
+    )
+
+    # --- CREATE RACELINE (REFERENCE LINE) WITH VELOCITY PROFILE ---
+    coeffs_x, coeffs_y = calc_splines(
+        path=np.vstack((refline, refline[0])), closed=True
+    )[:2]
+    normvectors = calc_normal_vectors(
+        calc_head_curv_an(
+            coeffs_x=coeffs_x,
+            coeffs_y=coeffs_y,
+            ind_spls=np.arange(refline.shape[0]),
+            t_spls=np.zeros(refline.shape[0]),
+            calc_curv=False,
+        )[0]
+    )
+    (
+        raceline_interp,
+        _,
+        coeffs_x_rl,
+        coeffs_y_rl,
+        _,
+        spline_inds,
+        t_values,
+        s_interp,
+        spline_lengths,
+        el_lengths_cl,
+    ) = create_raceline(
+        refline=refline,
+        normvectors=normvectors,
+        alpha=np.zeros(refline.shape[0]),
+        stepsize_interp=1.0,
+    )
+    psi, kappa = calc_head_curv_an(
+        coeffs_x=coeffs_x_rl,
+        coeffs_y=coeffs_y_rl,
+        ind_spls=spline_inds,
+        t_spls=t_values,
+    )
+    vx = calc_vel_profile(
+        ax_max_machines=ax_max_machines,
+        kappa=kappa,
+        el_lengths=el_lengths_cl,
+        closed=True,
+        drag_coeff=0.75,
+        m_veh=1200.0,
+        ggv=ggv,
+    )
+    ax = calc_ax_profile(
+        vx_profile=np.append(vx, vx[0]),
+        el_lengths=el_lengths_cl,
+        eq_length_output=False,
+    )
+    trajectory = np.column_stack((s_interp, raceline_interp, psi, kappa, vx, ax))
+
+    # --- WRITE AND READ TRAJECTORY ---
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "raceline.traj")
+
+        for dtype in (np.float64, np.float32):
+            write_trajectory(
+                file_path=file_path,
+                trajectory=trajectory,
+                dtype=dtype,
+                closed=True,
+                s_tot=float(np.sum(spline_lengths)),
+                metadata={"track": "berlin_2018"},
+            )
+            trajectory_read, header = read_trajectory(file_path=file_path)
+
+            print(
+                "%s: %i bytes, columns: %s, s_tot: %.2fm, max. deviation: %.2e"
+                % (
+                    header["dtype"],
+                    os.path.getsize(file_path),
+                    header["columns"],
+                    header["s_tot"],
+                    np.amax(np.abs(trajectory_read - trajectory)),
+                )
+            )
+
+            del trajectory_read
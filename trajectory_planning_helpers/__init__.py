@@ -1,35 +1,107 @@
-from .interp_splines import interp_splines
-from .calc_spline_lengths import calc_spline_lengths
-from .calc_splines import calc_splines
-from .calc_normal_vectors import calc_normal_vectors
-from .normalize_psi import normalize_psi
-from .calc_head_curv_an import calc_head_curv_an
-from .calc_head_curv_num import calc_head_curv_num
-from .calc_t_profile import calc_t_profile
-from .import_veh_dyn_info import import_veh_dyn_info
-from .calc_ax_profile import calc_ax_profile
-from .angle3pt import angle3pt
-from .progressbar import progressbar
-from .calc_vel_profile import calc_vel_profile
-from .calc_vel_profile_brake import calc_vel_profile_brake
-from .spline_approximation import spline_approximation
-from .side_of_line import side_of_line
-from .conv_filt import conv_filt
-from .path_matching_global import path_matching_global
-from .path_matching_local import path_matching_local
-from .get_rel_path_part import get_rel_path_part
-from .create_raceline import create_raceline
-from .iqp_handler import iqp_handler
-from .opt_min_curv import opt_min_curv
-from .opt_shortest_path import opt_shortest_path
-from .interp_track_widths import interp_track_widths
-from .check_normals_crossing import check_normals_crossing
-from .calc_tangent_vectors import calc_tangent_vectors
-from .calc_normal_vectors_ahead import (
-    calc_normal_vectors_ahead,
-)
-from .import_veh_dyn_info_2 import import_veh_dyn_info_2
-from .nonreg_sampling import nonreg_sampling
-from .interp_track import interp_track
-from .splunif import uniform_spline_from_points
-from .create_ppoly import create_ppoly
+"""
+The functions and classes of this package are imported lazily (PEP 562), i.e. a submodule (and its dependencies, e.g.
+SciPy subpackages, quadprog or matplotlib) is only loaded as soon as one of its attributes is accessed for the first
+time. Importing the package itself is therefore cheap.
+"""
+
+import importlib
+import sys
+import types
+
+# public attribute -> submodule it is defined in
+_LAZY_ATTRS = {
+    "interp_splines": "interp_splines",
+    "interp_splines_stream": "interp_splines",
+    "calc_spline_lengths": "calc_spline_lengths",
+    "calc_splines": "calc_splines",
+    "calc_normal_vectors": "calc_normal_vectors",
+    "normalize_psi": "normalize_psi",
+    "calc_head_curv_an": "calc_head_curv_an",
+    "calc_head_curv_num": "calc_head_curv_num",
+    "calc_head_curv_num_batch": "calc_head_curv_num",
+    "calc_t_profile": "calc_t_profile",
+    "import_csv_cached": "import_csv_cached",
+    "import_veh_dyn_info": "import_veh_dyn_info",
+    "calc_ax_profile": "calc_ax_profile",
+    "angle3pt": "angle3pt",
+    "progressbar": "progressbar",
+    "calc_vel_profile": "calc_vel_profile",
+    "calc_vel_profile_brake": "calc_vel_profile_brake",
+    "spline_approximation": "spline_approximation",
+    "spline_approximation_batch": "spline_approximation_batch",
+    "side_of_line": "side_of_line",
+    "conv_filt": "conv_filt",
+    "ConvFiltStream": "conv_filt",
+    "savgol_filt": "signal_filt",
+    "iir_filt": "signal_filt",
+    "path_matching_global": "path_matching_global",
+    "path_matching_local": "path_matching_local",
+    "get_rel_path_part": "get_rel_path_part",
+    "create_raceline": "create_raceline",
+    "iqp_handler": "iqp_handler",
+    "opt_min_curv": "opt_min_curv",
+    "opt_shortest_path": "opt_shortest_path",
+    "interp_track_widths": "interp_track_widths",
+    "check_normals_crossing": "check_normals_crossing",
+    "calc_tangent_vectors": "calc_tangent_vectors",
+    "calc_normal_vectors_ahead": "calc_normal_vectors_ahead",
+    "import_veh_dyn_info_2": "import_veh_dyn_info_2",
+    "nonreg_sampling": "nonreg_sampling",
+    "interp_track": "interp_track",
+    "uniform_spline_from_points": "splunif",
+    "uniform_spline_from_coeffs": "splunif",
+    "UniformSpline": "splunif",
+    "create_ppoly": "create_ppoly",
+    "SplineEvaluator": "spline_evaluator",
+    "write_trajectory": "trajectory_file",
+    "read_trajectory": "trajectory_file",
+    "FrenetFrame": "frenet_frame",
+}
+
+# submodules whose names differ from the attributes they define (e.g. splunif) can be accessed as attributes as well
+_SUBMODULES = set(_LAZY_ATTRS.values()) - set(_LAZY_ATTRS)
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        value = getattr(
+            importlib.import_module("." + _LAZY_ATTRS[name], __name__), name
+        )
+
+    elif name in _SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    # cache attribute, i.e. __getattr__() is not called again for it
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
+
+
+class _LazyModule(types.ModuleType):
+    """
+    Most functions are defined in a submodule of the same name. The import system binds a submodule to the attribute of
+    the package named like it as soon as it is imported (e.g. by another submodule), which would shadow the function.
+    Such submodules are therefore replaced by the function they define.
+    """
+
+    def __setattr__(self, name: str, value) -> None:
+        if (
+            isinstance(value, types.ModuleType)
+            and _LAZY_ATTRS.get(name) == name
+            and value.__name__ == __name__ + "." + name
+        ):
+            value = getattr(value, name)
+
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
@@ -0,0 +1,41 @@
+import os
+import tempfile
+from typing import Callable, BinaryIO
+
+
+def write_atomic(path: str, write_fct: Callable[[BinaryIO], object]) -> None:
+    """
+    .. description::
+    Write a file atomically: write_fct() writes the content into a temporary file in the same directory, which then
+    replaces the file at path. Readers therefore either see the complete old or the complete new file.
+
+    .. inputs::
+    :param path:        path of the file that is written.
+    :type path:         str
+    :param write_fct:   function that writes the content into the given (binary) file handle.
+    :type write_fct:    Callable[[BinaryIO], object]
+
+    .. notes::
+    The temporary file is removed and the error is raised again if writing fails (e.g. read-only directory).
+    """
+
+    path = os.path.abspath(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix="." + os.path.basename(path) + "."
+    )
+
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            write_fct(fh)
+
+        # mkstemp() creates files that are only readable by the owner
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+        raise
@@ -1,6 +1,5 @@
 import numpy as np
 import math
-from .normalize_psi import normalize_psi
 
 
 def calc_head_curv_an(
@@ -10,6 +9,9 @@ def calc_head_curv_an(
     t_spls: np.ndarray,
     calc_curv: bool = True,
     calc_dcurv: bool = False,
+    psi_out: np.ndarray = None,
+    kappa_out: np.ndarray = None,
+    dkappa_out: np.ndarray = None,
 ) -> tuple:
     """
     author:
@@ -33,6 +35,12 @@ def calc_head_curv_an(
     :type calc_curv:    bool
     :param calc_dcurv:  bool flag to show if first derivative of curvature should be calculated as well.
     :type calc_dcurv:   bool
+    :param psi_out:     optional preallocated output array for psi (same size as ind_spls).
+    :type psi_out:      np.ndarray
+    :param kappa_out:   optional preallocated output array for kappa (same size as ind_spls).
+    :type kappa_out:    np.ndarray
+    :param dkappa_out:  optional preallocated output array for dkappa (same size as ind_spls).
+    :type dkappa_out:   np.ndarray
 
     .. outputs::
     :return psi:        heading at every point.
@@ -56,26 +64,32 @@ def calc_head_curv_an(
     if not calc_curv and calc_dcurv:
         raise ValueError("dkappa cannot be calculated without kappa!")
 
+    # gather the coefficients of the required splines only once (transposed afterwards, i.e. every coefficient can be
+    # accessed as a row)
+    coeffs_x_spls = np.take(coeffs_x, ind_spls, axis=0).T
+    coeffs_y_spls = np.take(coeffs_y, ind_spls, axis=0).T
+
     # ------------------------------------------------------------------------------------------------------------------
     # CALCULATE HEADING ------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
 
-    # calculate required derivatives
-    x_d = (
-        coeffs_x[ind_spls, 1]
-        + 2 * coeffs_x[ind_spls, 2] * t_spls
-        + 3 * coeffs_x[ind_spls, 3] * np.power(t_spls, 2)
+    # calculate required derivatives (Horner's scheme)
+    x_d = coeffs_x_spls[1] + t_spls * (
+        2 * coeffs_x_spls[2] + 3 * coeffs_x_spls[3] * t_spls
     )
 
-    y_d = (
-        coeffs_y[ind_spls, 1]
-        + 2 * coeffs_y[ind_spls, 2] * t_spls
-        + 3 * coeffs_y[ind_spls, 3] * np.power(t_spls, 2)
+    y_d = coeffs_y_spls[1] + t_spls * (
+        2 * coeffs_y_spls[2] + 3 * coeffs_y_spls[3] * t_spls
     )
 
     # calculate heading psi (pi/2 must be substracted due to our convention that psi = 0 is north)
-    psi = np.arctan2(y_d, x_d)
-    psi = normalize_psi(psi)
+    psi = np.arctan2(y_d, x_d, out=psi_out)
+
+    # arctan2 returns values within [-pi, pi] -> only pi must be mapped to -pi (same as normalize_psi())
+    if np.ndim(psi) > 0:
+        psi[psi >= math.pi] -= 2 * math.pi
+    elif psi >= math.pi:
+        psi -= 2 * math.pi
 
     # ------------------------------------------------------------------------------------------------------------------
     # CALCULATE CURVATURE ----------------------------------------------------------------------------------------------
@@ -83,14 +97,16 @@ def calc_head_curv_an(
 
     if calc_curv:
         # calculate required derivatives
-        x_dd = 2 * coeffs_x[ind_spls, 2] + 6 * coeffs_x[ind_spls, 3] * t_spls
+        x_dd = 2 * coeffs_x_spls[2] + 6 * coeffs_x_spls[3] * t_spls
 
-        y_dd = 2 * coeffs_y[ind_spls, 2] + 6 * coeffs_y[ind_spls, 3] * t_spls
+        y_dd = 2 * coeffs_y_spls[2] + 6 * coeffs_y_spls[3] * t_spls
 
-        # calculate curvature kappa
-        kappa = (x_d * y_dd - y_d * x_dd) / np.power(
-            np.power(x_d, 2) + np.power(y_d, 2), 1.5
-        )
+        # calculate curvature kappa (common subexpressions are reused for dkappa)
+        v_sq = np.power(x_d, 2) + np.power(y_d, 2)
+        cross_d_dd = x_d * y_dd - y_d * x_dd
+
+        v_sq_sqrt = np.sqrt(v_sq)
+        kappa = np.divide(cross_d_dd, v_sq * v_sq_sqrt, out=kappa_out)
 
     else:
         kappa = 0.0
@@ -101,15 +117,17 @@ def calc_head_curv_an(
 
     if calc_dcurv:
         # calculate required derivatives
-        x_ddd = 6 * coeffs_x[ind_spls, 3]
+        x_ddd = 6 * coeffs_x_spls[3]
 
-        y_ddd = 6 * coeffs_y[ind_spls, 3]
+        y_ddd = 6 * coeffs_y_spls[3]
 
         # calculate first derivative of curvature dkappa
-        dkappa = (
-            (np.power(x_d, 2) + np.power(y_d, 2)) * (x_d * y_ddd - y_d * x_ddd)
-            - 3 * (x_d * y_dd - y_d * x_dd) * (x_d * x_dd + y_d * y_dd)
-        ) / np.power(np.power(x_d, 2) + np.power(y_d, 2), 3)
+        dkappa = np.divide(
+            v_sq * (x_d * y_ddd - y_d * x_ddd)
+            - 3 * cross_d_dd * (x_d * x_dd + y_d * y_dd),
+            v_sq * v_sq * v_sq,
+            out=dkappa_out,
+        )
 
         return psi, kappa, dkappa
 
@@ -124,10 +124,9 @@ def calc_head_curv_num(
             psi_temp = np.append(psi_temp, psi[:ind_step_preview_curv])
 
             # calculate delta psi
-            delta_psi = np.zeros(no_points)
-
-            for i in range(no_points):
-                delta_psi[i] = normalize_psi(psi_temp[i + steps_tot_curv] - psi_temp[i])
+            delta_psi = normalize_psi(
+                psi_temp[steps_tot_curv:] - psi_temp[:-steps_tot_curv]
+            )
 
             # calculate kappa
             s_points_cl = np.cumsum(el_lengths)
@@ -205,3 +204,173 @@ def calc_head_curv_num(
             kappa = 0.0
 
     return psi, kappa
+
+
+def calc_head_curv_num_batch(
+    paths: np.ndarray,
+    el_lengths: np.ndarray,
+    is_closed: bool,
+    stepsize_psi_preview: float = 1.0,
+    stepsize_psi_review: float = 1.0,
+    stepsize_curv_preview: float = 2.0,
+    stepsize_curv_review: float = 2.0,
+    calc_curv: bool = True,
+) -> tuple:
+    """
+    .. description::
+    Batched version of calc_head_curv_num(): numerical calculation of heading psi and curvature kappa for several paths
+    with the same number of points at once (e.g. all candidate paths of a sampling based planner). The results are the
+    same as calling calc_head_curv_num() for every path separately, i.e. also the preview/review steps are determined
+    for every path on the basis of its own average element length.
+
+    .. inputs::
+    :param paths:                   array of paths with size (no_paths x no_points x 2) (always unclosed).
+    :type paths:                    np.ndarray
+    :param el_lengths:              array containing the element lengths of every path with size (no_paths x no_points)
+                                    if is_closed is True and (no_paths x no_points - 1) otherwise.
+    :type el_lengths:               np.ndarray
+    :param is_closed:               close paths for heading and curvature calculation.
+    :type is_closed:                bool
+    :param stepsize_psi_preview:    preview/review distances used for numerical heading/curvature calculation.
+    :type stepsize_psi_preview:     float
+    :param stepsize_psi_review:     preview/review distances used for numerical heading/curvature calculation.
+    :type stepsize_psi_review:      float
+    :param stepsize_curv_preview:   preview/review distances used for numerical heading/curvature calculation.
+    :type stepsize_curv_preview:    float
+    :param stepsize_curv_review:    preview/review distances used for numerical heading/curvature calculation.
+    :type stepsize_curv_review:     float
+    :param calc_curv:               bool flag to show if curvature should be calculated (kappa is set 0.0 otherwise).
+    :type calc_curv:                bool
+
+    .. outputs::
+    :return psi:                    heading at every point of every path with size (no_paths x no_points).
+    :rtype psi:                     np.ndarray
+    :return kappa:                  curvature at every point of every path with size (no_paths x no_points).
+    :rtype kappa:                   np.ndarray
+    """
+
+    # check inputs
+    if paths.ndim != 3 or paths.shape[2] != 2:
+        raise RuntimeError("paths must have the size (no_paths x no_points x 2)!")
+
+    if el_lengths.ndim != 2 or el_lengths.shape[0] != paths.shape[0]:
+        raise RuntimeError("el_lengths must have the size (no_paths x no_elements)!")
+
+    if is_closed and paths.shape[1] != el_lengths.shape[1]:
+        raise RuntimeError("paths and el_lenghts must have the same length!")
+
+    elif not is_closed and paths.shape[1] != el_lengths.shape[1] + 1:
+        raise RuntimeError("paths must have the length of el_lengths + 1!")
+
+    # get number of points
+    no_points = paths.shape[1]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # CASE: CLOSED PATHS -----------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    if is_closed:
+
+        # calculate how many points we look to the front and rear of the current position for every path
+        el_lengths_avg = np.average(el_lengths, axis=1)[:, np.newaxis]
+
+        ind_step_preview_psi = np.maximum(
+            np.round(stepsize_psi_preview / el_lengths_avg), 1
+        ).astype(int)
+        ind_step_review_psi = np.maximum(
+            np.round(stepsize_psi_review / el_lengths_avg), 1
+        ).astype(int)
+        ind_step_preview_curv = np.maximum(
+            np.round(stepsize_curv_preview / el_lengths_avg), 1
+        ).astype(int)
+        ind_step_review_curv = np.maximum(
+            np.round(stepsize_curv_review / el_lengths_avg), 1
+        ).astype(int)
+
+        # indices of the points in front of and behind every point (closed paths)
+        ind_points = np.arange(no_points)
+
+        # calculate tangent vectors for every point
+        ind_preview = np.mod(ind_points + ind_step_preview_psi, no_points)[
+            :, :, np.newaxis
+        ]
+        ind_review = np.mod(ind_points - ind_step_review_psi, no_points)[
+            :, :, np.newaxis
+        ]
+        tangvecs = np.take_along_axis(paths, ind_preview, axis=1) - np.take_along_axis(
+            paths, ind_review, axis=1
+        )
+
+        # calculate psi of tangent vectors (pi/2 must be substracted due to our convention that psi = 0 is north)
+        psi = np.arctan2(tangvecs[:, :, 1], tangvecs[:, :, 0]) - math.pi / 2
+        psi = normalize_psi(psi)
+
+        if calc_curv:
+            # calculate delta psi
+            ind_preview = ind_points + ind_step_preview_curv
+            ind_review = ind_points - ind_step_review_curv
+
+            delta_psi = normalize_psi(
+                np.take_along_axis(psi, np.mod(ind_preview, no_points), axis=1)
+                - np.take_along_axis(psi, np.mod(ind_review, no_points), axis=1)
+            )
+
+            # calculate distances between preview and review points (unwrapped s coordinates of the closed paths)
+            s_points = np.cumsum(el_lengths, axis=1) - el_lengths
+            s_tot = np.sum(el_lengths, axis=1)[:, np.newaxis]
+
+            s_preview = (
+                np.take_along_axis(s_points, np.mod(ind_preview, no_points), axis=1)
+                + np.floor_divide(ind_preview, no_points) * s_tot
+            )
+            s_review = (
+                np.take_along_axis(s_points, np.mod(ind_review, no_points), axis=1)
+                + np.floor_divide(ind_review, no_points) * s_tot
+            )
+
+            kappa = delta_psi / (s_preview - s_review)
+
+        else:
+            kappa = 0.0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # CASE: UNCLOSED PATHS ---------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    else:
+
+        # calculate tangent vectors for every point
+        tangvecs = np.zeros(paths.shape)
+
+        tangvecs[:, 0] = paths[:, 1] - paths[:, 0]  # i == 0
+        tangvecs[:, 1:-1] = paths[:, 2:] - paths[:, :-2]  # 0 < i < no_points - 1
+        tangvecs[:, -1] = paths[:, -1] - paths[:, -2]  # i == -1
+
+        # calculate psi of tangent vectors (pi/2 must be substracted due to our convention that psi = 0 is north)
+        psi = np.arctan2(tangvecs[:, :, 1], tangvecs[:, :, 0]) - math.pi / 2
+        psi = normalize_psi(psi)
+
+        if calc_curv:
+            # calculate delta psi
+            delta_psi = np.zeros(psi.shape)
+
+            delta_psi[:, 0] = psi[:, 1] - psi[:, 0]  # i == 0
+            delta_psi[:, 1:-1] = psi[:, 2:] - psi[:, :-2]  # 0 < i < no_points - 1
+            delta_psi[:, -1] = psi[:, -1] - psi[:, -2]  # i == -1
+
+            # normalize delta_psi
+            delta_psi = normalize_psi(delta_psi)
+
+            # calculate kappa
+            kappa = np.zeros(psi.shape)
+
+            kappa[:, 0] = delta_psi[:, 0] / el_lengths[:, 0]  # i == 0
+            kappa[:, 1:-1] = delta_psi[:, 1:-1] / (
+                el_lengths[:, 1:] + el_lengths[:, :-1]
+            )  # 0 < i < no_points - 1
+            kappa[:, -1] = delta_psi[:, -1] / el_lengths[:, -1]  # i == -1
+
+        else:
+            kappa = 0.0
+
+    return psi, kappa
@@ -1,7 +1,9 @@
 import numpy as np
 import math
+import threading
 
-from time import perf_counter
+# work buffers of calc_spline_lengths_interp() that are reused across calls (one set per thread)
+_work_buffers = threading.local()
 
 
 def calc_spline_lengths(
@@ -9,6 +11,10 @@ def calc_spline_lengths(
     coeffs_y: np.ndarray,
     quickndirty: bool = False,
     no_interp_points: int = 15,
+    method: str = "interp",
+    gl_order: int = 6,
+    tol: float = None,
+    chunk_size: int = 4096,
 ) -> np.ndarray:
     """
     author:
@@ -27,6 +33,19 @@ def calc_spline_lengths(
     :type quickndirty:          bool
     :param no_interp_points:    length calculation is carried out with the given number of interpolation steps.
     :type no_interp_points:     int
+    :param method:              "interp" sums up the distances between no_interp_points interpolated points on every
+                                spline, "gauss_legendre" integrates the norm of the first derivative of the splines
+                                using Gauss-Legendre quadrature (more accurate with fewer evaluations).
+    :type method:               str
+    :param gl_order:            number of Gauss-Legendre nodes per spline (or per subinterval if tol is set).
+    :type gl_order:             int
+    :param tol:                 optional tolerance in m for the lengths calculated by Gauss-Legendre quadrature. If set,
+                                the splines are adaptively subdivided where the estimated quadrature error exceeds it.
+    :type tol:                  float
+    :param chunk_size:          number of splines that are processed at once if method is "interp". The work buffers
+                                have a fixed size depending on chunk_size and no_interp_points and are reused across
+                                calls, i.e. the peak memory does not depend on the number of splines.
+    :type chunk_size:           int
 
     .. outputs::
     :return spline_lengths:     length of every spline segment.
@@ -44,6 +63,9 @@ def calc_spline_lengths(
     if coeffs_x.shape[0] != coeffs_y.shape[0]:
         raise RuntimeError("Coefficient matrices must have the same length!")
 
+    if method not in ("interp", "gauss_legendre"):
+        raise ValueError("Unknown method: " + method)
+
     # catch case with only one spline
     if coeffs_x.size == 4 and coeffs_x.shape[0] == 4:
         coeffs_x = np.expand_dims(coeffs_x, 0)
@@ -64,53 +86,235 @@ def calc_spline_lengths(
                 + math.pow(np.sum(coeffs_y[i]) - coeffs_y[i, 0], 2)
             )
 
+    elif method == "gauss_legendre":
+        if tol is None:
+            spline_lengths = calc_spline_arc_lengths(
+                coeffs_x=coeffs_x,
+                coeffs_y=coeffs_y,
+                t_start=np.zeros(no_splines),
+                t_end=np.ones(no_splines),
+                gl_order=gl_order,
+            )
+
+        else:
+            spline_lengths = calc_spline_lengths_adaptive(
+                coeffs_x=coeffs_x, coeffs_y=coeffs_y, gl_order=gl_order, tol=tol
+            )
+
     else:
-        # loop through all the splines and calculate intermediate coordinates
-        t_steps = np.linspace(0.0, 1.0, no_interp_points)
-        spl_coords = np.zeros((no_interp_points, 2))
-        spl_coords2 = np.zeros((no_interp_points, no_splines, 2))
-
-        # t1 = perf_counter()
-        # for i in range(no_splines):
-        #     spl_coords[:, 0] = (
-        #         coeffs_x[i, 0]
-        #         + coeffs_x[i, 1] * t_steps
-        #         + coeffs_x[i, 2] * np.power(t_steps, 2)
-        #         + coeffs_x[i, 3] * np.power(t_steps, 3)
-        #     )
-        #     spl_coords[:, 1] = (
-        #         coeffs_y[i, 0]
-        #         + coeffs_y[i, 1] * t_steps
-        #         + coeffs_y[i, 2] * np.power(t_steps, 2)
-        #         + coeffs_y[i, 3] * np.power(t_steps, 3)
-        #     )
-        #
-        #     spline_lengths[i] = np.sum(
-        #         np.sqrt(np.sum(np.power(np.diff(spl_coords, axis=0), 2), axis=1))
-        #     )
-        # print("      for no_spline : {} ms".format((perf_counter() - t1) * 1000))
-        # t1 = perf_counter()
-        t_steps = t_steps.reshape(1, no_interp_points)
-
-        spl_coords2[:, :, 0] = coeffs_x[:, 0]
-        spl_coords2[:, :, 1] = coeffs_y[:, 0]
-
-        coeffs_x = coeffs_x[:, np.newaxis, :]
-        coeffs_y = coeffs_y[:, np.newaxis, :]
-
-        spl_coords2 = spl_coords2.transpose(1, 0, 2)
-
-        spl_coords2[:, :, 0] += coeffs_x[:, :, 1] @ t_steps
-        spl_coords2[:, :, 0] += coeffs_x[:, :, 2] @ np.power(t_steps, 2)
-        spl_coords2[:, :, 0] += coeffs_x[:, :, 3] @ np.power(t_steps, 3)
-
-        spl_coords2[:, :, 1] += coeffs_y[:, :, 1] @ t_steps
-        spl_coords2[:, :, 1] += coeffs_y[:, :, 2] @ np.power(t_steps, 2)
-        spl_coords2[:, :, 1] += coeffs_y[:, :, 3] @ np.power(t_steps, 3)
-
-        spline_lengths = np.sum(
-            np.sqrt(np.sum(np.power(np.diff(spl_coords2, axis=1), 2), axis=2)), axis=1
+        spline_lengths = calc_spline_lengths_interp(
+            coeffs_x=coeffs_x,
+            coeffs_y=coeffs_y,
+            no_interp_points=no_interp_points,
+            chunk_size=chunk_size,
+        )
+
+    return spline_lengths
+
+
+def calc_spline_lengths_interp(
+    coeffs_x: np.ndarray,
+    coeffs_y: np.ndarray,
+    no_interp_points: int = 15,
+    chunk_size: int = 4096,
+) -> np.ndarray:
+    """
+    .. description::
+    Calculate spline lengths by summing up the distances between no_interp_points equidistantly (in t) interpolated
+    points on every spline. The splines are processed in chunks using preallocated work buffers that are reused across
+    calls (one set of buffers per thread).
+
+    .. inputs::
+    :param coeffs_x:            coefficient matrix of the x splines with size (no_splines x 4).
+    :type coeffs_x:             np.ndarray
+    :param coeffs_y:            coefficient matrix of the y splines with size (no_splines x 4).
+    :type coeffs_y:             np.ndarray
+    :param no_interp_points:    number of interpolation points per spline.
+    :type no_interp_points:     int
+    :param chunk_size:          number of splines that are processed at once.
+    :type chunk_size:           int
+
+    .. outputs::
+    :return spline_lengths:     length of every spline segment.
+    :rtype spline_lengths:      np.ndarray
+    """
+
+    no_splines = coeffs_x.shape[0]
+    spline_lengths = np.zeros(no_splines)
+
+    # get work buffers (reallocated only if chunk size or number of interpolation points changed)
+    buffers = getattr(_work_buffers, "buffers", None)
+
+    if buffers is None or buffers[0] != (chunk_size, no_interp_points):
+        buffers = (
+            (chunk_size, no_interp_points),
+            np.empty((chunk_size, no_interp_points)),
+            np.empty((chunk_size, no_interp_points)),
+            np.empty((chunk_size, no_interp_points - 1)),
+            np.empty((chunk_size, no_interp_points - 1)),
+        )
+        _work_buffers.buffers = buffers
+
+    x_buf, y_buf, dx_buf, dy_buf = buffers[1:]
+    t_steps = np.linspace(0.0, 1.0, no_interp_points)
+
+    for i in range(0, no_splines, chunk_size):
+        cx = coeffs_x[i : i + chunk_size]
+        cy = coeffs_y[i : i + chunk_size]
+        n = cx.shape[0]
+
+        # calculate intermediate coordinates (Horner's scheme, in place)
+        for coeffs, coords in ((cx, x_buf[:n]), (cy, y_buf[:n])):
+            np.multiply(coeffs[:, 3:4], t_steps, out=coords)
+            coords += coeffs[:, 2:3]
+            coords *= t_steps
+            coords += coeffs[:, 1:2]
+            coords *= t_steps
+            coords += coeffs[:, 0:1]
+
+        # sum up distances between the intermediate points
+        np.subtract(x_buf[:n, 1:], x_buf[:n, :-1], out=dx_buf[:n])
+        np.subtract(y_buf[:n, 1:], y_buf[:n, :-1], out=dy_buf[:n])
+        np.hypot(dx_buf[:n], dy_buf[:n], out=dx_buf[:n])
+        np.sum(dx_buf[:n], axis=1, out=spline_lengths[i : i + n])
+
+    return spline_lengths
+
+
+def calc_spline_arc_lengths(
+    coeffs_x: np.ndarray,
+    coeffs_y: np.ndarray,
+    t_start: np.ndarray,
+    t_end: np.ndarray,
+    gl_order: int = 6,
+) -> np.ndarray:
+    """
+    .. description::
+    Calculate the arc lengths of third order splines between the spline parameters t_start and t_end using
+    Gauss-Legendre quadrature of the norm of the first derivative.
+
+    .. inputs::
+    :param coeffs_x:    coefficient matrix of the x splines with size (no_intervals x 4), i.e. one row per interval.
+    :type coeffs_x:     np.ndarray
+    :param coeffs_y:    coefficient matrix of the y splines with size (no_intervals x 4), i.e. one row per interval.
+    :type coeffs_y:     np.ndarray
+    :param t_start:     spline parameters at the start of every interval.
+    :type t_start:      np.ndarray
+    :param t_end:       spline parameters at the end of every interval.
+    :type t_end:        np.ndarray
+    :param gl_order:    number of Gauss-Legendre nodes per interval.
+    :type gl_order:     int
+
+    .. outputs::
+    :return arc_lengths:    arc length of every interval.
+    :rtype arc_lengths:     np.ndarray
+
+    .. notes::
+    len(coeffs_x) = len(coeffs_y) = len(t_start) = len(t_end) = len(arc_lengths)
+    """
+
+    gl_nodes, gl_weights = np.polynomial.legendre.leggauss(gl_order)
+
+    # map Gauss-Legendre nodes from [-1, 1] to the intervals
+    t_half = 0.5 * (t_end - t_start)
+    t_nodes = (t_start + t_half)[:, np.newaxis] + t_half[:, np.newaxis] * gl_nodes
+
+    # first derivatives at the nodes (Horner's scheme)
+    x_d = (3 * coeffs_x[:, 3:4] * t_nodes + 2 * coeffs_x[:, 2:3]) * t_nodes + coeffs_x[
+        :, 1:2
+    ]
+    y_d = (3 * coeffs_y[:, 3:4] * t_nodes + 2 * coeffs_y[:, 2:3]) * t_nodes + coeffs_y[
+        :, 1:2
+    ]
+
+    arc_lengths = t_half * np.matmul(np.hypot(x_d, y_d), gl_weights)
+
+    return arc_lengths
+
+
+def calc_spline_lengths_adaptive(
+    coeffs_x: np.ndarray,
+    coeffs_y: np.ndarray,
+    gl_order: int = 6,
+    tol: float = 1e-6,
+    max_depth: int = 10,
+) -> np.ndarray:
+    """
+    .. description::
+    Calculate spline lengths using Gauss-Legendre quadrature with adaptive subdivision. Every interval is compared with
+    the sum of its two halves. If the difference exceeds the tolerance share of the interval, both halves are further
+    subdivided (e.g. in sections with high curvature). All intervals of one subdivision level are handled at once.
+
+    .. inputs::
+    :param coeffs_x:    coefficient matrix of the x splines with size (no_splines x 4).
+    :type coeffs_x:     np.ndarray
+    :param coeffs_y:    coefficient matrix of the y splines with size (no_splines x 4).
+    :type coeffs_y:     np.ndarray
+    :param gl_order:    number of Gauss-Legendre nodes per interval.
+    :type gl_order:     int
+    :param tol:         tolerance for the length of every spline in m.
+    :type tol:          float
+    :param max_depth:   maximum number of subdivisions.
+    :type max_depth:    int
+
+    .. outputs::
+    :return spline_lengths:     length of every spline segment.
+    :rtype spline_lengths:      np.ndarray
+    """
+
+    no_splines = coeffs_x.shape[0]
+    spline_lengths = np.zeros(no_splines)
+
+    # initial intervals: complete splines
+    ind_spls = np.arange(no_splines)
+    t_start = np.zeros(no_splines)
+    t_end = np.ones(no_splines)
+    lengths_coarse = calc_spline_arc_lengths(
+        coeffs_x=coeffs_x,
+        coeffs_y=coeffs_y,
+        t_start=t_start,
+        t_end=t_end,
+        gl_order=gl_order,
+    )
+
+    for depth in range(max_depth + 1):
+        t_mid = 0.5 * (t_start + t_end)
+        lengths_left = calc_spline_arc_lengths(
+            coeffs_x=coeffs_x[ind_spls],
+            coeffs_y=coeffs_y[ind_spls],
+            t_start=t_start,
+            t_end=t_mid,
+            gl_order=gl_order,
+        )
+        lengths_right = calc_spline_arc_lengths(
+            coeffs_x=coeffs_x[ind_spls],
+            coeffs_y=coeffs_y[ind_spls],
+            t_start=t_mid,
+            t_end=t_end,
+            gl_order=gl_order,
+        )
+        lengths_fine = lengths_left + lengths_right
+
+        # accept intervals whose error estimate is within their share of the tolerance (all at the last level)
+        if depth < max_depth:
+            accepted = np.abs(lengths_fine - lengths_coarse) <= tol * (t_end - t_start)
+        else:
+            accepted = np.ones(ind_spls.size, dtype=bool)
+
+        spline_lengths += np.bincount(
+            ind_spls[accepted], weights=lengths_fine[accepted], minlength=no_splines
+        )
+
+        if np.all(accepted):
+            break
+
+        # subdivide remaining intervals, the halves become the coarse estimates of the next level
+        refine = np.invert(accepted)
+        ind_spls = np.concatenate((ind_spls[refine], ind_spls[refine]))
+        t_start, t_end = (
+            np.concatenate((t_start[refine], t_mid[refine])),
+            np.concatenate((t_mid[refine], t_end[refine])),
         )
-        # print("      numpy magic : {} ms".format((perf_counter() - t1) * 1000))
+        lengths_coarse = np.concatenate((lengths_left[refine], lengths_right[refine]))
 
     return spline_lengths
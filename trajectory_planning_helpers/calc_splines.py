@@ -12,6 +12,7 @@ def calc_splines(
     psi_s: float = None,
     psi_e: float = None,
     use_dist_scaling: bool = True,
+    return_M: bool = True,
 ) -> tuple:
     """
     author:
@@ -44,13 +45,17 @@ def calc_splines(
     :param use_dist_scaling:    bool flag to indicate if heading and curvature scaling should be performed. This should
                                 be done if the distances between the points in the path are not equal.
     :type use_dist_scaling:     bool
+    :param return_M:            bool flag to indicate if the (dense) LES coefficient matrix M should be returned. Setting
+                                up the dense matrix is expensive for large numbers of splines and can be skipped if M is
+                                not required.
+    :type return_M:             bool
 
     .. outputs::
     :return x_coeff:            spline coefficients of the x-component.
     :rtype x_coeff:             np.ndarray
     :return y_coeff:            spline coefficients of the y-component.
     :rtype y_coeff:             np.ndarray
-    :return M:                  LES coefficients.
+    :return M:                  LES coefficients (None if return_M is False).
     :rtype M:                   np.ndarray
     :return normvec_normalized: normalized normal vectors [x, y].
     :rtype normvec_normalized:  np.ndarray
@@ -106,44 +111,52 @@ def calc_splines(
 
     # M_{x,y} * a_{x,y} = b_{x,y}) with a_{x,y} being the desired spline param
     # *4 because of 4 parameters in cubic spline
-    M = np.zeros((no_splines * 4, no_splines * 4))
-    b_x = np.zeros(no_splines * 4)
-    b_y = np.zeros(no_splines * 4)
-
-    # create template for M array entries
+    # M is set up directly in sparse (COO) form, the entries of every row are given by the following template:
     # row 1: beginning of current spline should be placed on current point (t = 0)
     # row 2: end of current spline should be placed on next point (t = 1)
     # row 3: heading at end of current spline should be equal to heading at beginning of next spline (t = 1 and t = 0)
     # row 4: curvature at end of current spline should be equal to curvature at beginning of next spline (t = 1 and t = 0)
-    template_M = np.array(  # current point               | next point              | bounds
+    template_rows = np.array([0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3])
+    template_cols = np.array([0, 0, 1, 2, 3, 1, 2, 3, 5, 2, 3, 6])
+    template_vals = np.array(
         [
-            [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
-            # a_0i = {x,y}_i
-            [1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0],
-            # a_0i + -a_1i +  a_2i +  a_3i = {x,y}_i+1
-            [0.0, 1.0, 2.0, 3.0, 0.0, -1.0, 0.0, 0.0],
-            # a_1i + 2a_2i + 3a_3i - a_1i+1 = 0
-            [0.0, 0.0, 2.0, 6.0, 0.0, 0.0, -2.0, 0.0],
-            # 2a_2i + 6a_3i - 2a_2i+1 = 0
+            1.0,  # a_0i = {x,y}_i
+            1.0,  # a_0i + a_1i +  a_2i +  a_3i = {x,y}_i+1
+            1.0,
+            1.0,
+            1.0,
+            1.0,  # a_1i + 2a_2i + 3a_3i - a_1i+1 = 0
+            2.0,
+            3.0,
+            -1.0,
+            2.0,  # 2a_2i + 6a_3i - 2a_2i+1 = 0
+            6.0,
+            -2.0,
         ]
     )
 
-    for i in range(no_splines):
-        j = i * 4
+    # template entries for all but the last spline (heading and curvature of the next spline are scaled)
+    offsets = 4 * np.arange(no_splines - 1)[:, np.newaxis]
+    vals = np.tile(template_vals, (no_splines - 1, 1))
+    vals[:, 8] *= scaling[: no_splines - 1]
+    vals[:, 11] *= np.power(scaling[: no_splines - 1], 2)
 
-        if i < no_splines - 1:
-            M[j : j + 4, j : j + 8] = template_M
-            M[j + 2, j + 5] *= scaling[i]
-            M[j + 3, j + 6] *= math.pow(scaling[i], 2)
+    rows = [(offsets + template_rows).ravel()]
+    cols = [(offsets + template_cols).ravel()]
+    vals = [vals.ravel()]
 
-        else:
-            # no curvature and heading bounds on last element (handled afterwards)
-            M[j : j + 2, j : j + 4] = np.array(
-                [[1.0, 0.0, 0.0, 0.0], [1.0, 1.0, 1.0, 1.0]]
-            )
+    # no curvature and heading bounds on last element (handled afterwards)
+    j = 4 * (no_splines - 1)
+    rows.append(j + template_rows[:5])
+    cols.append(j + template_cols[:5])
+    vals.append(template_vals[:5])
 
-        b_x[j : j + 2] = np.array([path[i, 0], path[i + 1, 0]])
-        b_y[j : j + 2] = np.array([path[i, 1], path[i + 1, 1]])
+    b_x = np.zeros(no_splines * 4)
+    b_y = np.zeros(no_splines * 4)
+    b_x[0::4] = path[:-1, 0]
+    b_x[1::4] = path[1:, 0]
+    b_y[0::4] = path[:-1, 1]
+    b_y[1::4] = path[1:, 1]
 
     # ------------------------------------------------------------------------------------------------------------------
     # SET BOUNDARY CONDITIONS FOR LAST AND FIRST POINT -----------------------------------------------------------------
@@ -153,8 +166,10 @@ def calc_splines(
         # if the path is unclosed we want to fix heading at the start and end point of the path (curvature cannot be
         # determined in this case) -> set heading boundary conditions
 
-        # heading start point
-        M[-2, 1] = 1  # heading start point (evaluated at t = 0)
+        # heading start point (evaluated at t = 0) and heading end point (evaluated at t = 1)
+        rows.append(np.array([j + 2, j + 3, j + 3, j + 3]))
+        cols.append(np.array([1, j + 1, j + 2, j + 3]))
+        vals.append(np.array([1.0, 1.0, 2.0, 3.0]))
 
         if el_lengths is None:
             el_length_s = 1.0
@@ -164,9 +179,6 @@ def calc_splines(
         b_x[-2] = math.cos(psi_s) * el_length_s
         b_y[-2] = math.sin(psi_s) * el_length_s
 
-        # heading end point
-        M[-1, -4:] = [0, 1, 2, 3]  # heading end point (evaluated at t = 1)
-
         if el_lengths is None:
             el_length_e = 1.0
         else:
@@ -176,28 +188,37 @@ def calc_splines(
         b_y[-1] = math.sin(psi_e) * el_length_e
 
     else:
-        # heading boundary condition (for a closed spline)
-        M[-2, 1] = scaling[-1]
-        M[-2, -3:] = [-1, -2, -3]
-        # b_x[-2] = 0
-        # b_y[-2] = 0
-
-        # curvature boundary condition (for a closed spline)
-        M[-1, 2] = 2 * math.pow(scaling[-1], 2)
-        M[-1, -2:] = [-2, -6]
-        # b_x[-1] = 0
-        # b_y[-1] = 0
+        # heading and curvature boundary conditions (for a closed spline), b_{x,y} remain 0
+        rows.append(np.array([j + 2, j + 2, j + 2, j + 2, j + 3, j + 3, j + 3]))
+        cols.append(np.array([1, j + 1, j + 2, j + 3, 2, j + 2, j + 3]))
+        vals.append(
+            np.array(
+                [
+                    scaling[-1],
+                    -1.0,
+                    -2.0,
+                    -3.0,
+                    2 * math.pow(scaling[-1], 2),
+                    -2.0,
+                    -6.0,
+                ]
+            )
+        )
+
+    sparse_M = sp.sparse.csc_matrix(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(no_splines * 4, no_splines * 4),
+    )
 
     # ------------------------------------------------------------------------------------------------------------------
     # SOLVE ------------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
 
-    sparse_M = sp.sparse.csc_matrix(M)
-    x_les = np.squeeze(
-        sp.sparse.linalg.spsolve(sparse_M, b_x)
-    )  # squeeze removes single-dimensional entries
-
-    y_les = np.squeeze(sp.sparse.linalg.spsolve(sparse_M, b_y))
+    # factorize M once and solve for x and y at the same time (same coefficients as solving x and y separately, up to
+    # round-off)
+    les = sp.sparse.linalg.splu(sparse_M).solve(np.column_stack((b_x, b_y)))
+    x_les = les[:, 0]
+    y_les = les[:, 1]
 
     # get coefficients of every piece into one row -> reshape
     coeffs_x = np.reshape(x_les, (no_splines, 4))
@@ -213,4 +234,9 @@ def calc_splines(
         np.expand_dims(1.0 / np.linalg.norm(normvec, axis=1), axis=1)
     ) * normvec
 
-    return coeffs_x, coeffs_y, sparse_M.toarray(), normvec_normalized
+    if return_M:
+        M = sparse_M.toarray()
+    else:
+        M = None
+
+    return coeffs_x, coeffs_y, M, normvec_normalized
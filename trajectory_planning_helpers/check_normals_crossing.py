@@ -1,15 +1,21 @@
 import numpy as np
+from typing import Union
 
 
 def check_normals_crossing(
-    track: np.ndarray, normvec_normalized: np.ndarray, horizon: int = 10
-) -> bool:
+    track: np.ndarray,
+    normvec_normalized: np.ndarray,
+    horizon: Union[int, None] = 10,
+    return_pairs: bool = False,
+    chunk_size: int = 100000,
+) -> Union[bool, np.ndarray]:
     """
     author:
     Alexander Heilmeier
 
     .. description::
-    This function checks spline normals for crossings. Returns True if a crossing was found, otherwise False.
+    This function checks spline normals for crossings. Returns True if a crossing was found, otherwise False. Optionally,
+    all pairs of crossing normals can be returned instead.
 
     .. inputs::
     :param track:               array containing the track [x, y, w_tr_right, w_tr_left] to check
@@ -18,12 +24,21 @@ def check_normals_crossing(
                                 [x_component, y_component]
     :type normvec_normalized:   np.ndarray
     :param horizon:             determines the number of normals in forward and backward direction that are checked
-                                against each normal on the line
-    :type horizon:              int
+                                against each normal on the line. If set to None, all normals are checked against each
+                                other (global check using a grid, i.e. also crossings between distant parts of the
+                                track are found).
+    :type horizon:              Union[int, None]
+    :param return_pairs:        bool flag to return the index pairs of all crossing normals instead of a bool value
+    :type return_pairs:         bool
+    :param chunk_size:          maximum number of normal pairs that are checked at once (limits the memory usage)
+    :type chunk_size:           int
 
     .. outputs::
     :return found_crossing:     bool value indicating if a crossing was found or not
     :rtype found_crossing:      bool
+    :return idx_pairs:          index pairs [idx_1, idx_2] of all crossing normals (idx_1 < idx_2, only returned
+                                instead of found_crossing if return_pairs is True)
+    :rtype idx_pairs:           np.ndarray
 
     .. notes::
     The checks can take a while if full check is performed. Inputs are unclosed.
@@ -32,7 +47,10 @@ def check_normals_crossing(
     # check input
     no_points = track.shape[0]
 
-    if horizon >= no_points:
+    if horizon is None:
+        pass
+
+    elif horizon >= no_points:
         raise RuntimeError(
             "Horizon of %i points is too large for a track with %i points, reduce horizon!"
             % (horizon, no_points)
@@ -44,41 +62,223 @@ def check_normals_crossing(
             % (horizon, no_points)
         )
 
-    # initialization
-    les_mat = np.zeros((2, 2))
-    idx_list = list(range(0, no_points))
-    idx_list = idx_list[-horizon:] + idx_list + idx_list[:horizon]
+    # ------------------------------------------------------------------------------------------------------------------
+    # CHECK ALL RELEVANT PAIRS OF NORMALS (CHUNKWISE) ------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
 
-    # loop through all points of the track to check for crossings in their neighbourhoods
-    for idx in range(no_points):
+    if horizon is None:
+        idx_pairs_cand = calc_normals_pairs_grid(
+            track=track, normvec_normalized=normvec_normalized
+        )
+        chunks = (
+            (
+                idx_pairs_cand[i : i + chunk_size, 0],
+                idx_pairs_cand[i : i + chunk_size, 1],
+            )
+            for i in range(0, idx_pairs_cand.shape[0], chunk_size)
+        )
+
+    else:
+        chunks = calc_normals_pairs_horizon(
+            no_points=no_points, horizon=horizon, chunk_size=chunk_size
+        )
 
-        # determine indices of points in the neighbourhood of the current index
-        idx_neighbours = idx_list[idx : idx + 2 * horizon + 1]
-        del idx_neighbours[horizon]
-        idx_neighbours = np.array(idx_neighbours)
+    idx_pairs = []
 
-        # remove indices of normal vectors that are collinear to the current index
-        is_collinear_b = np.isclose(
-            np.cross(normvec_normalized[idx], normvec_normalized[idx_neighbours]), 0.0
+    for idx_a, idx_b in chunks:
+        crossing = check_normals_pairs(
+            track=track, normvec_normalized=normvec_normalized, idx_a=idx_a, idx_b=idx_b
         )
-        idx_neighbours_rel = idx_neighbours[np.nonzero(np.invert(is_collinear_b))[0]]
 
-        # check crossings solving an LES
-        for idx_comp in list(idx_neighbours_rel):
+        if np.any(crossing):
+            if not return_pairs:
+                return True  # found crossing
 
-            # LES: x_1 + lambda_1 * nx_1 = x_2 + lambda_2 * nx_2; y_1 + lambda_1 * ny_1 = y_2 + lambda_2 * ny_2;
-            const = track[idx_comp, :2] - track[idx, :2]
-            les_mat[:, 0] = normvec_normalized[idx]
-            les_mat[:, 1] = -normvec_normalized[idx_comp]
+            idx_pairs.append(np.column_stack((idx_a[crossing], idx_b[crossing])))
 
-            # solve LES
-            lambdas = np.linalg.solve(les_mat, const)
+    if not return_pairs:
+        return False
 
-            # we have a crossing within the relevant part if both lambdas lie between -w_tr_left and w_tr_right
-            if (
-                -track[idx, 3] <= lambdas[0] <= track[idx, 2]
-                and -track[idx_comp, 3] <= lambdas[1] <= track[idx_comp, 2]
-            ):
-                return True  # found crossing
+    if not idx_pairs:
+        return np.zeros((0, 2), dtype=int)
+
+    # sort indices within every pair and remove duplicates (possible for large horizons due to the closed track)
+    return np.unique(np.sort(np.vstack(idx_pairs), axis=1), axis=0)
+
+
+def calc_normals_pairs_horizon(no_points: int, horizon: int, chunk_size: int):
+    """
+    .. description::
+    Generator returning the index pairs of all normals within the given horizon in chunks.
+
+    .. inputs::
+    :param no_points:   number of points of the (closed) track
+    :type no_points:    int
+    :param horizon:     number of normals in forward and backward direction that are paired with each normal
+    :type horizon:      int
+    :param chunk_size:  maximum number of pairs per chunk
+    :type chunk_size:   int
+
+    .. outputs::
+    :return idx_a:      indices of the first normal of every pair in the current chunk
+    :rtype idx_a:       np.ndarray
+    :return idx_b:      indices of the second normal of every pair in the current chunk
+    :rtype idx_b:       np.ndarray
+    """
+
+    # every pair of normals only has to be checked once, i.e. it is sufficient to compare every normal with the normals
+    # in forward direction
+    steps_forw = np.arange(1, horizon + 1)
+    no_points_chunk = max(chunk_size // horizon, 1)
+
+    for idx_start in range(0, no_points, no_points_chunk):
+        idx = np.arange(idx_start, min(idx_start + no_points_chunk, no_points))
+
+        # determine indices of the normals in the neighbourhood of the current indices (closed track)
+        idx_a = np.repeat(idx, horizon)
+        idx_b = np.mod(idx[:, np.newaxis] + steps_forw, no_points).ravel()
+
+        yield idx_a, idx_b
+
+
+def calc_normals_pairs_grid(
+    track: np.ndarray, normvec_normalized: np.ndarray, cell_size: float = None
+) -> np.ndarray:
+    """
+    .. description::
+    Determine all pairs of normal segments [-w_tr_left, w_tr_right] that might intersect anywhere on the track. The
+    segments are inserted into a uniform grid and every pair of segments sharing at least one grid cell is returned as
+    a candidate. For tracks with reasonable widths the number of candidates and the runtime scale roughly with
+    O(N log N).
+
+    .. inputs::
+    :param track:               array containing the track [x, y, w_tr_right, w_tr_left]
+    :type track:                np.ndarray
+    :param normvec_normalized:  array containing normalized normal vectors for every track point
+                                [x_component, y_component]
+    :type normvec_normalized:   np.ndarray
+    :param cell_size:           edge length of the grid cells in m. Set to the average segment length if not provided.
+    :type cell_size:            float
+
+    .. outputs::
+    :return idx_pairs_cand:     index pairs [idx_1, idx_2] of all candidates (idx_1 < idx_2)
+    :rtype idx_pairs_cand:      np.ndarray
+    """
+
+    no_points = track.shape[0]
+
+    # get start and end points of the normal segments and their bounding boxes
+    seg_start = track[:, :2] - track[:, 3:4] * normvec_normalized
+    seg_end = track[:, :2] + track[:, 2:3] * normvec_normalized
+    bbox_min = np.minimum(seg_start, seg_end)
+    bbox_max = np.maximum(seg_start, seg_end)
+
+    if cell_size is None:
+        cell_size = max(float(np.mean(track[:, 2] + track[:, 3])), 1e-3)
+
+    # get range of grid cells covered by every bounding box
+    origin = np.amin(bbox_min, axis=0)
+    cell_min = np.floor((bbox_min - origin) / cell_size).astype(np.int64)
+    cell_max = np.floor((bbox_max - origin) / cell_size).astype(np.int64)
+    no_cells_y = int(np.amax(cell_max[:, 1])) + 1
+
+    cells_x = cell_max[:, 0] - cell_min[:, 0] + 1
+    cells_y = cell_max[:, 1] - cell_min[:, 1] + 1
+    no_cells_seg = cells_x * cells_y
+
+    # insert every segment into all covered grid cells
+    idx_seg = np.repeat(np.arange(no_points), no_cells_seg)
+    idx_cell_seg = np.arange(idx_seg.size) - np.repeat(
+        np.cumsum(no_cells_seg) - no_cells_seg, no_cells_seg
+    )
+    cell_ids = (cell_min[idx_seg, 0] + idx_cell_seg % cells_x[idx_seg]) * no_cells_y + (
+        cell_min[idx_seg, 1] + idx_cell_seg // cells_x[idx_seg]
+    )
+
+    # sort by grid cell -> segments within the same cell are neighbours in the sorted arrays
+    idx_sort = np.argsort(cell_ids, kind="stable")
+    cell_ids = cell_ids[idx_sort]
+    idx_seg = idx_seg[idx_sort]
+
+    # pair all segments within the same cell
+    pairs_a = []
+    pairs_b = []
+    offset = 1
+
+    while offset < cell_ids.size:
+        same_cell = cell_ids[offset:] == cell_ids[:-offset]
+
+        if not np.any(same_cell):
+            break
+
+        pairs_a.append(idx_seg[:-offset][same_cell])
+        pairs_b.append(idx_seg[offset:][same_cell])
+        offset += 1
+
+    if not pairs_a:
+        return np.zeros((0, 2), dtype=int)
+
+    idx_pairs_cand = np.sort(
+        np.column_stack((np.concatenate(pairs_a), np.concatenate(pairs_b))), axis=1
+    )
+
+    # remove pairs that were found in several cells
+    idx_pairs_cand = np.unique(idx_pairs_cand, axis=0)
+
+    return idx_pairs_cand
+
+
+def check_normals_pairs(
+    track: np.ndarray,
+    normvec_normalized: np.ndarray,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+) -> np.ndarray:
+    """
+    .. description::
+    Check the given pairs of normals for crossings within the track boundaries.
+
+    .. inputs::
+    :param track:               array containing the track [x, y, w_tr_right, w_tr_left] to check
+    :type track:                np.ndarray
+    :param normvec_normalized:  array containing normalized normal vectors for every track point
+                                [x_component, y_component]
+    :type normvec_normalized:   np.ndarray
+    :param idx_a:               indices of the first normal of every pair
+    :type idx_a:                np.ndarray
+    :param idx_b:               indices of the second normal of every pair
+    :type idx_b:                np.ndarray
+
+    .. outputs::
+    :return crossing:           bool array indicating for every pair if the normals cross within the track
+    :rtype crossing:            np.ndarray
+
+    .. notes::
+    len(idx_a) = len(idx_b) = len(crossing)
+    """
+
+    # LES: x_1 + lambda_1 * nx_1 = x_2 + lambda_2 * nx_2; y_1 + lambda_1 * ny_1 = y_2 + lambda_2 * ny_2;
+    # -> solved in closed form using Cramer's rule
+    n_a = normvec_normalized[idx_a]
+    n_b = normvec_normalized[idx_b]
+    const = track[idx_b, :2] - track[idx_a, :2]
+
+    cross_ab = n_a[:, 0] * n_b[:, 1] - n_a[:, 1] * n_b[:, 0]
+
+    # normal vectors that are collinear cannot cross (avoid division by zero)
+    is_collinear_b = np.isclose(cross_ab, 0.0)
+    cross_ab[is_collinear_b] = 1.0
+
+    lambdas_a = (const[:, 0] * n_b[:, 1] - const[:, 1] * n_b[:, 0]) / cross_ab
+    lambdas_b = (const[:, 0] * n_a[:, 1] - const[:, 1] * n_a[:, 0]) / cross_ab
+
+    # we have a crossing within the relevant part if both lambdas lie between -w_tr_left and w_tr_right
+    crossing = (
+        np.invert(is_collinear_b)
+        & (-track[idx_a, 3] <= lambdas_a)
+        & (lambdas_a <= track[idx_a, 2])
+        & (-track[idx_b, 3] <= lambdas_b)
+        & (lambdas_b <= track[idx_b, 2])
+    )
 
-    return False
+    return crossing
@@ -37,37 +37,135 @@ def conv_filt(signal: np.ndarray, filt_window: int, closed: bool) -> np.ndarray:
     # calculate half window width - 1
     w_window_half = int((filt_window - 1) / 2)
 
+    # the moving average is calculated on the basis of the cumulated sum of the signal, i.e. the runtime is independent
+    # of the window size: sum(signal[a:b]) = signal_cum[b] - signal_cum[a] (the mean is removed beforehand to reduce
+    # the cancellation errors of the cumulated sum)
+    no_points = signal.size
+    signal_mean = np.mean(signal) if no_points > 0 else 0.0
+    signal_cum = np.concatenate(([0.0], np.cumsum(signal - signal_mean)))
+
     # apply filter
     if closed:
-        # temporarily add points in front of and behind signal
-        signal_tmp = np.concatenate(
-            (signal[-w_window_half:], signal, signal[:w_window_half]), axis=0
+        signal_filt = np.empty(no_points)
+
+        # points whose window is completely inside the signal
+        if no_points > 2 * w_window_half:
+            signal_filt[w_window_half : no_points - w_window_half] = (
+                signal_cum[filt_window:] - signal_cum[:-filt_window]
+            )
+
+        # points whose window exceeds the signal -> the signal is continued periodically, i.e. the cumulated sum up to
+        # an arbitrary (also negative) index a is given by the number of complete periods and the cumulated sum within
+        # the current period (no temporary copies of the signal required)
+        inds = np.arange(no_points)
+        inds = inds[(inds < w_window_half) | (inds >= no_points - w_window_half)]
+
+        inds_hi = inds + w_window_half + 1
+        inds_lo = inds - w_window_half
+        signal_filt[inds] = (
+            np.floor_divide(inds_hi, no_points) * signal_cum[-1]
+            + signal_cum[np.mod(inds_hi, no_points)]
+            - np.floor_divide(inds_lo, no_points) * signal_cum[-1]
+            - signal_cum[np.mod(inds_lo, no_points)]
         )
 
-        # apply convolution filter used as a moving average filter and remove temporary points
-        signal_filt = np.convolve(
-            signal_tmp, np.ones(filt_window) / float(filt_window), mode="same"
-        )[w_window_half:-w_window_half]
+        signal_filt = signal_filt / float(filt_window) + signal_mean
 
     else:
-        # implementation 1: include boundaries during filtering
-        # no_points = signal.size
-        # signal_filt = np.zeros(no_points)
-        #
-        # for i in range(no_points):
-        #     if i < w_window_half:
-        #         signal_filt[i] = np.average(signal[:i + w_window_half + 1])
-        #
-        #     elif i < no_points - w_window_half:
-        #         signal_filt[i] = np.average(signal[i - w_window_half:i + w_window_half + 1])
-        #
-        #     else:
-        #         signal_filt[i] = np.average(signal[i - w_window_half:])
-
-        # implementation 2: start filtering at w_window_half and stop at -w_window_half
+        # start filtering at w_window_half and stop at -w_window_half (boundaries are kept unfiltered)
         signal_filt = np.copy(signal)
-        signal_filt[w_window_half:-w_window_half] = np.convolve(
-            signal, np.ones(filt_window) / float(filt_window), mode="same"
-        )[w_window_half:-w_window_half]
+
+        if w_window_half > 0 and no_points > 2 * w_window_half:
+            signal_filt[w_window_half:-w_window_half] = (
+                signal_cum[filt_window:] - signal_cum[:-filt_window]
+            ) / float(filt_window) + signal_mean
 
     return signal_filt
+
+
+class ConvFiltStream:
+    """
+    .. description::
+    Stateful (streaming) version of conv_filt() for unclosed signals, e.g. velocity or curvature profiles that are
+    produced block by block. Every call of filter() returns the filtered values of all samples whose filter window is
+    complete, i.e. the output is delayed by (filt_window - 1) / 2 samples. The remaining samples are returned by
+    flush() at the end of the signal. Concatenating all outputs gives the same result as conv_filt(signal,
+    filt_window, closed=False) for the complete signal, i.e. the boundaries are kept unfiltered.
+
+    .. inputs::
+    :param filt_window:     filter window size for moving average filter (must be odd).
+    :type filt_window:      int
+    """
+
+    def __init__(self, filt_window: int):
+        # check if window width is odd
+        if not filt_window % 2 == 1:
+            raise RuntimeError("Window width of moving average filter must be odd!")
+
+        self.filt_window = filt_window
+        self.w_window_half = int((filt_window - 1) / 2)
+        self.reset()
+
+    def reset(self) -> None:
+        # last input samples that are required for the next windows, number of input and output samples so far
+        self._history = np.zeros(0)
+        self._no_in = 0
+        self._no_out = 0
+
+    def filter(self, signal_block: np.ndarray) -> np.ndarray:
+        """
+        .. description::
+        Insert the next block of the signal and return the filtered samples that are available.
+
+        .. inputs::
+        :param signal_block:    next block of the signal.
+        :type signal_block:     np.ndarray
+
+        .. outputs::
+        :return signal_filt:    filtered samples (starting after the last sample returned previously).
+        :rtype signal_filt:     np.ndarray
+        """
+
+        w_window_half = self.w_window_half
+
+        # signal consisting of the history and the new block, index of its first sample within the complete signal
+        signal_tmp = np.concatenate((self._history, signal_block))
+        ind_start = self._no_in - self._history.size
+        self._no_in += signal_block.size
+
+        # samples that can be returned now (their window must be complete)
+        inds = np.arange(self._no_out, max(self._no_in - w_window_half, self._no_out))
+        signal_filt = signal_tmp[inds - ind_start]
+
+        # filter all samples apart from the first w_window_half samples of the signal (kept unfiltered)
+        inds_filt = inds[inds >= w_window_half] - ind_start
+
+        if inds_filt.size > 0 and w_window_half > 0:
+            signal_cum = np.concatenate(([0.0], np.cumsum(signal_tmp)))
+            signal_filt[signal_filt.size - inds_filt.size :] = (
+                signal_cum[inds_filt + w_window_half + 1]
+                - signal_cum[inds_filt - w_window_half]
+            ) / float(self.filt_window)
+
+        # keep the samples that are required for the next windows
+        self._no_out += inds.size
+        self._history = signal_tmp[max(self._no_out - w_window_half - ind_start, 0) :]
+
+        return signal_filt
+
+    def flush(self) -> np.ndarray:
+        """
+        .. description::
+        Return the remaining (unfiltered) samples at the end of the signal and reset the filter.
+
+        .. outputs::
+        :return signal_filt:    remaining samples.
+        :rtype signal_filt:     np.ndarray
+        """
+
+        signal_filt = self._history[
+            self._history.size - (self._no_in - self._no_out) :
+        ].copy()
+        self.reset()
+
+        return signal_filt
@@ -1,7 +1,7 @@
 import numpy as np
 from .calc_splines import calc_splines
 from .calc_spline_lengths import calc_spline_lengths
-from .interp_splines import interp_splines
+from .interp_splines import interp_splines, GL_ORDER_ARC
 from .calc_normal_vectors_ahead import calc_normal_vectors_ahead
 
 # from time import perf_counter
@@ -15,6 +15,9 @@ def create_raceline(
     closed: bool = True,
     psi_s: float = None,
     psi_e: float = None,
+    true_arc_length: bool = False,
+    calc_A: bool = True,
+    calc_normvectors: bool = True,
 ) -> tuple:
     """
     author:
@@ -37,17 +40,28 @@ def create_raceline(
 
     :param psi_s:           heading at the start of the raceline, must be specified if closed
     :param psi_e:
+    :param true_arc_length: if True, the raceline points are placed equidistantly along the true arc length of the
+                            splines (see interp_splines()), which allows larger interpolation stepsizes.
+    :type true_arc_length:  bool
+    :param calc_A:          bool flag to indicate if the (dense) linear equation system matrix A_raceline should be
+                            returned (None is returned otherwise). Setting it up is expensive for long racelines.
+    :type calc_A:           bool
+    :param calc_normvectors: bool flag to indicate if the normal vectors of the raceline should be returned (None is
+                            returned otherwise).
+    :type calc_normvectors: bool
 
     .. outputs::
     :return raceline_interp:                interpolated raceline [x, y] in m.
     :rtype raceline_interp:                 np.ndarray
-    :return A_raceline:                     linear equation system matrix of the splines on the raceline.
+    :return A_raceline:                     linear equation system matrix of the splines on the raceline (None if
+                                            calc_A is False).
     :rtype A_raceline:                      np.ndarray
     :return coeffs_x_raceline:              spline coefficients of the x-component.
     :rtype coeffs_x_raceline:               np.ndarray
     :return coeffs_y_raceline:              spline coefficients of the y-component.
     :rtype coeffs_y_raceline:               np.ndarray
     :return normvectors_raceline:           normalized normal vectors for every point of the raceline [x_component, y_component]
+                                            (None if calc_normvectors is False).
     :rtype normvectors_raceline:            np.ndarray
     :return spline_inds_raceline_interp:    contains the indices of the splines that hold the interpolated points.
     :rtype spline_inds_raceline_interp:     np.ndarray
@@ -77,9 +91,12 @@ def create_raceline(
         closed=closed,
         psi_s=psi_s,
         psi_e=psi_e,
+        return_M=calc_A,
     )
     # print("    calc_splines {} ms".format((perf_counter() - t1)*1000))
-    if not closed:
+    if not calc_normvectors:
+        normvectors_raceline = None
+    elif not closed:
         normvectors_raceline = np.vstack(
             (normvectors_raceline, calc_normal_vectors_ahead(psi_e))
         )
@@ -87,7 +104,10 @@ def create_raceline(
     # calculate new spline lengths
     # t1 = perf_counter()
     spline_lengths_raceline = calc_spline_lengths(
-        coeffs_x=coeffs_x_raceline, coeffs_y=coeffs_y_raceline
+        coeffs_x=coeffs_x_raceline,
+        coeffs_y=coeffs_y_raceline,
+        method="gauss_legendre" if true_arc_length else "interp",
+        gl_order=GL_ORDER_ARC,
     )
     # print("    calc_spline_lengths {} ms".format((perf_counter() - t1) * 1000))
     # interpolate splines for evenly spaced raceline points
@@ -103,6 +123,7 @@ def create_raceline(
         spline_lengths=spline_lengths_raceline,
         closed=closed,
         stepsize_approx=stepsize_interp,
+        true_arc_length=true_arc_length,
     )
     # print("    interp_splines {} ms".format((perf_counter() - t1) * 1000))
     # calculate element lengths
@@ -0,0 +1,349 @@
+import math
+from typing import Union
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .calc_head_curv_an import calc_head_curv_an
+from .calc_spline_lengths import calc_spline_lengths
+from .interp_splines import interp_splines
+from .normalize_psi import normalize_psi
+
+
+class FrenetFrame:
+    """
+    .. description::
+    Frenet frame along a path of third order splines. It allows to transform (a lot of) cartesian points into the
+    curvilinear coordinates (s, d) of the path and vice versa in a vectorized fashion. Everything that only depends on
+    the path (cumulated spline lengths, sample points, headings, normal vectors and a KD tree for the matching) is
+    calculated once during the construction of the frame.
+
+    Conventions:
+    - s is measured along the splines in the same way as in interp_splines(), i.e. it is linear in the spline
+      parameter t within every spline: s = s_spline_start + t * spline_length.
+    - d is the lateral displacement along the normal vectors of the path, which point to the right of the driving
+      direction (same normal vectors as returned by calc_splines(), positive d therefore corresponds to positive alpha
+      in create_raceline()).
+    - Headings are returned as by calc_head_curv_an().
+
+    .. inputs::
+    :param coeffs_x:        coefficient matrix of the x splines with size (no_splines x 4).
+    :type coeffs_x:         np.ndarray
+    :param coeffs_y:        coefficient matrix of the y splines with size (no_splines x 4).
+    :type coeffs_y:         np.ndarray
+    :param closed:          whether the path should be considered as closed or not.
+    :type closed:           bool
+    :param spline_lengths:  array containing the lengths of the inserted splines with size (no_splines, ). They are
+                            calculated if not provided.
+    :type spline_lengths:   np.ndarray
+    :param stepsize_match:  stepsize in m of the sample points that are used for the initial matching of cartesian
+                            points on the path.
+    :type stepsize_match:   float
+    """
+
+    def __init__(
+        self,
+        coeffs_x: np.ndarray,
+        coeffs_y: np.ndarray,
+        closed: bool = True,
+        spline_lengths: np.ndarray = None,
+        stepsize_match: float = 1.0,
+    ):
+        # check inputs
+        if coeffs_x.shape[0] != coeffs_y.shape[0]:
+            raise RuntimeError("Coefficient matrices must have the same length!")
+
+        if not (coeffs_x.ndim == 2 and coeffs_y.ndim == 2):
+            raise RuntimeError("Coefficient matrices do not have two dimensions!")
+
+        if spline_lengths is not None and coeffs_x.shape[0] != spline_lengths.size:
+            raise RuntimeError(
+                "coeffs_x/y and spline_lengths must have the same length!"
+            )
+
+        self.coeffs_x = np.ascontiguousarray(coeffs_x, dtype=float)
+        self.coeffs_y = np.ascontiguousarray(coeffs_y, dtype=float)
+        self.closed = closed
+        self.no_splines = coeffs_x.shape[0]
+
+        # cumulated lengths at the beginning of every spline (and at the end of the last one)
+        if spline_lengths is None:
+            spline_lengths = calc_spline_lengths(
+                coeffs_x=self.coeffs_x, coeffs_y=self.coeffs_y
+            )
+
+        self.spline_lengths = np.asarray(spline_lengths, dtype=float)
+        self.s_splines = np.concatenate(([0.0], np.cumsum(self.spline_lengths)))
+        self.s_tot = float(self.s_splines[-1])
+
+        # sample points used for the initial matching, including their headings and normal vectors
+        (
+            self.path_samples,
+            self.spline_inds_samples,
+            self.t_values_samples,
+            self.s_samples,
+        ) = interp_splines(
+            coeffs_x=self.coeffs_x,
+            coeffs_y=self.coeffs_y,
+            spline_lengths=self.spline_lengths,
+            closed=closed,
+            stepsize_approx=stepsize_match,
+        )
+
+        self.psi_samples, self.kappa_samples = calc_head_curv_an(
+            coeffs_x=self.coeffs_x,
+            coeffs_y=self.coeffs_y,
+            ind_spls=self.spline_inds_samples,
+            t_spls=self.t_values_samples,
+        )
+        self.normvec_samples = np.column_stack(
+            (np.sin(self.psi_samples), -np.cos(self.psi_samples))
+        )
+
+        self.stepsize_samples = self.s_samples[1] - self.s_samples[0]
+        self.kdtree = cKDTree(self.path_samples)
+
+    def cart2frenet(
+        self,
+        pos: np.ndarray,
+        psi: np.ndarray = None,
+        s_expected: Union[np.ndarray, float, None] = None,
+        s_range: float = 20.0,
+        no_iters: int = 3,
+    ) -> tuple:
+        """
+        .. description::
+        Transform cartesian points into the Frenet frame. Every point is first matched to the nearest sample point of
+        the path (globally using a KD tree or, similar to path_matching_global(), only within s_range around an
+        expected s position). Afterwards, the foot point on the splines is determined by Newton iterations.
+
+        .. inputs::
+        :param pos:         cartesian points [x, y] with size (no_points x 2).
+        :type pos:          np.ndarray
+        :param psi:         optional headings of the points (same convention as calc_head_curv_an()). If provided, the
+                            heading errors in relation to the path are returned as well.
+        :type psi:          np.ndarray
+        :param s_expected:  expected s positions of the points in m (one value for all points or one per point).
+        :type s_expected:   Union[np.ndarray, float, None]
+        :param s_range:     range around the expected s position to search for the match in m.
+        :type s_range:      float
+        :param no_iters:    number of Newton iterations for the determination of the foot points.
+        :type no_iters:     int
+
+        .. outputs::
+        :return s:          s coordinate of every point in m (in range [0.0, s_tot[ for closed paths).
+        :rtype s:           np.ndarray
+        :return d:          signed lateral displacement of every point in m (positive on the right side).
+        :rtype d:           np.ndarray
+        :return psi_ref:    heading of the path at the foot points.
+        :rtype psi_ref:     np.ndarray
+        :return kappa_ref:  curvature of the path at the foot points.
+        :rtype kappa_ref:   np.ndarray
+        :return dpsi:       heading error psi - psi_ref (normalized, only returned if psi is provided).
+        :rtype dpsi:        np.ndarray
+
+        .. notes::
+        len(pos) = len(s) = len(d) = len(psi_ref) = len(kappa_ref) = len(dpsi)
+        """
+
+        pos = np.atleast_2d(pos)
+
+        if pos.shape[1] != 2:
+            raise RuntimeError("Inserted points must have 2 columns [x, y]!")
+
+        if psi is not None and np.size(psi) != pos.shape[0]:
+            raise RuntimeError("pos and psi must have the same length!")
+
+        # --------------------------------------------------------------------------------------------------------------
+        # MATCH POINTS ON SAMPLES --------------------------------------------------------------------------------------
+        # --------------------------------------------------------------------------------------------------------------
+
+        no_samples = self.s_samples.size
+
+        if s_expected is None:
+            ind_samples = self.kdtree.query(pos)[1]
+
+        else:
+            # search only within a window of samples around the expected s position
+            s_expected = np.broadcast_to(
+                np.asarray(s_expected, dtype=float), (pos.shape[0],)
+            )
+            if self.closed:
+                s_expected = np.mod(s_expected, self.s_tot)
+
+            no_window = min(
+                math.ceil(2 * s_range / self.stepsize_samples) + 2, no_samples
+            )
+            s_window_start = s_expected - s_range
+            if self.closed:
+                s_window_start = np.mod(s_window_start, self.s_tot)
+
+            ind_start = (
+                np.searchsorted(self.s_samples, s_window_start, side="right") - 1
+            )
+
+            if self.closed:
+                ind_window = np.mod(
+                    ind_start[:, np.newaxis] + np.arange(no_window), no_samples
+                )
+            else:
+                ind_start = np.clip(ind_start, 0, no_samples - no_window)
+                ind_window = ind_start[:, np.newaxis] + np.arange(no_window)
+
+            dists_window = np.hypot(
+                self.path_samples[ind_window, 0] - pos[:, 0:1],
+                self.path_samples[ind_window, 1] - pos[:, 1:2],
+            )
+            ind_samples = ind_window[
+                np.arange(pos.shape[0]), np.argmin(dists_window, axis=1)
+            ]
+
+        # --------------------------------------------------------------------------------------------------------------
+        # DETERMINE FOOT POINTS ON THE SPLINES -------------------------------------------------------------------------
+        # --------------------------------------------------------------------------------------------------------------
+
+        # global spline parameter u = spline index + t
+        u = self.spline_inds_samples[ind_samples] + self.t_values_samples[ind_samples]
+
+        for _ in range(no_iters):
+            ind_spls, t_spls = self._split_u(u)
+            p, p_d, p_dd = self._eval(ind_spls, t_spls)
+
+            # Newton step for the minimization of the squared distance (Gauss-Newton if not locally convex)
+            diff = p - pos
+            grad = np.sum(diff * p_d, axis=1)
+            hess = np.sum(p_d * p_d, axis=1)
+            hess_full = hess + np.sum(diff * p_dd, axis=1)
+            hess = np.where(hess_full > 0.0, hess_full, hess)
+
+            # limit step to half a spline to avoid jumping into distant parts of the path
+            u -= np.clip(grad / hess, -0.5, 0.5)
+
+            if not self.closed:
+                u = np.clip(u, 0.0, float(self.no_splines))
+
+        ind_spls, t_spls = self._split_u(u)
+        p, p_d = self._eval(ind_spls, t_spls)[:2]
+
+        # --------------------------------------------------------------------------------------------------------------
+        # CALCULATE FRENET COORDINATES ---------------------------------------------------------------------------------
+        # --------------------------------------------------------------------------------------------------------------
+
+        s = self.s_splines[ind_spls] + t_spls * self.spline_lengths[ind_spls]
+
+        if self.closed:
+            s = np.mod(s, self.s_tot)
+
+        # normal vectors point to the right (same as in calc_splines)
+        normvec = (
+            np.column_stack((p_d[:, 1], -p_d[:, 0]))
+            / np.hypot(p_d[:, 0], p_d[:, 1])[:, np.newaxis]
+        )
+        d = np.sum((pos - p) * normvec, axis=1)
+
+        psi_ref, kappa_ref = calc_head_curv_an(
+            coeffs_x=self.coeffs_x,
+            coeffs_y=self.coeffs_y,
+            ind_spls=ind_spls,
+            t_spls=t_spls,
+        )
+
+        if psi is not None:
+            dpsi = normalize_psi(np.asarray(psi, dtype=float).reshape(-1) - psi_ref)
+            return s, d, psi_ref, kappa_ref, dpsi
+
+        else:
+            return s, d, psi_ref, kappa_ref
+
+    def frenet2cart(self, s: np.ndarray, d: np.ndarray) -> tuple:
+        """
+        .. description::
+        Transform points given in the Frenet frame back into cartesian coordinates.
+
+        .. inputs::
+        :param s:           s coordinates of the points in m.
+        :type s:            np.ndarray
+        :param d:           signed lateral displacements of the points in m (positive on the right side).
+        :type d:            np.ndarray
+
+        .. outputs::
+        :return pos:        cartesian points [x, y].
+        :rtype pos:         np.ndarray
+        :return psi_ref:    heading of the path at the given s coordinates.
+        :rtype psi_ref:     np.ndarray
+        :return kappa_ref:  curvature of the path at the given s coordinates.
+        :rtype kappa_ref:   np.ndarray
+
+        .. notes::
+        s values outside [0.0, s_tot] are wrapped for closed paths and clipped for unclosed paths.
+
+        len(s) = len(d) = len(pos) = len(psi_ref) = len(kappa_ref)
+        """
+
+        s = np.atleast_1d(np.asarray(s, dtype=float))
+        d = np.broadcast_to(np.asarray(d, dtype=float), s.shape)
+
+        if self.closed:
+            s = np.mod(s, self.s_tot)
+        else:
+            s = np.clip(s, 0.0, self.s_tot)
+
+        # get spline index and t value within the spline (linear in s, as in interp_splines)
+        ind_spls = np.searchsorted(self.s_splines, s, side="right") - 1
+        ind_spls = np.clip(ind_spls, 0, self.no_splines - 1)
+        t_spls = (s - self.s_splines[ind_spls]) / self.spline_lengths[ind_spls]
+
+        p, p_d = self._eval(ind_spls, t_spls)[:2]
+
+        normvec = (
+            np.column_stack((p_d[:, 1], -p_d[:, 0]))
+            / np.hypot(p_d[:, 0], p_d[:, 1])[:, np.newaxis]
+        )
+        pos = p + d[:, np.newaxis] * normvec
+
+        psi_ref, kappa_ref = calc_head_curv_an(
+            coeffs_x=self.coeffs_x,
+            coeffs_y=self.coeffs_y,
+            ind_spls=ind_spls,
+            t_spls=t_spls,
+        )
+
+        return pos, psi_ref, kappa_ref
+
+    def _split_u(self, u: np.ndarray) -> tuple:
+        # split global spline parameter into spline index and t value
+        if self.closed:
+            u = np.mod(u, self.no_splines)
+
+        ind_spls = np.minimum(np.floor(u).astype(int), self.no_splines - 1)
+        t_spls = u - ind_spls
+
+        return ind_spls, t_spls
+
+    def _eval(self, ind_spls: np.ndarray, t_spls: np.ndarray) -> tuple:
+        # evaluate position and first two derivatives of the splines (Horner's scheme)
+        cx = self.coeffs_x[ind_spls]
+        cy = self.coeffs_y[ind_spls]
+
+        p = np.column_stack(
+            (
+                ((cx[:, 3] * t_spls + cx[:, 2]) * t_spls + cx[:, 1]) * t_spls
+                + cx[:, 0],
+                ((cy[:, 3] * t_spls + cy[:, 2]) * t_spls + cy[:, 1]) * t_spls
+                + cy[:, 0],
+            )
+        )
+        p_d = np.column_stack(
+            (
+                (3 * cx[:, 3] * t_spls + 2 * cx[:, 2]) * t_spls + cx[:, 1],
+                (3 * cy[:, 3] * t_spls + 2 * cy[:, 2]) * t_spls + cy[:, 1],
+            )
+        )
+        p_dd = np.column_stack(
+            (
+                6 * cx[:, 3] * t_spls + 2 * cx[:, 2],
+                6 * cy[:, 3] * t_spls + 2 * cy[:, 2],
+            )
+        )
+
+        return p, p_d, p_dd
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+from typing import Callable
+
+import numpy as np
+
+from ._write_atomic import write_atomic
+
+# version of the cache format, increase if the content of the cache files changes
+CACHE_VERSION = 1
+
+
+def import_csv_cached(
+    csv_path: str,
+    validate: Callable[[np.ndarray], np.ndarray] = None,
+    cache_tag: str = "",
+    cache_dir: str = None,
+    use_cache: bool = True,
+    mmap: bool = True,
+) -> np.ndarray:
+    """
+    .. description::
+    Import a csv file (comments marked by #, comma separated) and store the parsed and validated array in a binary
+    .npy sidecar file. Further imports of the same file load the sidecar instead of parsing the csv file again. The
+    sidecar is memory-mapped by default, i.e. loading is almost free and processes importing the same file share the
+    according memory pages.
+
+    The sidecar is accompanied by a small .json file holding the key of the cached data: path, modification time, size
+    and SHA-256 hash of the csv file. The sidecar is reused if modification time and size match. Otherwise, the hash
+    is compared (e.g. a file that was only touched or copied is not parsed again) and the csv file is parsed again if
+    it changed.
+
+    .. inputs::
+    :param csv_path:    path to the csv file.
+    :type csv_path:     str
+    :param validate:    optional function that is applied to the parsed array before it is cached. It should raise
+                        an error if the data is invalid and return the (possibly modified, e.g. reshaped) array that is
+                        cached. It is not called again if the cached array is loaded.
+    :type validate:     Callable[[np.ndarray], np.ndarray]
+    :param cache_tag:   optional tag that is part of the sidecar file name. Different tags must be used if the same
+                        csv file is imported with different validation functions.
+    :type cache_tag:    str
+    :param cache_dir:   directory the sidecar files are stored in (directory of the csv file if not provided).
+    :type cache_dir:    str
+    :param use_cache:   flag to switch off the cache, i.e. the csv file is parsed and validated on every import.
+    :type use_cache:    bool
+    :param mmap:        flag to memory-map the cached array (read-only) instead of loading it into memory.
+    :type mmap:         bool
+
+    .. outputs::
+    :return data:       parsed and validated data.
+    :rtype data:        np.ndarray
+
+    .. notes::
+    The sidecar files are written atomically (temporary file in the same directory that replaces the old one), i.e.
+    several processes can import the same file at the same time. If the cache directory is not writable, the parsed
+    array is returned without caching.
+
+    If mmap is set, the returned array is always read-only (also on the import that writes the cache or if the cache
+    could not be written), copy it before modifying it in place.
+    """
+
+    if not use_cache:
+        return _parse_csv(csv_path=csv_path, validate=validate)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # CHECK EXISTING CACHE ---------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    csv_path = os.path.abspath(csv_path)
+    csv_stat = os.stat(csv_path)
+
+    if cache_dir is None:
+        cache_dir = os.path.dirname(csv_path)
+
+    cache_name = os.path.basename(csv_path)
+    if cache_tag:
+        cache_name += "." + cache_tag
+
+    npy_path = os.path.join(cache_dir, cache_name + ".npy")
+    meta_path = os.path.join(cache_dir, cache_name + ".json")
+
+    meta = {
+        "version": CACHE_VERSION,
+        "path": csv_path,
+        "mtime_ns": csv_stat.st_mtime_ns,
+        "size": csv_stat.st_size,
+    }
+
+    try:
+        with open(meta_path, "r") as fh:
+            meta_cache = json.load(fh)
+    except (OSError, ValueError):
+        meta_cache = None
+
+    csv_hash = None
+
+    if meta_cache is not None and all(
+        meta_cache.get(key) == meta[key] for key in ("version", "path", "size")
+    ):
+        # compare hash only if the modification time changed (hashing requires reading the whole file)
+        if meta_cache.get("mtime_ns") == meta["mtime_ns"]:
+            data = _load_npy(npy_path=npy_path, meta_cache=meta_cache, mmap=mmap)
+        else:
+            csv_hash = _hash_file(csv_path)
+            if meta_cache.get("sha256") == csv_hash:
+                data = _load_npy(npy_path=npy_path, meta_cache=meta_cache, mmap=mmap)
+
+                # update key such that the file is not hashed on every import
+                if data is not None:
+                    meta_cache["mtime_ns"] = meta["mtime_ns"]
+                    _write_atomic(
+                        path=meta_path,
+                        write_fct=lambda fh: fh.write(json.dumps(meta_cache).encode()),
+                    )
+            else:
+                data = None
+
+        if data is not None:
+            return data
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # PARSE CSV FILE AND UPDATE CACHE ----------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    if csv_hash is None:
+        csv_hash = _hash_file(csv_path)
+
+    data = _parse_csv(csv_path=csv_path, validate=validate)
+    data = np.ascontiguousarray(data)
+
+    meta["sha256"] = csv_hash
+    meta["shape"] = list(data.shape)
+    meta["dtype"] = data.dtype.str
+
+    # write array first, the key is only written if the array was stored successfully
+    cache_written = _write_atomic(
+        path=npy_path, write_fct=lambda fh: np.save(fh, data, allow_pickle=False)
+    ) and _write_atomic(
+        path=meta_path, write_fct=lambda fh: fh.write(json.dumps(meta).encode())
+    )
+
+    # return the same kind of array as on later imports, i.e. the memory-mapped sidecar (or a read-only array if the
+    # cache could not be written)
+    if mmap:
+        if cache_written:
+            data_cached = _load_npy(npy_path=npy_path, meta_cache=meta, mmap=True)
+
+            if data_cached is not None:
+                return data_cached
+
+        data.flags.writeable = False
+
+    return data
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# AUXILIARY FUNCTIONS --------------------------------------------------------------------------------------------------
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+def _parse_csv(
+    csv_path: str, validate: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    with open(csv_path, "rb") as fh:
+        data = np.loadtxt(fh, comments="#", delimiter=",")
+
+    if validate is not None:
+        data = validate(data)
+
+    return data
+
+
+def _hash_file(path: str) -> str:
+    sha256 = hashlib.sha256()
+
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+def _load_npy(npy_path: str, meta_cache: dict, mmap: bool):
+    try:
+        data = np.load(npy_path, mmap_mode="r" if mmap else None, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+
+    # the array could belong to another key if the cache was written concurrently
+    if list(data.shape) != meta_cache.get("shape") or data.dtype.str != meta_cache.get(
+        "dtype"
+    ):
+        return None
+
+    return data
+
+
+def _write_atomic(path: str, write_fct: Callable) -> bool:
+    try:
+        write_atomic(path=path, write_fct=write_fct)
+
+    except OSError:
+        # e.g. read-only directory -> continue without cache
+        return False
+
+    return True
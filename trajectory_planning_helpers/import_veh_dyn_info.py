@@ -1,8 +1,12 @@
 import numpy as np
 
+from .import_csv_cached import import_csv_cached
+
 
 def import_veh_dyn_info(
-    ggv_import_path: str = None, ax_max_machines_import_path: str = None
+    ggv_import_path: str = None,
+    ax_max_machines_import_path: str = None,
+    use_cache: bool = False,
 ) -> tuple:
     """
     author:
@@ -19,6 +23,10 @@ def import_veh_dyn_info(
     :type ggv_import_path:              str
     :param ax_max_machines_import_path: Path to the ax_max_machines csv file.
     :type ax_max_machines_import_path:  str
+    :param use_cache:                   flag to store the imported and checked arrays in binary sidecar files next to
+                                        the csv files and to load them from there on later imports (see
+                                        import_csv_cached()). The returned arrays are read-only in this case.
+    :type use_cache:                    bool
 
     .. outputs::
     :return ggv:                        ggv diagram
@@ -29,64 +37,76 @@ def import_veh_dyn_info(
 
     # GGV --------------------------------------------------------------------------------------------------------------
     if ggv_import_path is not None:
-
-        # load csv
-        with open(ggv_import_path, "rb") as fh:
-            ggv = np.loadtxt(fh, comments="#", delimiter=",")
-
-        # expand dimension in case of a single row
-        if ggv.ndim == 1:
-            ggv = np.expand_dims(ggv, 0)
-
-        # check columns
-        if ggv.shape[1] != 3:
-            raise RuntimeError(
-                "ggv diagram must consist of the three columns [vx, ax_max, ay_max]!"
-            )
-
-        # check values
-        invalid_1 = ggv[:, 0] < 0.0  # assure velocities > 0.0
-        invalid_2 = ggv[:, 1:] > 50.0  # assure valid maximum accelerations
-        invalid_3 = ggv[:, 1] < 0.0  # assure positive accelerations
-        invalid_4 = ggv[:, 2] < 0.0  # assure positive accelerations
-
-        if (
-            np.any(invalid_1)
-            or np.any(invalid_2)
-            or np.any(invalid_3)
-            or np.any(invalid_4)
-        ):
-            raise RuntimeError("ggv seems unreasonable!")
+        ggv = import_csv_cached(
+            csv_path=ggv_import_path,
+            validate=_check_ggv,
+            cache_tag="ggv",
+            use_cache=use_cache,
+        )
 
     else:
         ggv = None
 
     # AX_MAX_MACHINES --------------------------------------------------------------------------------------------------
     if ax_max_machines_import_path is not None:
+        ax_max_machines = import_csv_cached(
+            csv_path=ax_max_machines_import_path,
+            validate=_check_ax_max_machines,
+            cache_tag="ax_max_machines",
+            use_cache=use_cache,
+        )
 
-        # load csv
-        with open(ax_max_machines_import_path, "rb") as fh:
-            ax_max_machines = np.loadtxt(fh, comments="#", delimiter=",")
+    else:
+        ax_max_machines = None
 
-        # expand dimension in case of a single row
-        if ax_max_machines.ndim == 1:
-            ax_max_machines = np.expand_dims(ax_max_machines, 0)
+    return ggv, ax_max_machines
 
-        # check columns
-        if ax_max_machines.shape[1] != 2:
-            raise RuntimeError(
-                "ax_max_machines must consist of the two columns [vx, ax_max_machines]!"
-            )
 
-        # check values
-        invalid_1 = ax_max_machines[:, 0] < 0.0  # assure velocities > 0.0
-        invalid_2 = ax_max_machines[:, 1] > 20.0  # assure valid maximum accelerations
-        invalid_3 = ax_max_machines[:, 1] < 0.0  # assure positive accelerations
+# ----------------------------------------------------------------------------------------------------------------------
+# CHECKS OF THE IMPORTED DATA ------------------------------------------------------------------------------------------
+# ----------------------------------------------------------------------------------------------------------------------
 
-        if np.any(invalid_1) or np.any(invalid_2) or np.any(invalid_3):
-            raise RuntimeError("ax_max_machines seems unreasonable!")
 
-    else:
-        ax_max_machines = None
+def _check_ggv(ggv: np.ndarray) -> np.ndarray:
+    # expand dimension in case of a single row
+    if ggv.ndim == 1:
+        ggv = np.expand_dims(ggv, 0)
 
-    return ggv, ax_max_machines
+    # check columns
+    if ggv.shape[1] != 3:
+        raise RuntimeError(
+            "ggv diagram must consist of the three columns [vx, ax_max, ay_max]!"
+        )
+
+    # check values
+    invalid_1 = ggv[:, 0] < 0.0  # assure velocities > 0.0
+    invalid_2 = ggv[:, 1:] > 50.0  # assure valid maximum accelerations
+    invalid_3 = ggv[:, 1] < 0.0  # assure positive accelerations
+    invalid_4 = ggv[:, 2] < 0.0  # assure positive accelerations
+
+    if np.any(invalid_1) or np.any(invalid_2) or np.any(invalid_3) or np.any(invalid_4):
+        raise RuntimeError("ggv seems unreasonable!")
+
+    return ggv
+
+
+def _check_ax_max_machines(ax_max_machines: np.ndarray) -> np.ndarray:
+    # expand dimension in case of a single row
+    if ax_max_machines.ndim == 1:
+        ax_max_machines = np.expand_dims(ax_max_machines, 0)
+
+    # check columns
+    if ax_max_machines.shape[1] != 2:
+        raise RuntimeError(
+            "ax_max_machines must consist of the two columns [vx, ax_max_machines]!"
+        )
+
+    # check values
+    invalid_1 = ax_max_machines[:, 0] < 0.0  # assure velocities > 0.0
+    invalid_2 = ax_max_machines[:, 1] > 20.0  # assure valid maximum accelerations
+    invalid_3 = ax_max_machines[:, 1] < 0.0  # assure positive accelerations
+
+    if np.any(invalid_1) or np.any(invalid_2) or np.any(invalid_3):
+        raise RuntimeError("ax_max_machines seems unreasonable!")
+
+    return ax_max_machines
@@ -1,7 +1,11 @@
 import numpy as np
 
+from .import_csv_cached import import_csv_cached
 
-def import_veh_dyn_info_2(filepath2localgg: str = "") -> np.ndarray:
+
+def import_veh_dyn_info_2(
+    filepath2localgg: str = "", use_cache: bool = False
+) -> np.ndarray:
     """
     author:
     Leonhard Hermansdorfer
@@ -17,6 +21,10 @@ def import_veh_dyn_info_2(filepath2localgg: str = "") -> np.ndarray:
     .. inputs::
     :param filepath2localgg:    absolute path to 'localgg' file which contains vehicle acceleration limits
     :type filepath2localgg:     str
+    :param use_cache:           flag to store the imported and checked data in a binary sidecar file next to the
+                                'localgg' file and to load it from there on later imports (see import_csv_cached()).
+                                The returned array is read-only in this case.
+    :type use_cache:            bool
 
     .. outputs::
     :return tpamap:             tire performance assessment (tpa) map containing the reference line and long./lat.
@@ -30,10 +38,18 @@ def import_veh_dyn_info_2(filepath2localgg: str = "") -> np.ndarray:
             "Missing path to file which contains vehicle acceleration limits!"
         )
 
-    # load localgg file
-    with open(filepath2localgg, "rb") as fh:
-        data_localggfile = np.loadtxt(fh, comments="#", delimiter=",")
+    # load localgg file and check imported data for validity
+    tpamap = import_csv_cached(
+        csv_path=filepath2localgg,
+        validate=_check_localgg,
+        cache_tag="localgg",
+        use_cache=use_cache,
+    )
+
+    return tpamap
+
 
+def _check_localgg(data_localggfile: np.ndarray) -> np.ndarray:
     # Check Imported Data for Validity -----------------------------------------------------------------------------
 
     # check whether local ggv file contains only one row;
@@ -2,7 +2,10 @@ import math
 
 import numpy as np
 
-from .calc_spline_lengths import calc_spline_lengths
+from .calc_spline_lengths import calc_spline_lengths, calc_spline_arc_lengths
+
+# number of Gauss-Legendre nodes used for the spline lengths and the arc length inversion if true_arc_length is set
+GL_ORDER_ARC = 6
 
 
 def interp_splines(
@@ -12,6 +15,8 @@ def interp_splines(
     closed: bool = True,
     stepsize_approx: float = None,
     stepnum_fixed: list = None,
+    true_arc_length: bool = False,
+    no_iters_arc: int = 4,
 ) -> tuple:
     """
     author:
@@ -27,7 +32,11 @@ def interp_splines(
     :type coeffs_x:         np.ndarray
     :param coeffs_y:        coefficient matrix of the y splines with size (no_splines x 4).
     :type coeffs_y:         np.ndarray
-    :param spline_lengths:  array containing the lengths of the inserted splines with size (no_splines, ).
+    :param spline_lengths:  array containing the lengths of the inserted splines with size (no_splines, ). If
+                            true_arc_length is set, these must be the arc lengths of the splines, i.e. calculated by
+                            calc_spline_lengths(method="gauss_legendre", gl_order=GL_ORDER_ARC). Other lengths (e.g.
+                            quickndirty or "interp" lengths) are used as arc length targets of the inversion as well,
+                            such that the points are not placed at the requested distances.
     :type spline_lengths:   np.ndarray
     :param closed:          whether the path should be considered as closed or not
     :type closed:           bool
@@ -35,6 +44,13 @@ def interp_splines(
     :type stepsize_approx:  float
     :param stepnum_fixed:   return a fixed number of coordinates per spline, list of length no_splines. \\ of these two!
     :type stepnum_fixed:    list
+    :param true_arc_length: if True, the spline parameters t are determined by inverting the arc length function of
+                            every spline (Newton iterations) such that the points are equidistant along the path.
+                            Otherwise, t is a linear function of the distance within every spline. Only used together
+                            with stepsize_approx.
+    :type true_arc_length:  bool
+    :param no_iters_arc:    number of Newton iterations used for the inversion of the arc length functions.
+    :type no_iters_arc:     int
 
     .. outputs::
     :return path_interp:    interpolated path points.
@@ -87,9 +103,18 @@ def interp_splines(
     if stepsize_approx is not None:
         # get the total distance up to the end of every spline (i.e. cumulated distances)
         if spline_lengths is None:
-            spline_lengths = calc_spline_lengths(
-                coeffs_x=coeffs_x, coeffs_y=coeffs_y, quickndirty=False
-            )
+            if true_arc_length:
+                # lengths must be consistent with the arc lengths used for the inversion below
+                spline_lengths = calc_spline_lengths(
+                    coeffs_x=coeffs_x,
+                    coeffs_y=coeffs_y,
+                    method="gauss_legendre",
+                    gl_order=GL_ORDER_ARC,
+                )
+            else:
+                spline_lengths = calc_spline_lengths(
+                    coeffs_x=coeffs_x, coeffs_y=coeffs_y, quickndirty=False
+                )
 
         dists_cum = np.cumsum(spline_lengths)
 
@@ -123,29 +148,40 @@ def interp_splines(
 
         # create steps with stepsize_approx
 
-        # find the spline that hosts the current interpolation point
-        j = np.argmax(dists_interp[:, np.newaxis] < dists_cum, axis=1)
-        spline_inds = np.copy(j)
+        # find the spline that hosts the current interpolation point (first spline whose cumulated distance is larger
+        # than the distance of the interpolation point), the last point is not hosted by any spline and set to 0 here
+        j = np.searchsorted(dists_cum, dists_interp, side="right")
+        j[j == dists_cum.size] = 0
+        spline_inds = j
 
         # get spline t value depending on the progress within the current element
-        t_values[j > 0] = (
-            dists_interp[j > 0] - dists_cum[j - 1][j > 0]
-        ) / spline_lengths[j][j > 0]
-        t_values[j == 0] = dists_interp[j == 0] / spline_lengths[0]
+        dists_prev = np.zeros(no_interp_points)
+        dists_prev[j > 0] = dists_cum[j[j > 0] - 1]
+        t_values = (dists_interp - dists_prev) / spline_lengths[j]
         t_values[-1] = 0.0
 
-        # calculate coords
-        path_interp[:, 0] = coeffs_x[j][:, 0]
-
-        path_interp[:, 0] += coeffs_x[j][:, 1] * t_values
-        path_interp[:, 0] += coeffs_x[j][:, 2] * np.power(t_values, 2)
-        path_interp[:, 0] += coeffs_x[j][:, 3] * np.power(t_values, 3)
+        if true_arc_length:
+            t_values = _invert_arc_lengths(
+                coeffs_x_j=coeffs_x[j],
+                coeffs_y_j=coeffs_y[j],
+                spline_lengths_j=spline_lengths[j],
+                t_values=t_values,
+                no_iters=no_iters_arc,
+                gl_order=GL_ORDER_ARC,
+            )
 
-        path_interp[:, 1] = coeffs_y[j][:, 0]
+        # calculate coords using Horner's scheme on the gathered coefficients
+        coeffs_x_j = coeffs_x[j]
+        coeffs_y_j = coeffs_y[j]
 
-        path_interp[:, 1] += coeffs_y[j][:, 1] * t_values
-        path_interp[:, 1] += coeffs_y[j][:, 2] * np.power(t_values, 2)
-        path_interp[:, 1] += coeffs_y[j][:, 3] * np.power(t_values, 3)
+        path_interp[:, 0] = coeffs_x_j[:, 0] + t_values * (
+            coeffs_x_j[:, 1]
+            + t_values * (coeffs_x_j[:, 2] + t_values * coeffs_x_j[:, 3])
+        )
+        path_interp[:, 1] = coeffs_y_j[:, 0] + t_values * (
+            coeffs_y_j[:, 1]
+            + t_values * (coeffs_y_j[:, 2] + t_values * coeffs_y_j[:, 3])
+        )
 
         path_interp[-1][0] = 0.0
         path_interp[-1][1] = 0.0
@@ -214,3 +250,182 @@ def interp_splines(
 
     # NOTE: dists_interp is None, when using a fixed step size
     return path_interp, spline_inds, t_values, dists_interp
+
+
+def _invert_arc_lengths(
+    coeffs_x_j: np.ndarray,
+    coeffs_y_j: np.ndarray,
+    spline_lengths_j: np.ndarray,
+    t_values: np.ndarray,
+    no_iters: int,
+    gl_order: int,
+) -> np.ndarray:
+    # t_values contains the desired progress within every spline as a fraction of the spline length -> determine the
+    # spline parameters at which the arc length reaches this fraction using Newton iterations on s(t) - s_target = 0
+    # (coefficients and lengths are given per point, the lengths are the ones the points were distributed with)
+    t_zeros = np.zeros(t_values.size)
+    s_target = t_values * spline_lengths_j
+
+    t = np.copy(t_values)
+
+    for i in range(no_iters):
+        s_t = calc_spline_arc_lengths(
+            coeffs_x=coeffs_x_j,
+            coeffs_y=coeffs_y_j,
+            t_start=t_zeros,
+            t_end=t,
+            gl_order=gl_order,
+        )
+        x_d = (3 * coeffs_x_j[:, 3] * t + 2 * coeffs_x_j[:, 2]) * t + coeffs_x_j[:, 1]
+        y_d = (3 * coeffs_y_j[:, 3] * t + 2 * coeffs_y_j[:, 2]) * t + coeffs_y_j[:, 1]
+
+        t = np.clip(t - (s_t - s_target) / np.hypot(x_d, y_d), 0.0, 1.0)
+
+    return t
+
+
+def interp_splines_stream(
+    coeffs_x: np.ndarray,
+    coeffs_y: np.ndarray,
+    stepsize_approx: float,
+    spline_lengths: np.ndarray = None,
+    closed: bool = True,
+    block_size: int = 10000,
+    chunk_size: int = 100000,
+    true_arc_length: bool = False,
+    no_iters_arc: int = 4,
+):
+    """
+    .. description::
+    Generator version of interp_splines() (approx. equal step size only) for very long paths. The interpolated points
+    are yielded in blocks of block_size points, such that downstream calculations (e.g. heading and curvature) can be
+    chained without holding the whole interpolated path in memory. The coefficient matrices are only accessed block
+    by block, i.e. they can also be memory-mapped arrays (np.load(..., mmap_mode="r")). Concatenating all blocks gives
+    the same result as interp_splines().
+
+    .. inputs::
+    :param coeffs_x:        coefficient matrix of the x splines with size (no_splines x 4).
+    :type coeffs_x:         np.ndarray
+    :param coeffs_y:        coefficient matrix of the y splines with size (no_splines x 4).
+    :type coeffs_y:         np.ndarray
+    :param stepsize_approx: desired stepsize of the points after interpolation.
+    :type stepsize_approx:  float
+    :param spline_lengths:  array containing the lengths of the inserted splines with size (no_splines, ). Must be
+                            arc lengths if true_arc_length is set (see interp_splines()).
+    :type spline_lengths:   np.ndarray
+    :param closed:          whether the path should be considered as closed or not
+    :type closed:           bool
+    :param block_size:      (maximum) number of points per yielded block.
+    :type block_size:       int
+    :param chunk_size:      number of splines per chunk if the spline lengths must be calculated.
+    :type chunk_size:       int
+    :param true_arc_length: see interp_splines().
+    :type true_arc_length:  bool
+    :param no_iters_arc:    see interp_splines().
+    :type no_iters_arc:     int
+
+    .. outputs (per block)::
+    :return path_interp:    interpolated path points.
+    :rtype path_interp:     np.ndarray
+    :return spline_inds:    contains the indices of the splines that hold the interpolated points.
+    :rtype spline_inds:     np.ndarray
+    :return t_values:       containts the relative spline coordinate values (t) of every point on the splines.
+    :rtype t_values:        np.ndarray
+    :return dists_interp:   total distance up to every interpolation point.
+    :rtype dists_interp:    np.ndarray
+
+    .. notes::
+    Only the spline lengths (size no_splines) are kept in memory for the whole path.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # INPUT CHECKS -----------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    if coeffs_x.shape[0] != coeffs_y.shape[0]:
+        raise RuntimeError("Coefficient matrices must have the same length!")
+
+    if spline_lengths is not None and coeffs_x.shape[0] != spline_lengths.size:
+        raise RuntimeError("coeffs_x/y and spline_lengths must have the same length!")
+
+    if not (coeffs_x.ndim == 2 and coeffs_y.ndim == 2):
+        raise RuntimeError("Coefficient matrices do not have two dimensions!")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # CALCULATE SPLINE LENGTHS CHUNK BY CHUNK --------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    no_splines = coeffs_x.shape[0]
+
+    if spline_lengths is None:
+        spline_lengths = np.zeros(no_splines)
+
+        for i in range(0, no_splines, chunk_size):
+            spline_lengths[i : i + chunk_size] = calc_spline_lengths(
+                coeffs_x=np.asarray(coeffs_x[i : i + chunk_size]),
+                coeffs_y=np.asarray(coeffs_y[i : i + chunk_size]),
+                method="gauss_legendre" if true_arc_length else "interp",
+                gl_order=GL_ORDER_ARC,
+            )
+
+    dists_cum = np.cumsum(spline_lengths)
+
+    # same distances as np.linspace(0.0, dists_cum[-1], no_interp_points) in interp_splines()
+    no_interp_points = math.ceil(dists_cum[-1] / stepsize_approx) + 1
+    step = dists_cum[-1] / (no_interp_points - 1)
+
+    # last point (t = 1.0) is only included for unclosed paths
+    no_points_out = no_interp_points - 1 if closed else no_interp_points
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # INTERPOLATE BLOCK BY BLOCK ---------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    for k in range(0, no_points_out, block_size):
+        dists_interp = np.arange(k, min(k + block_size, no_points_out)) * step
+
+        # host splines (the last point is treated separately, see below)
+        j = np.searchsorted(dists_cum, dists_interp, side="right")
+        j[j == no_splines] = no_splines - 1
+
+        dists_prev = np.zeros(dists_interp.size)
+        dists_prev[j > 0] = dists_cum[j[j > 0] - 1]
+        t_values = (dists_interp - dists_prev) / spline_lengths[j]
+
+        # gather coefficients of the current block (only these are read from memory-mapped arrays)
+        j_min = j[0]
+        coeffs_x_j = np.asarray(coeffs_x[j_min : j[-1] + 1])[j - j_min]
+        coeffs_y_j = np.asarray(coeffs_y[j_min : j[-1] + 1])[j - j_min]
+
+        if k + block_size >= no_points_out and not closed:
+            dists_interp[-1] = dists_cum[-1]
+            t_values[-1] = 1.0
+
+        if true_arc_length:
+            t_values = _invert_arc_lengths(
+                coeffs_x_j=coeffs_x_j,
+                coeffs_y_j=coeffs_y_j,
+                spline_lengths_j=spline_lengths[j],
+                t_values=t_values,
+                no_iters=no_iters_arc,
+                gl_order=GL_ORDER_ARC,
+            )
+
+        path_interp = np.column_stack(
+            (
+                coeffs_x_j[:, 0]
+                + t_values
+                * (
+                    coeffs_x_j[:, 1]
+                    + t_values * (coeffs_x_j[:, 2] + t_values * coeffs_x_j[:, 3])
+                ),
+                coeffs_y_j[:, 0]
+                + t_values
+                * (
+                    coeffs_y_j[:, 1]
+                    + t_values * (coeffs_y_j[:, 2] + t_values * coeffs_y_j[:, 3])
+                ),
+            )
+        )
+
+        yield path_interp, j, t_values, dists_interp
@@ -2,26 +2,39 @@ import numpy as np
 import math
 
 
-def interp_track(track: np.ndarray, stepsize: float) -> np.ndarray:
+def interp_track(
+    track: np.ndarray, stepsize: float, closed: bool = True, out: np.ndarray = None
+) -> np.ndarray:
     """
     author:
     Alexander Heilmeier
 
     .. description::
-    Interpolate track points linearly to a new stepsize.
+    Interpolate track points linearly to a new stepsize. All columns of the track (e.g. widths, banking, friction
+    coefficients, speed limits) are interpolated at once on the basis of the distances along the x-y-coordinates.
 
     .. inputs::
-    :param track:           track in the format [x, y, w_tr_right, w_tr_left, (banking)]. Has to be unclosed
+    :param track:           track in the format [x, y, w_tr_right, w_tr_left, (banking), (further columns)]. Has to be
+                            unclosed.
     :type track:            np.ndarray
     :param stepsize:        desired stepsize after interpolation in m.
     :type stepsize:         float
+    :param closed:          whether the track should be considered as closed or not. If closed, the element between the
+                            last and the first point is interpolated as well.
+    :type closed:           bool
+    :param out:             optional output buffer with at least as many rows as interpolated points and the same
+                            number of columns as track. If provided, the interpolated track is written into (the first
+                            rows of) this buffer.
+    :type out:              np.ndarray
 
     .. outputs::
-    :return track_interp:   interpolated track [x, y, w_tr_right, w_tr_left, (banking)].
+    :return track_interp:   interpolated track [x, y, w_tr_right, w_tr_left, (banking), (further columns)]. If out is
+                            provided, this is a view on the according rows of out.
     :rtype track_interp:    np.ndarray
 
     .. notes::
-    Track input and output are unclosed! track input must however be closable in the current form!
+    Track input and output are unclosed! track input must however be closable in the current form if closed is True!
+    For unclosed tracks, the last point of the track is included in the output.
     The banking angle is optional and must not be provided!
     """
 
@@ -29,31 +42,59 @@ def interp_track(track: np.ndarray, stepsize: float) -> np.ndarray:
     # LINEAR INTERPOLATION OF TRACK ------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
 
-    # create closed track
-    track_cl = np.vstack((track, track[0]))
+    # calculate element lengths (euclidian distance), including the element from the last to the first point if closed
+    el_lengths = np.sqrt(np.sum(np.power(np.diff(track[:, :2], axis=0), 2), axis=1))
 
-    # calculate element lengths (euclidian distance)
-    el_lengths_cl = np.sqrt(
-        np.sum(np.power(np.diff(track_cl[:, :2], axis=0), 2), axis=1)
-    )
+    if closed:
+        el_lengths = np.append(el_lengths, math.dist(track[-1, :2], track[0, :2]))
 
     # sum up total distance (from start) to every element
-    dists_cum_cl = np.cumsum(el_lengths_cl)
-    dists_cum_cl = np.insert(dists_cum_cl, 0, 0.0)
+    dists_cum = np.cumsum(el_lengths)
+    dists_cum = np.insert(dists_cum, 0, 0.0)
 
     # calculate desired lenghts depending on specified stepsize (+1 because last element is included)
-    no_points_interp_cl = math.ceil(dists_cum_cl[-1] / stepsize) + 1
-    dists_interp_cl = np.linspace(0.0, dists_cum_cl[-1], no_points_interp_cl)
+    no_points_interp = math.ceil(dists_cum[-1] / stepsize) + 1
+    dists_interp = np.linspace(0.0, dists_cum[-1], no_points_interp)
+
+    # last point equals the first point for closed tracks -> remove it
+    if closed:
+        dists_interp = dists_interp[:-1]
+        no_points_interp -= 1
+
+    # find the element that holds every interpolation point: the interpolation distances are sorted, i.e. it is
+    # sufficient to search the (fewer) element boundaries within them and to repeat the element indices accordingly
+    # (same as np.searchsorted(dists_cum, dists_interp, side="right") - 1, points at the end belong to the last element)
+    no_points_el = np.diff(np.searchsorted(dists_interp, dists_cum))
+    no_points_el[-1] += no_points_interp - np.sum(no_points_el)
+    inds = np.repeat(np.arange(el_lengths.size), no_points_el)
 
-    # interpolate closed track points
-    track_interp_cl = np.zeros((no_points_interp_cl, track_cl.shape[1]))
+    # gradients of all columns along every element (zero-length elements, i.e. duplicate points, do not hold any
+    # interpolation points)
+    if closed:
+        track_diffs = np.vstack((np.diff(track, axis=0), track[0] - track[-1]))
+    else:
+        track_diffs = np.diff(track, axis=0)
+
+    grads = np.divide(
+        track_diffs,
+        el_lengths[:, np.newaxis],
+        out=np.zeros(track_diffs.shape),
+        where=el_lengths[:, np.newaxis] != 0.0,
+    )
 
-    track_interp_cl[:, 0] = np.interp(dists_interp_cl, dists_cum_cl, track_cl[:, 0])
-    track_interp_cl[:, 1] = np.interp(dists_interp_cl, dists_cum_cl, track_cl[:, 1])
-    track_interp_cl[:, 2] = np.interp(dists_interp_cl, dists_cum_cl, track_cl[:, 2])
-    track_interp_cl[:, 3] = np.interp(dists_interp_cl, dists_cum_cl, track_cl[:, 3])
+    # linear interpolation of all columns at once
+    if out is None:
+        track_interp = np.empty((no_points_interp, track.shape[1]))
+    elif out.shape[0] < no_points_interp or out.shape[1] != track.shape[1]:
+        raise RuntimeError(
+            "Output buffer must have at least %i rows and %i columns!"
+            % (no_points_interp, track.shape[1])
+        )
+    else:
+        track_interp = out[:no_points_interp]
 
-    if track_cl.shape[1] == 5:
-        track_interp_cl[:, 4] = np.interp(dists_interp_cl, dists_cum_cl, track_cl[:, 4])
+    np.take(grads, inds, axis=0, out=track_interp)
+    track_interp *= (dists_interp - dists_cum[inds])[:, np.newaxis]
+    track_interp += np.take(track, inds, axis=0)
 
-    return track_interp_cl[:-1]
+    return track_interp
@@ -6,6 +6,7 @@ def interp_track_widths(
     spline_inds: np.ndarray,
     t_values: np.ndarray,
     incl_last_point: bool = False,
+    nearest_cols: list = None,
 ) -> np.ndarray:
     """
     author:
@@ -13,13 +14,16 @@ def interp_track_widths(
 
     .. description::
     The function (linearly) interpolates the track widths in the same steps as the splines were interpolated before.
+    Any further per-point track attributes (e.g. banking, friction coefficients, speed limits, sector IDs) can be
+    interpolated in the same way by inserting them as additional columns.
 
     Keep attention that the (multiple) interpolation of track widths can lead to unwanted effects, e.g. that peaks
     in the track widths can disappear if the stepsize is too large (kind of an aliasing effect).
 
     .. inputs::
     :param w_track:         array containing the track widths in meters [w_track_right, w_track_left] to interpolate,
-                            optionally with banking angle in rad: [w_track_right, w_track_left, banking]
+                            optionally with banking angle in rad: [w_track_right, w_track_left, banking] and any further
+                            attribute columns. A one-dimensional array is treated as a single column.
     :type w_track:          np.ndarray
     :param spline_inds:     indices that show which spline (and here w_track element) shall be interpolated.
     :type spline_inds:      np.ndarray
@@ -27,9 +31,12 @@ def interp_track_widths(
     :type t_values:         np.ndarray
     :param incl_last_point: bool flag to show if last point should be included or not.
     :type incl_last_point:  bool
+    :param nearest_cols:    indices of the columns that should not be interpolated linearly but take the value of the
+                            nearest point (e.g. for IDs or other discrete attributes).
+    :type nearest_cols:     list
 
     .. outputs::
-    :return w_track_interp: array with interpolated track widths (and optionally banking angle).
+    :return w_track_interp: array with interpolated track widths (and optionally banking angle and further attributes).
     :rtype w_track_interp:  np.ndarray
 
     .. notes::
@@ -40,30 +47,46 @@ def interp_track_widths(
     # CALCULATE INTERMEDIATE STEPS -------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
 
-    w_track_cl = np.vstack((w_track, w_track[0]))
+    no_points = w_track.shape[0]
     no_interp_points = t_values.size  # unclosed
 
+    # indices of the points at the beginning and the end of the hosting splines (last spline ends on the first point)
+    inds_next = spline_inds + 1
+    inds_next[inds_next == no_points] = 0
+
     if incl_last_point:
-        w_track_interp = np.zeros((no_interp_points + 1, w_track.shape[1]))
-        w_track_interp[-1] = w_track_cl[-1]
+        w_track_interp = np.zeros((no_interp_points + 1,) + w_track.shape[1:])
+        w_track_interp[-1] = w_track[0]
+    else:
+        w_track_interp = np.zeros((no_interp_points,) + w_track.shape[1:])
+
+    # calculate track widths (linear approximation assumed along one spline) -> gather start and end values of the
+    # hosting splines once for all columns
+    w_track_start = w_track[spline_inds]
+    w_track_end = w_track[inds_next]
+
+    if w_track.ndim == 1:
+        t_values_cols = t_values
     else:
-        w_track_interp = np.zeros((no_interp_points, w_track.shape[1]))
-
-    # find the spline that hosts each interpolation point
-    w_track_cl_m = np.array(
-        [w_track_cl[spline_inds], w_track_cl[spline_inds + 1]]
-    ).transpose(1, 0, 2)
-
-    def multiInterp(x, fp):
-        i = np.arange(x.size)
-        j = 0
-        d = x
-        return (1 - d) * fp[i, j] + fp[i, j + 1] * d
-
-    # calculate track widths (linear approximation assumed along one spline)
-    w_track_interp[:, 0] = multiInterp(t_values, w_track_cl_m[:, 0])
-    w_track_interp[:, 1] = multiInterp(t_values, w_track_cl_m[:, 1])
-    if w_track.shape[1] == 3:
-        w_track_interp[:, 2] = multiInterp(t_values, w_track_cl_m[:, 2])
+        t_values_cols = t_values[:, np.newaxis]
+
+    np.subtract(w_track_end, w_track_start, out=w_track_interp[:no_interp_points])
+    w_track_interp[:no_interp_points] *= t_values_cols
+    w_track_interp[:no_interp_points] += w_track_start
+
+    # nearest neighbour for the specified columns
+    if nearest_cols is not None:
+        use_end = t_values >= 0.5
+
+        if w_track.ndim == 1:
+            w_track_interp[:no_interp_points] = np.where(
+                use_end, w_track_end, w_track_start
+            )
+        else:
+            w_track_interp[:no_interp_points, nearest_cols] = np.where(
+                use_end[:, np.newaxis],
+                w_track_end[:, nearest_cols],
+                w_track_start[:, nearest_cols],
+            )
 
     return w_track_interp
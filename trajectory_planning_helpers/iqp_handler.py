@@ -1,4 +1,9 @@
+import time
+from typing import Callable
+
 import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
 from .opt_min_curv import opt_min_curv
 from .calc_head_curv_an import calc_head_curv_an
 from .calc_spline_lengths import calc_spline_lengths
@@ -22,6 +27,7 @@ def iqp_handler(
     stepsize_interp: float,
     iters_min: int = 3,
     curv_error_allowed: float = 0.01,
+    timing_callback: Callable[[int, dict], None] = None,
 ) -> tuple:
 
     """
@@ -87,6 +93,15 @@ def iqp_handler(
     :param curv_error_allowed:  allowed curvature error in rad/m between the original linearization and the
                                 linearization around the solution (termination criterion).
     :type curv_error_allowed:   float
+    :param timing_callback:     optional function that is called after every iteration with the iteration number and a
+                                dict containing the runtimes in s of the single steps of the iteration.
+    :type timing_callback:      Callable[[int, dict], None]
+
+    .. notes::
+    The reference track is re-interpolated with equal stepsizes in every iteration and the splines are set up without
+    distance scaling. The spline equation system matrix A and its sparse LU decomposition therefore only depend on the
+    number of points. The decomposition of the last iteration is reused as long as the number of points does not
+    change.
 
     .. outputs::
     :return alpha_mincurv_tmp:  solution vector of the optimization problem containing the lateral shift in m for every
@@ -119,28 +134,39 @@ def iqp_handler(
     reftrack_tmp = reftrack
     normvectors_tmp = normvectors
     A_tmp = A
+    A_lu_tmp = _calc_A_lu(A)
     spline_len_tmp = spline_len
     psi_reftrack_tmp = psi
     kappa_reftrack_tmp = kappa
     dkappa_reftrack_tmp = dkappa
 
+    # number of points the current LU decomposition of A (without distance scaling) belongs to (the given matrix A
+    # might be set up with distance scaling, i.e. it is not reused)
+    no_points_lu = None
+
     # loop
     iter_cur = 0
 
     while True:
         iter_cur += 1
+        runtimes = {}
 
         # calculate intermediate solution and catch sum of squared curvature errors
+        t_start = time.perf_counter()
+
         alpha_mincurv_tmp, curv_error_max_tmp = opt_min_curv(
             reftrack=reftrack_tmp,
             normvectors=normvectors_tmp,
             A=A_tmp,
+            A_lu=A_lu_tmp,
             kappa_bound=kappa_bound,
             w_veh=w_veh,
             print_debug=print_debug,
             plot_debug=plot_debug,
         )
 
+        runtimes["opt_min_curv"] = time.perf_counter() - t_start
+
         # print some progress information
         if print_debug:
             print(
@@ -156,20 +182,33 @@ def iqp_handler(
         if iter_cur >= iters_min and curv_error_max_tmp <= curv_error_allowed:
             if print_debug:
                 print("Finished IQP!")
+
+            if timing_callback is not None:
+                timing_callback(iter_cur, runtimes)
+
             break
 
         # --------------------------------------------------------------------------------------------------------------
         # INTERPOLATION FOR EQUAL STEPSIZES ----------------------------------------------------------------------------
         # --------------------------------------------------------------------------------------------------------------
 
-        (refline_tmp, _, _, _, spline_inds_tmp, t_values_tmp,) = create_raceline(
+        t_start = time.perf_counter()
+
+        # the equation system matrix and the normal vectors of the raceline are not required here
+        (refline_tmp, _, _, _, _, spline_inds_tmp, t_values_tmp,) = create_raceline(
             refline=reftrack_tmp[:, :2],
             normvectors=normvectors_tmp,
             alpha=alpha_mincurv_tmp,
             stepsize_interp=stepsize_interp,
-        )[:6]
+            calc_A=False,
+            calc_normvectors=False,
+        )[:7]
+
+        runtimes["create_raceline"] = time.perf_counter() - t_start
 
         # calculate new track boundaries on the basis of the intermediate alpha values and interpolate them accordingly
+        t_start = time.perf_counter()
+
         reftrack_tmp[:, 2] -= alpha_mincurv_tmp
         reftrack_tmp[:, 3] += alpha_mincurv_tmp
 
@@ -183,26 +222,46 @@ def iqp_handler(
         # create new reftrack
         reftrack_tmp = np.column_stack((refline_tmp, ws_track_tmp))
 
+        runtimes["interp_track_widths"] = time.perf_counter() - t_start
+
         # --------------------------------------------------------------------------------------------------------------
         # CALCULATE NEW SPLINES ON THE BASIS OF THE INTERPOLATED REFERENCE TRACK ---------------------------------------
         # --------------------------------------------------------------------------------------------------------------
 
-        # calculate new splines
+        # calculate new splines (A is only set up and decomposed if the number of points changed)
+        t_start = time.perf_counter()
+
         refline_tmp_cl = np.vstack((reftrack_tmp[:, :2], reftrack_tmp[0, :2]))
+        no_points = reftrack_tmp.shape[0]
 
-        (
-            coeffs_x_tmp,
-            coeffs_y_tmp,
-            A_tmp,
-            normvectors_tmp,
-        ) = calc_splines(path=refline_tmp_cl, use_dist_scaling=False)
+        (coeffs_x_tmp, coeffs_y_tmp, A_tmp, normvectors_tmp,) = calc_splines(
+            path=refline_tmp_cl,
+            closed=True,
+            use_dist_scaling=False,
+            return_M=no_points != no_points_lu,
+        )
+
+        if no_points != no_points_lu:
+            A_lu_tmp = _calc_A_lu(A_tmp)
+            no_points_lu = no_points
+
+        # A itself is not required anymore, only its decomposition
+        A_tmp = None
+
+        runtimes["calc_splines"] = time.perf_counter() - t_start
 
         # calculate spline lengths
+        t_start = time.perf_counter()
+
         spline_len_tmp = calc_spline_lengths(
             coeffs_x=coeffs_x_tmp, coeffs_y=coeffs_y_tmp
         )
 
+        runtimes["calc_spline_lengths"] = time.perf_counter() - t_start
+
         # calculate heading, curvature, and first derivative of curvature (analytically)
+        t_start = time.perf_counter()
+
         (
             psi_reftrack_tmp,
             kappa_reftrack_tmp,
@@ -210,11 +269,16 @@ def iqp_handler(
         ) = calc_head_curv_an(
             coeffs_x=coeffs_x_tmp,
             coeffs_y=coeffs_y_tmp,
-            ind_spls=np.arange(reftrack_tmp.shape[0]),
-            t_spls=np.zeros(reftrack_tmp.shape[0]),
+            ind_spls=np.arange(no_points),
+            t_spls=np.zeros(no_points),
             calc_dcurv=True,
         )
 
+        runtimes["calc_head_curv_an"] = time.perf_counter() - t_start
+
+        if timing_callback is not None:
+            timing_callback(iter_cur, runtimes)
+
     return (
         alpha_mincurv_tmp,
         reftrack_tmp,
@@ -224,3 +288,8 @@ def iqp_handler(
         kappa_reftrack_tmp,
         dkappa_reftrack_tmp,
     )
+
+
+def _calc_A_lu(A: np.ndarray) -> scipy.sparse.linalg.SuperLU:
+    # A is sparse -> opt_min_curv() works on its sparse LU decomposition instead of its (dense) inverse
+    return scipy.sparse.linalg.splu(scipy.sparse.csc_matrix(A))
@@ -4,7 +4,11 @@ from .calc_head_curv_an import calc_head_curv_an
 
 
 def nonreg_sampling(
-    track: np.ndarray, eps_kappa: float = 1e-3, step_non_reg: int = 0
+    track: np.ndarray,
+    eps_kappa: float = 1e-3,
+    step_non_reg: int = 0,
+    dev_max: float = None,
+    stepsize_max: float = None,
 ) -> tuple:
     """
     author:
@@ -14,6 +18,12 @@ def nonreg_sampling(
     The non-regular sampling function runs through the curvature profile and determines straight and corner sections.
     During straight sections it reduces the amount of points by skipping them depending on the step_non_reg parameter.
 
+    Alternatively (if dev_max is set), the points are sampled adaptively: the local spacing is chosen such that the
+    deviation between the path and the chord between two kept points stays (approximately) below dev_max. For a
+    constant curvature kappa the deviation of a chord of length l is l^2 * |kappa| / 8, for a linearly changing
+    curvature (clothoid-like section) it is approximately l^3 * |dkappa| / (9 * sqrt(3)). The smaller of both spacings
+    is used.
+
     .. inputs::
     :param track:           [x, y, w_tr_right, w_tr_left] (always unclosed).
     :type track:            np.ndarray
@@ -23,6 +33,12 @@ def nonreg_sampling(
     :param step_non_reg:    determines how many points are skipped in straight sections, e.g. step_non_reg = 3 means
                             every fourth point is used while three points are skipped
     :type step_non_reg:     int
+    :param dev_max:         maximum allowed deviation in m between the path and the chords between the kept points.
+                            Activates the adaptive sampling, i.e. eps_kappa and step_non_reg are not used if set.
+    :type dev_max:          float
+    :param stepsize_max:    maximum distance in m between two kept points in adaptive mode (e.g. to keep the track
+                            widths on long straights), unlimited if not set.
+    :type stepsize_max:     float
 
     .. outputs::
     :return track_sampled:  [x, y, w_tr_right, w_tr_left] sampled track (always unclosed).
@@ -32,27 +48,57 @@ def nonreg_sampling(
     """
 
     # if stepsize is equal to zero simply return the input
-    if step_non_reg == 0:
+    if step_non_reg == 0 and dev_max is None:
         return track, np.arange(0, track.shape[0])
 
     # calculate curvature (required to be able to differentiate straight and corner sections)
     path_cl = np.vstack((track[:, :2], track[0, :2]))
-    coeffs_x, coeffs_y = calc_splines(path=path_cl)[:2]
-    kappa_path = calc_head_curv_an(
+    coeffs_x, coeffs_y = calc_splines(path=path_cl, closed=True)[:2]
+    head_curv = calc_head_curv_an(
         coeffs_x=coeffs_x,
         coeffs_y=coeffs_y,
         ind_spls=np.arange(0, coeffs_x.shape[0]),
         t_spls=np.zeros(coeffs_x.shape[0]),
-    )[1]
+        calc_dcurv=dev_max is not None,
+    )
+    kappa_path = head_curv[1]
+
+    idxs = np.arange(0, kappa_path.size)
+
+    if dev_max is None:
+        # a point is kept if it is located in a corner or if it is the (step_non_reg + 1)-th point after the latest
+        # corner point (or the first point) -> determine latest corner point (first point is always kept) for every
+        # point
+        is_corner = np.abs(kappa_path) >= eps_kappa
+        is_corner[0] = True
+        idxs_latest_corner = np.maximum.accumulate(np.where(is_corner, idxs, 0))
+
+        sample_idxs = idxs[
+            is_corner | ((idxs - idxs_latest_corner) % (step_non_reg + 1) == 0)
+        ]
+
+    else:
+        # allowed spacing at every point on the basis of curvature and first derivative of curvature (dkappa is
+        # calculated with respect to the arc length)
+        dkappa_path = head_curv[2]
+
+        with np.errstate(divide="ignore"):
+            spacing = np.minimum(
+                np.sqrt(8.0 * dev_max / np.abs(kappa_path)),
+                np.cbrt(9.0 * np.sqrt(3.0) * dev_max / np.abs(dkappa_path)),
+            )
+
+        if stepsize_max is not None:
+            spacing = np.minimum(spacing, stepsize_max)
 
-    # run through the profile to determine the indices of the points that are kept
-    idx_latest = step_non_reg + 1
-    sample_idxs = [0]
+        # accumulate the required number of points along the track (every element is weighted with the smaller spacing
+        # of its two points) -> keep a point whenever the accumulated number of points reaches the next integer
+        el_lengths = np.sqrt(np.sum(np.power(np.diff(track[:, :2], axis=0), 2), axis=1))
+        no_points_cum = np.concatenate(
+            ([0.0], np.cumsum(el_lengths / np.minimum(spacing[:-1], spacing[1:])))
+        )
 
-    for idx in range(1, len(kappa_path)):
-        if np.abs(kappa_path[idx]) >= eps_kappa or idx >= idx_latest:
-            # keep this point
-            sample_idxs.append(idx)
-            idx_latest = idx + step_non_reg + 1
+        is_kept = np.diff(np.floor(no_points_cum)) > 0
+        sample_idxs = idxs[np.concatenate(([True], is_kept))]
 
-    return track[sample_idxs], np.array(sample_idxs)
+    return track[sample_idxs], sample_idxs
@@ -2,8 +2,8 @@ import math
 import time
 
 import numpy as np
-import quadprog
-from matplotlib import pyplot as plt
+import scipy.sparse
+import scipy.sparse.linalg
 
 
 def opt_min_curv(
@@ -20,6 +20,7 @@ def opt_min_curv(
     fix_s: bool = False,
     fix_e: bool = False,
     method: str = "quadprog",
+    A_lu: scipy.sparse.linalg.SuperLU = None,
 ) -> tuple:
     """
     author:
@@ -74,6 +75,10 @@ def opt_min_curv(
     :type fix_e:        bool
     :param method:      method to be used for solving the QP problem. "quadprog"
     :type method:       str
+    :param A_lu:        sparse LU decomposition of A (scipy.sparse.linalg.splu()), optional. If provided, the
+                        decomposition of A is skipped (e.g. if the same spline system is used several times, as within
+                        the IQP). A can be None in this case.
+    :type A_lu:         scipy.sparse.linalg.SuperLU
 
     .. outputs::
     :return alpha_mincurv:  solution vector of the opt. problem containing the lateral shift in m for every point.
@@ -98,10 +103,15 @@ def opt_min_curv(
     if no_points != normvectors.shape[0]:
         raise RuntimeError("Array size of reftrack should be the same as normvectors!")
 
+    if A_lu is None:
+        A_check = A
+    else:
+        A_check = A_lu
+
     if (
-        (no_points * 4 != A.shape[0] and closed)
-        or (no_splines * 4 != A.shape[0] and not closed)
-        or A.shape[0] != A.shape[1]
+        (no_points * 4 != A_check.shape[0] and closed)
+        or (no_splines * 4 != A_check.shape[0] and not closed)
+        or A_check.shape[0] != A_check.shape[1]
     ):
         raise RuntimeError("Spline equation system matrix A has wrong dimensions!")
 
@@ -127,9 +137,15 @@ def opt_min_curv(
     if not closed:
         A_ex_c[-1, -4:] = np.array([0, 0, 2, 6])
 
-    # invert matrix A resulting from the spline setup linear equation system and apply extraction matrix
-    A_inv = np.linalg.inv(A)
-    T_c = np.matmul(A_ex_c, A_inv)
+    # apply extraction matrices to the inverse of matrix A resulting from the spline setup linear equation system: A is
+    # sparse -> instead of inverting it, its sparse LU decomposition (if not provided) is used to solve
+    # A^T * [T_b, T_c]^T = [A_ex_b, A_ex_c]^T, i.e. T_b = A_ex_b * A^-1 and T_c = A_ex_c * A^-1
+    if A_lu is None:
+        A_lu = scipy.sparse.linalg.splu(scipy.sparse.csc_matrix(A))
+
+    T_bc = A_lu.solve(np.vstack((A_ex_b, A_ex_c)).T.astype(float), trans="T").T
+    T_b = np.ascontiguousarray(T_bc[:no_points])
+    T_c = np.ascontiguousarray(T_bc[no_points:])
 
     # set up M_x and M_y matrices including the gradient information, i.e. bring normal vectors into matrix form
     M_x = np.zeros((no_splines * 4, no_points))
@@ -179,42 +195,50 @@ def opt_min_curv(
         q_x[-1, 0] = math.cos(psi_e)
         q_y[-1, 0] = math.sin(psi_e)
 
-    # set up P_xx, P_xy, P_yy matrices
-    x_prime = np.eye(no_points, no_points) * np.matmul(np.matmul(A_ex_b, A_inv), q_x)
-    y_prime = np.eye(no_points, no_points) * np.matmul(np.matmul(A_ex_b, A_inv), q_y)
+    # set up P_xx, P_xy, P_yy matrices (all of them are diagonal matrices -> only their diagonals are stored)
+    x_prime = np.squeeze(np.matmul(T_b, q_x), axis=1)
+    y_prime = np.squeeze(np.matmul(T_b, q_y), axis=1)
 
     x_prime_sq = np.power(x_prime, 2)
     y_prime_sq = np.power(y_prime, 2)
-    x_prime_y_prime = -2 * np.matmul(x_prime, y_prime)
+    x_prime_y_prime = -2 * x_prime * y_prime
 
     curv_den = np.power(x_prime_sq + y_prime_sq, 1.5)  # calculate curvature denominator
     curv_part = np.divide(
         1, curv_den, out=np.zeros_like(curv_den), where=curv_den != 0
-    )  # divide where not zero (diag elements)
+    )  # divide where not zero
     curv_part_sq = np.power(curv_part, 2)
 
-    P_xx = np.matmul(curv_part_sq, y_prime_sq)
-    P_yy = np.matmul(curv_part_sq, x_prime_sq)
-    P_xy = np.matmul(curv_part_sq, x_prime_y_prime)
+    P_xx = curv_part_sq * y_prime_sq
+    P_yy = curv_part_sq * x_prime_sq
+    P_xy = curv_part_sq * x_prime_y_prime
 
     # ------------------------------------------------------------------------------------------------------------------
     # SET UP FINAL MATRICES FOR SOLVER ---------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
 
-    T_nx = np.matmul(T_c, M_x)
-    T_ny = np.matmul(T_c, M_y)
+    # M_x and M_y only hold two entries per column -> sparse matrix products
+    T_nx = (scipy.sparse.csr_matrix(M_x.T) @ T_c.T).T
+    T_ny = (scipy.sparse.csr_matrix(M_y.T) @ T_c.T).T
+
+    # products of the diagonal matrices P with T_n -> scale rows
+    P_xx_T_nx = P_xx[:, np.newaxis] * T_nx
+    P_xy_T_nx = P_xy[:, np.newaxis] * T_nx
+    P_xy_T_ny = P_xy[:, np.newaxis] * T_ny
+    P_yy_T_ny = P_yy[:, np.newaxis] * T_ny
 
-    H_x = np.matmul(T_nx.T, np.matmul(P_xx, T_nx))
-    H_xy = np.matmul(T_ny.T, np.matmul(P_xy, T_nx))
-    H_y = np.matmul(T_ny.T, np.matmul(P_yy, T_ny))
-    H = H_x + H_xy + H_y
+    # H_xy and H_y share the left factor T_ny.T -> one matrix product for both
+    H_x = np.matmul(T_nx.T, P_xx_T_nx)
+    H_xy_y = np.matmul(T_ny.T, P_xy_T_nx + P_yy_T_ny)
+    H = H_x + H_xy_y
     H = (H + H.T) / 2  # make H symmetric
 
-    f_x = 2 * np.matmul(np.matmul(q_x.T, T_c.T), np.matmul(P_xx, T_nx))
-    f_xy = np.matmul(np.matmul(q_x.T, T_c.T), np.matmul(P_xy, T_ny)) + np.matmul(
-        np.matmul(q_y.T, T_c.T), np.matmul(P_xy, T_nx)
-    )
-    f_y = 2 * np.matmul(np.matmul(q_y.T, T_c.T), np.matmul(P_yy, T_ny))
+    T_c_q_x = np.matmul(T_c, q_x)
+    T_c_q_y = np.matmul(T_c, q_y)
+
+    f_x = 2 * np.matmul(T_c_q_x.T, P_xx_T_nx)
+    f_xy = np.matmul(T_c_q_x.T, P_xy_T_ny) + np.matmul(T_c_q_y.T, P_xy_T_nx)
+    f_y = 2 * np.matmul(T_c_q_y.T, P_yy_T_ny)
     f = f_x + f_xy + f_y
     f = np.squeeze(f)  # remove non-singleton dimensions
 
@@ -222,16 +246,15 @@ def opt_min_curv(
     # KAPPA CONSTRAINTS ------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
 
-    Q_x = np.matmul(curv_part, y_prime)
-    Q_y = np.matmul(curv_part, x_prime)
+    # diagonals of Q_x and Q_y
+    Q_x = curv_part * y_prime
+    Q_y = curv_part * x_prime
 
     # this part is multiplied by alpha within the optimization (variable part)
-    E_kappa = np.matmul(Q_y, T_ny) - np.matmul(Q_x, T_nx)
+    E_kappa = Q_y[:, np.newaxis] * T_ny - Q_x[:, np.newaxis] * T_nx
 
     # original curvature part (static part)
-    k_kappa_ref = np.matmul(Q_y, np.matmul(T_c, q_y)) - np.matmul(
-        Q_x, np.matmul(T_c, q_x)
-    )
+    k_kappa_ref = Q_y[:, np.newaxis] * T_c_q_y - Q_x[:, np.newaxis] * T_c_q_x
 
     con_ge = np.ones((no_points, 1)) * kappa_bound - k_kappa_ref
     con_le = -(
@@ -321,6 +344,9 @@ def opt_min_curv(
         The quadprog solver only considers the lower entries of `H`, therefore it
         will use a wrong cost function if a non-symmetric matrix is provided.
         """
+        # solver is imported on first use, i.e. importing the package does not require loading it
+        import quadprog
+
         alpha_mincurv = quadprog.solve_qp(H, -f, -G.T, -h, 0)[0]
 
     else:
@@ -342,34 +368,26 @@ def opt_min_curv(
     q_x_tmp = q_x + np.matmul(M_x, np.expand_dims(alpha_mincurv, 1))
     q_y_tmp = q_y + np.matmul(M_y, np.expand_dims(alpha_mincurv, 1))
 
-    x_prime_tmp = np.eye(no_points, no_points) * np.matmul(
-        np.matmul(A_ex_b, A_inv), q_x_tmp
-    )
-    y_prime_tmp = np.eye(no_points, no_points) * np.matmul(
-        np.matmul(A_ex_b, A_inv), q_y_tmp
-    )
+    x_prime_tmp = np.squeeze(np.matmul(T_b, q_x_tmp), axis=1)
+    y_prime_tmp = np.squeeze(np.matmul(T_b, q_y_tmp), axis=1)
 
     x_prime_prime = np.squeeze(
-        np.matmul(T_c, q_x) + np.matmul(T_nx, np.expand_dims(alpha_mincurv, 1))
+        T_c_q_x + np.matmul(T_nx, np.expand_dims(alpha_mincurv, 1)), axis=1
     )
     y_prime_prime = np.squeeze(
-        np.matmul(T_c, q_y) + np.matmul(T_ny, np.expand_dims(alpha_mincurv, 1))
+        T_c_q_y + np.matmul(T_ny, np.expand_dims(alpha_mincurv, 1)), axis=1
     )
 
-    curv_orig_lin = np.zeros(no_points)
-    curv_sol_lin = np.zeros(no_points)
-
-    for i in range(no_points):
-        curv_orig_lin[i] = (
-            x_prime[i, i] * y_prime_prime[i] - y_prime[i, i] * x_prime_prime[i]
-        ) / math.pow(math.pow(x_prime[i, i], 2) + math.pow(y_prime[i, i], 2), 1.5)
-        curv_sol_lin[i] = (
-            x_prime_tmp[i, i] * y_prime_prime[i] - y_prime_tmp[i, i] * x_prime_prime[i]
-        ) / math.pow(
-            math.pow(x_prime_tmp[i, i], 2) + math.pow(y_prime_tmp[i, i], 2), 1.5
-        )
+    curv_orig_lin = (x_prime * y_prime_prime - y_prime * x_prime_prime) / np.power(
+        x_prime_sq + y_prime_sq, 1.5
+    )
+    curv_sol_lin = (
+        x_prime_tmp * y_prime_prime - y_prime_tmp * x_prime_prime
+    ) / np.power(np.power(x_prime_tmp, 2) + np.power(y_prime_tmp, 2), 1.5)
 
     if plot_debug:
+        from matplotlib import pyplot as plt
+
         plt.plot(curv_orig_lin)
         plt.plot(curv_sol_lin)
         plt.legend(("original linearization", "solution based linearization"))
@@ -1,6 +1,5 @@
 import numpy as np
 import math
-import quadprog
 import time
 
 
@@ -181,7 +180,9 @@ def opt_shortest_path(
     # save start time
     t_start = time.perf_counter()
 
-    # solve problem
+    # solve problem (solver is imported on first use, i.e. importing the package does not require loading it)
+    import quadprog
+
     alpha_shpath = quadprog.solve_qp(H, -f, -G.T, -h, 0)[0]
 
     # print runtime into console window
@@ -1,7 +1,8 @@
 import numpy as np
 from .path_matching_local import path_matching_local
 from .get_rel_path_part import get_rel_path_part
-from typing import Union
+import time
+from typing import Callable, Union
 
 
 def path_matching_global(
@@ -9,6 +10,7 @@ def path_matching_global(
     ego_position: np.ndarray,
     s_expected: Union[float, None] = None,
     s_range: float = 20.0,
+    timing_callback: Callable[[float], None] = None,
 ) -> tuple:
     """
     author:
@@ -26,6 +28,9 @@ def path_matching_global(
     :type s_expected:       Union[float, None]
     :param s_range:         Range around expected s position of the vehicle to search for the match in m.
     :type s_range:          float
+    :param timing_callback: Optional function that is called with the runtime of the matching in s (e.g. to export
+                            latency metrics).
+    :type timing_callback:  Callable[[float], None]
 
     .. outputs::
     :return s_interp:       Interpolated s position of the vehicle in m. The following holds: s_interp in range
@@ -39,6 +44,9 @@ def path_matching_global(
     # CHECK INPUT ------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
 
+    if timing_callback is not None:
+        t_start = time.perf_counter()
+
     if path_cl.shape[1] != 3:
         raise RuntimeError("Inserted path must have 3 columns [s, x, y]!")
 
@@ -82,4 +90,7 @@ def path_matching_global(
 
     # now the following holds: s_interp -> [0.0; s_tot[
 
+    if timing_callback is not None:
+        timing_callback(time.perf_counter() - t_start)
+
     return s_interp, d_displ
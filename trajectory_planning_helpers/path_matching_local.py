@@ -1,6 +1,7 @@
 import numpy as np
 from .angle3pt import angle3pt
-from typing import Union
+import time
+from typing import Callable, Union
 
 
 def path_matching_local(
@@ -8,6 +9,7 @@ def path_matching_local(
     ego_position: np.ndarray,
     consider_as_closed: bool = False,
     s_tot: Union[float, None] = None,
+    timing_callback: Callable[[float], None] = None,
 ) -> tuple:
     """
     author:
@@ -26,6 +28,9 @@ def path_matching_local(
     :type consider_as_closed:   bool
     :param s_tot:               Total length of path in m.
     :type s_tot:                Union[float, None]
+    :param timing_callback:     Optional function that is called with the runtime of the matching in s (e.g. to export
+                                latency metrics).
+    :type timing_callback:      Callable[[float], None]
 
     .. outputs::
     :return s_interp:           Interpolated s position of the vehicle in m.
@@ -38,6 +43,9 @@ def path_matching_local(
     # CHECK INPUT ------------------------------------------------------------------------------------------------------
     # ------------------------------------------------------------------------------------------------------------------
 
+    if timing_callback is not None:
+        t_start = time.perf_counter()
+
     if path.shape[1] != 3:
         raise RuntimeError("Inserted path must have 3 columns [s, x, y]!")
 
@@ -125,4 +133,7 @@ def path_matching_local(
 
         d_displ = np.sqrt((ego_position - x_proj) ** 2 + (ego_position - y_proj) ** 2)
 
+    if timing_callback is not None:
+        timing_callback(time.perf_counter() - t_start)
+
     return s_interp, d_displ
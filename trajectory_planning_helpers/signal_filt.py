@@ -0,0 +1,97 @@
+import numpy as np
+import scipy.signal
+
+
+def savgol_filt(
+    signal: np.ndarray, filt_window: int, poly_order: int, closed: bool
+) -> np.ndarray:
+    """
+    .. description::
+    Filter a given signal using a Savitzky-Golay filter, i.e. a local polynomial fit within a moving window. In
+    contrast to the moving average filter in conv_filt(), peaks of the signal are preserved much better.
+
+    .. inputs::
+    :param signal:          signal that should be filtered (always unclosed).
+    :type signal:           np.ndarray
+    :param filt_window:     filter window size (must be odd and larger than poly_order).
+    :type filt_window:      int
+    :param poly_order:      order of the polynomial that is fitted within the window.
+    :type poly_order:       int
+    :param closed:          flag showing if the signal can be considered as closable, e.g. for velocity profiles.
+    :type closed:           bool
+
+    .. outputs::
+    :return signal_filt:    filtered input signal (always unclosed).
+    :rtype signal_filt:     np.ndarray
+
+    .. notes::
+    signal input is always unclosed!
+
+    len(signal) = len(signal_filt)
+    """
+
+    # check if window width is odd
+    if not filt_window % 2 == 1:
+        raise RuntimeError("Window width of Savitzky-Golay filter must be odd!")
+
+    # closed signals are continued periodically, the boundaries of unclosed signals are handled by a polynomial fit of
+    # the last window
+    signal_filt = scipy.signal.savgol_filter(
+        signal, filt_window, poly_order, mode="wrap" if closed else "interp"
+    )
+
+    return signal_filt
+
+
+def iir_filt(
+    signal: np.ndarray, cutoff: float, closed: bool, filt_order: int = 2
+) -> np.ndarray:
+    """
+    .. description::
+    Filter a given signal using a zero-phase Butterworth lowpass filter, i.e. the signal is filtered forwards and
+    backwards such that it is not shifted.
+
+    .. inputs::
+    :param signal:          signal that should be filtered (always unclosed).
+    :type signal:           np.ndarray
+    :param cutoff:          cutoff frequency normalized to the Nyquist frequency (0.0 < cutoff < 1.0), i.e. signal
+                            components with a period of less than 2 / cutoff samples are damped.
+    :type cutoff:           float
+    :param closed:          flag showing if the signal can be considered as closable, e.g. for velocity profiles.
+    :type closed:           bool
+    :param filt_order:      order of the Butterworth filter.
+    :type filt_order:       int
+
+    .. outputs::
+    :return signal_filt:    filtered input signal (always unclosed).
+    :rtype signal_filt:     np.ndarray
+
+    .. notes::
+    signal input is always unclosed!
+
+    For closed signals, the forward-backward filtering is carried out in the frequency domain, i.e. the spectrum of the
+    signal is multiplied by the squared magnitude of the filter's frequency response. This corresponds to a filtering of
+    the periodically continued signal without any boundary effects.
+
+    len(signal) = len(signal_filt)
+    """
+
+    # check cutoff frequency
+    if not 0.0 < cutoff < 1.0:
+        raise RuntimeError("Cutoff frequency must be between 0.0 and 1.0!")
+
+    sos = scipy.signal.butter(filt_order, cutoff, output="sos")
+
+    if closed:
+        # squared magnitude of the frequency response at the frequencies of the discrete Fourier transform
+        no_points = signal.size
+        h = scipy.signal.sosfreqz(sos, worN=2.0 * np.pi * np.fft.rfftfreq(no_points))[1]
+
+        signal_filt = np.fft.irfft(
+            np.fft.rfft(signal) * np.power(np.abs(h), 2), n=no_points
+        )
+
+    else:
+        signal_filt = scipy.signal.sosfiltfilt(sos, signal)
+
+    return signal_filt
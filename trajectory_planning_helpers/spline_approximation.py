@@ -1,6 +1,4 @@
 from scipy import interpolate
-from scipy import optimize
-from scipy import spatial
 import numpy as np
 import math
 from .interp_track import interp_track
@@ -14,6 +12,7 @@ def spline_approximation(
     stepsize_prep: float = 1.0,
     stepsize_reg: float = 3.0,
     debug: bool = False,
+    no_iters_proj: int = 20,
 ) -> np.ndarray:
     """
     author:
@@ -38,6 +37,8 @@ def spline_approximation(
     :type stepsize_reg:     float
     :param debug:           flag for printing debug messages
     :type debug:            bool
+    :param no_iters_proj:   maximum number of Newton iterations used to project the input points onto the spline.
+    :type no_iters_proj:    int
 
     .. outputs::
     :return track_reg:      [x, y, w_tr_right, w_tr_left, (banking)] (always unclosed).
@@ -94,33 +95,43 @@ def spline_approximation(
     # ------------------------------------------------------------------------------------------------------------------
 
     # find the closest points on the B spline to input points
-    dists_cl = np.zeros(
-        no_points_track_cl
-    )  # contains (min) distances between input points and spline
-    closest_point_cl = np.zeros(
-        (no_points_track_cl, 2)
-    )  # contains the closest points on the spline
-    closest_t_glob_cl = np.zeros(
-        no_points_track_cl
-    )  # containts the t_glob values for closest points
     t_glob_guess_cl = (
         dists_cum_cl / dists_cum_cl[-1]
     )  # start guess for the minimization
 
-    for i in range(no_points_track_cl):
-        # get t_glob value for the point on the B spline with a minimum distance to the input points
-        closest_t_glob_cl[i] = optimize.fmin(
-            dist_to_p, x0=t_glob_guess_cl[i], args=(tck_cl, track_cl[i, :2]), disp=False
-        )
-
-        # evaluate B spline on the basis of t_glob to obtain the closest point
-        closest_point_cl[i] = interpolate.splev(closest_t_glob_cl[i], tck_cl)
+    # get t_glob values for the points on the B spline with a minimum distance to the input points -> Newton iterations
+    # for all points at once (minimization of the squared distance, Gauss-Newton step if not locally convex)
+    closest_t_glob_cl = np.copy(t_glob_guess_cl)
+    dt_max = 0.5 / (
+        no_points_track_cl - 1
+    )  # limit step size to avoid jumping to other parts of the track
+
+    for _ in range(no_iters_proj):
+        t_eval = np.mod(closest_t_glob_cl, 1.0)
+        diff_cl = np.array(interpolate.splev(t_eval, tck_cl)).T - track_cl[:, :2]
+        spl_d = np.array(interpolate.splev(t_eval, tck_cl, der=1)).T
+        spl_dd = np.array(interpolate.splev(t_eval, tck_cl, der=2)).T
+
+        grad = np.sum(diff_cl * spl_d, axis=1)
+        hess = np.sum(spl_d * spl_d, axis=1)
+        hess_full = hess + np.sum(diff_cl * spl_dd, axis=1)
+        hess = np.where(hess_full > 0.0, hess_full, hess)
+
+        dt = np.clip(grad / hess, -dt_max, dt_max)
+        closest_t_glob_cl -= dt
+
+        if np.amax(np.abs(dt)) < 1e-12:
+            break
+
+    # evaluate B spline on the basis of t_glob to obtain the closest points
+    closest_point_cl = np.array(
+        interpolate.splev(np.mod(closest_t_glob_cl, 1.0), tck_cl)
+    ).T
 
-        # save distance from closest point to input point
-        dists_cl[i] = math.sqrt(
-            math.pow(closest_point_cl[i, 0] - track_cl[i, 0], 2)
-            + math.pow(closest_point_cl[i, 1] - track_cl[i, 1], 2)
-        )
+    # save distances from closest points to input points
+    dists_cl = np.hypot(
+        closest_point_cl[:, 0] - track_cl[:, 0], closest_point_cl[:, 1] - track_cl[:, 1]
+    )
 
     if debug:
         print(
@@ -129,12 +140,9 @@ def spline_approximation(
         )
 
     # get side of smoothed track compared to the inserted track
-    sides = np.zeros(no_points_track_cl - 1)
-
-    for i in range(no_points_track_cl - 1):
-        sides[i] = side_of_line(
-            a=track_cl[i, :2], b=track_cl[i + 1, :2], z=closest_point_cl[i]
-        )
+    sides = side_of_line(
+        a=track_cl[:-1, :2].T, b=track_cl[1:, :2].T, z=closest_point_cl[:-1].T
+    )
 
     sides_cl = np.hstack((sides, sides[0]))
 
@@ -162,13 +170,3 @@ def spline_approximation(
         track_reg = np.column_stack((track_reg, banking_smoothed_cl[:-1]))
 
     return track_reg
-
-
-# ----------------------------------------------------------------------------------------------------------------------
-# DISTANCE CALCULATION FOR OPTIMIZATION --------------------------------------------------------------------------------
-# ----------------------------------------------------------------------------------------------------------------------
-
-# return distance from point p to a point on the spline at spline parameter t_glob
-def dist_to_p(t_glob: np.ndarray, path: list, p: np.ndarray):
-    s = interpolate.splev(t_glob, path)
-    return spatial.distance.euclidean(p, s)
@@ -0,0 +1,112 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .spline_approximation import spline_approximation
+
+
+def spline_approximation_batch(
+    tracks: list,
+    param_sets: list = None,
+    max_workers: int = None,
+) -> tuple:
+    """
+    .. description::
+    Run spline_approximation() for several tracks and several parameter sets in parallel on a process pool. The input
+    tracks are copied once into a shared memory block that is accessed by all worker processes, i.e. they are not
+    pickled for every job.
+
+    .. inputs::
+    :param tracks:          list of tracks [x, y, w_tr_right, w_tr_left, (banking)] (always unclosed).
+    :type tracks:           list
+    :param param_sets:      list of dicts containing keyword arguments for spline_approximation(), e.g.
+                            {"k_reg": 3, "s_reg": 10, "stepsize_reg": 3.0}. Every track is smoothed with every
+                            parameter set. Default parameters are used if not provided.
+    :type param_sets:       list
+    :param max_workers:     maximum number of worker processes (number of CPUs if not provided).
+    :type max_workers:      int
+
+    .. outputs::
+    :return tracks_reg:     list of smoothed tracks [x, y, w_tr_right, w_tr_left, (banking)] (always unclosed).
+    :rtype tracks_reg:      list
+    :return exec_times:     execution time of every job in s.
+    :rtype exec_times:      np.ndarray
+
+    .. notes::
+    The jobs are ordered track by track, i.e. the result of track i and parameter set j is found at index
+    i * len(param_sets) + j.
+
+    len(tracks_reg) = len(exec_times) = len(tracks) * len(param_sets)
+    """
+
+    if param_sets is None:
+        param_sets = [{}]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # COPY TRACKS INTO SHARED MEMORY -----------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    tracks = [np.asarray(track, dtype=np.float64) for track in tracks]
+    offsets = np.cumsum([0] + [track.size for track in tracks])
+
+    shm = shared_memory.SharedMemory(create=True, size=max(int(offsets[-1]) * 8, 8))
+
+    try:
+        tracks_shm = np.ndarray((offsets[-1],), dtype=np.float64, buffer=shm.buf)
+
+        for i, track in enumerate(tracks):
+            tracks_shm[offsets[i] : offsets[i + 1]] = track.ravel()
+
+        del tracks_shm  # release buffer before the shared memory is closed
+
+        # --------------------------------------------------------------------------------------------------------------
+        # RUN JOBS ON PROCESS POOL -------------------------------------------------------------------------------------
+        # --------------------------------------------------------------------------------------------------------------
+
+        jobs = [
+            (shm.name, int(offsets[i]), track.shape, params)
+            for i, track in enumerate(tracks)
+            for params in param_sets
+        ]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_spline_approximation_job, *zip(*jobs)))
+
+    finally:
+        shm.close()
+        shm.unlink()
+
+    if not results:
+        return [], np.zeros(0)
+
+    tracks_reg, exec_times = zip(*results)
+
+    return list(tracks_reg), np.array(exec_times)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# JOB EXECUTED IN THE WORKER PROCESSES ---------------------------------------------------------------------------------
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+def _spline_approximation_job(
+    shm_name: str, offset: int, shape: tuple, params: dict
+) -> tuple:
+    shm = shared_memory.SharedMemory(name=shm_name)
+
+    try:
+        # zero-copy view on the track within the shared memory block
+        track = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, offset=offset * 8)
+
+        t_start = time.perf_counter()
+        track_reg = spline_approximation(track=track, **params)
+        exec_time = time.perf_counter() - t_start
+
+        del track  # release buffer before the shared memory is closed
+
+    finally:
+        shm.close()
+
+    return track_reg, exec_time
@@ -0,0 +1,147 @@
+import math
+from bisect import bisect_right
+from typing import Union
+
+import numpy as np
+
+
+class SplineEvaluator:
+    """
+    .. description::
+    Lightweight evaluator for the x and y splines of a path given by the same coefficients as used in create_ppoly().
+    It gives the same results as the PPoly objects returned by create_ppoly() (with identical breaks for x and y) but
+    avoids their per-call overhead, which dominates if a few points are evaluated very often (e.g. within an MPC). The
+    breakpoints and the coefficients of the derivatives are precomputed once as contiguous arrays, the polynomials are
+    evaluated with Horner's scheme.
+
+    Two entry points are available:
+    - eval() (and __call__()) for arrays of parameters (vectorized).
+    - eval_scalar() for a single parameter, which only uses plain Python floats and is therefore much faster than
+      eval() for single points.
+
+    .. inputs::
+    :param coeffs_x:    coefficient matrix of the x splines with size (no_splines x 4).
+    :type coeffs_x:     np.ndarray
+    :param coeffs_y:    coefficient matrix of the y splines with size (no_splines x 4).
+    :type coeffs_y:     np.ndarray
+    :param breaks:      breaks of the splines with size (no_splines + 1, ), optional (0, 1, ..., no_splines if not
+                        specified). The polynomial of spline i is evaluated in (u - breaks[i]).
+    :type breaks:       np.ndarray
+    :param periodic:    true if the spline is closed (parameters are wrapped into the range of the breaks), false
+                        otherwise (NaN is returned outside the range of the breaks).
+    :type periodic:     bool
+    """
+
+    def __init__(
+        self,
+        coeffs_x: np.ndarray,
+        coeffs_y: np.ndarray,
+        breaks: np.ndarray = None,
+        periodic: bool = False,
+    ):
+        # check inputs
+        if coeffs_x.shape[0] != coeffs_y.shape[0]:
+            raise RuntimeError("Coefficient matrices must have the same length!")
+
+        if not (coeffs_x.ndim == 2 and coeffs_y.ndim == 2):
+            raise RuntimeError("Coefficient matrices do not have two dimensions!")
+
+        self.no_splines = coeffs_x.shape[0]
+
+        if breaks is None:
+            breaks = np.arange(self.no_splines + 1, dtype=np.float64)
+
+        if breaks.size != self.no_splines + 1:
+            raise RuntimeError("breaks must hold no_splines + 1 entries!")
+
+        self.breaks = np.ascontiguousarray(breaks, dtype=np.float64)
+        self.periodic = periodic
+        self.u_start = float(self.breaks[0])
+        self.u_end = float(self.breaks[-1])
+
+        # coefficients of the polynomials and their derivatives up to third order, size (4 x no_splines x 2 x 4):
+        # [derivative order, spline, x/y, power]
+        coeffs = np.stack((coeffs_x, coeffs_y), axis=1).astype(np.float64)
+        self.coeffs = np.zeros((4, self.no_splines, 2, 4))
+        self.coeffs[0] = coeffs
+        self.coeffs[1, :, :, :3] = coeffs[:, :, 1:] * np.array([1.0, 2.0, 3.0])
+        self.coeffs[2, :, :, :2] = coeffs[:, :, 2:] * np.array([2.0, 6.0])
+        self.coeffs[3, :, :, 0] = coeffs[:, :, 3] * 6.0
+
+        self._breaks_inner = self.breaks[1:-1]
+
+        # same data as Python objects for the scalar entry point
+        self._breaks_list = self.breaks.tolist()
+        self._breaks_inner_list = self._breaks_list[1:-1]
+        self._coeffs_list = self.coeffs.reshape(4, self.no_splines, 8).tolist()
+
+    def eval(self, u: Union[float, np.ndarray], nu: int = 0) -> np.ndarray:
+        """
+        .. description::
+        Evaluate the splines (or their derivatives) at the parameters u.
+
+        .. inputs::
+        :param u:       spline parameters.
+        :type u:        Union[float, np.ndarray]
+        :param nu:      order of the derivative (0 to 3).
+        :type nu:       int
+
+        .. outputs::
+        :return vals:   [x, y] (or derivatives) at the parameters with size (u.shape x 2).
+        :rtype vals:    np.ndarray
+        """
+
+        u = np.asarray(u, dtype=np.float64)
+
+        if self.periodic:
+            u = self.u_start + np.mod(u - self.u_start, self.u_end - self.u_start)
+
+        # find spline that holds the parameter (searching the inner breaks only directly clips the indices to the
+        # first and last spline, i.e. the last spline also holds the end of the range)
+        ind = np.searchsorted(self._breaks_inner, u, side="right")
+
+        d = (u - self.breaks[ind])[..., np.newaxis]
+        c = self.coeffs[nu, ind]
+        vals = c[..., 0] + d * (c[..., 1] + d * (c[..., 2] + d * c[..., 3]))
+
+        if not self.periodic:
+            vals[(u < self.u_start) | (u > self.u_end)] = np.nan
+
+        return vals
+
+    def __call__(self, u: Union[float, np.ndarray], nu: int = 0) -> np.ndarray:
+        return self.eval(u=u, nu=nu)
+
+    def eval_scalar(self, u: float, nu: int = 0) -> tuple:
+        """
+        .. description::
+        Evaluate the splines (or their derivatives) at a single parameter u.
+
+        .. inputs::
+        :param u:       spline parameter.
+        :type u:        float
+        :param nu:      order of the derivative (0 to 3).
+        :type nu:       int
+
+        .. outputs::
+        :return x:      x (or derivative) at the parameter.
+        :rtype x:       float
+        :return y:      y (or derivative) at the parameter.
+        :rtype y:       float
+        """
+
+        if self.periodic:
+            u = self.u_start + (u - self.u_start) % (self.u_end - self.u_start)
+        elif not self.u_start <= u <= self.u_end:
+            return math.nan, math.nan
+
+        # index of the spline that holds the parameter (see eval())
+        ind = bisect_right(self._breaks_inner_list, u)
+
+        d = u - self._breaks_list[ind]
+        cx0, cx1, cx2, cx3, cy0, cy1, cy2, cy3 = self._coeffs_list[nu][ind]
+
+        x = cx0 + d * (cx1 + d * (cx2 + d * cx3))
+        y = cy0 + d * (cy1 + d * (cy2 + d * cy3))
+
+        return x, y
@@ -12,11 +12,16 @@ from scipy.integrate import quad as quadrature
 from scipy.interpolate import CubicSpline
 from scipy.optimize import bisect
 
+from .calc_head_curv_an import calc_head_curv_an
+
 
 def uniform_spline_from_points(
     ref_points: np.ndarray,
     nbr_interpolation_points: int = None,
     additional_ref_points: List[np.ndarray] = None,
+    method: str = "quad",
+    tol: float = 1e-8,
+    gl_order: int = 16,
 ) -> Union[
     Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray, List[np.ndarray]]
 ]:
@@ -34,6 +39,16 @@ def uniform_spline_from_points(
     :type nbr_interpolation_points: int
     :param additional_ref_points: list of additional values to be interpolated to the spline.
     :type: list of np.ndarray
+    :param method: "quad" uses adaptive quadrature and bisection for every point (slow reference
+    implementation), "gauss_legendre" uses fixed-order Gauss-Legendre quadrature on all segments
+    at once and inverts the arc length for all points with vectorized Newton iterations.
+    :type method: str
+    :param tol: tolerance on the arc length (in m) of the Newton iterations, only used if
+    method is "gauss_legendre".
+    :type tol: float
+    :param gl_order: number of Gauss-Legendre nodes per segment, only used if method is
+    "gauss_legendre".
+    :type gl_order: int
 
     :return: new interpolation points (np.ndarray of shape (nbr_interpolation_points, 2))
      and the break points to use to fit the uniform spline.
@@ -54,16 +69,37 @@ def uniform_spline_from_points(
         t,
         ref_points[:, 1],
     )
+    if method not in ("quad", "gauss_legendre"):
+        raise ValueError("Unknown method: " + method)
+
     length = lambda t1, t2: quadrature(
         lambda u: np.sqrt(x_ref(u, 1) ** 2 + y_ref(u, 1) ** 2),
         t1,
         t2,
     )[0]
 
+    # Gauss-Legendre quadrature of the speed on the intervals [t1, t2] (vectorized)
+    gl_nodes, gl_weights = np.polynomial.legendre.leggauss(gl_order)
+    speed = lambda u: np.hypot(x_ref(u, 1), y_ref(u, 1))
+    length_gl = lambda t1, t2: (
+        0.5
+        * (t2 - t1)
+        * np.sum(
+            gl_weights
+            * speed(
+                t1[:, np.newaxis] + 0.5 * (t2 - t1)[:, np.newaxis] * (gl_nodes + 1.0)
+            ),
+            axis=1,
+        )
+    )
+
     # Step 1 : find the lengths of each segment of the original curve =================
-    l = np.zeros(N)
-    for i in range(N):
-        l[i] = length(t[i], t[i + 1])
+    if method == "quad":
+        l = np.zeros(N)
+        for i in range(N):
+            l[i] = length(t[i], t[i + 1])
+    else:
+        l = length_gl(t[:-1], t[1:])
 
     s = np.insert(np.cumsum(l), 0, 0.0)
     L = s[-1]
@@ -78,22 +114,39 @@ def uniform_spline_from_points(
         np.max(np.abs(sigma - L / M * np.arange(M + 1))) < 1e-10
     ), "sigma is not well computed"
 
-    for j in range(M - 1):
-        i = np.searchsorted(s, sigma[j + 1], side="right")
-        obj = (
-            lambda upper_bound: length(t[i - 1], upper_bound) - sigma[j + 1] + s[i - 1]
-        )
-        t_tilde[j + 1] = bisect(
-            obj,
-            t[i - 1],
-            t[i],
-        )
+    if method == "quad":
+        for j in range(M - 1):
+            i = np.searchsorted(s, sigma[j + 1], side="right")
+            obj = (
+                lambda upper_bound: length(t[i - 1], upper_bound)
+                - sigma[j + 1]
+                + s[i - 1]
+            )
+            t_tilde[j + 1] = bisect(
+                obj,
+                t[i - 1],
+                t[i],
+            )
+    else:
+        # Newton iterations for all points at once, starting from a linear guess within
+        # the segments
+        i = np.searchsorted(s, sigma[1:-1], side="right")
+        t_start = t[i - 1]
+        l_target = sigma[1:-1] - s[i - 1]
+        t_tilde_inner = t_start + l_target / l[i - 1]
+
+        for _ in range(20):
+            l_error = length_gl(t_start, t_tilde_inner) - l_target
+            if l_error.size == 0 or np.amax(np.abs(l_error)) < tol:
+                break
+            t_tilde_inner = np.clip(
+                t_tilde_inner - l_error / speed(t_tilde_inner), t_start, t[i]
+            )
+
+        t_tilde[1:-1] = t_tilde_inner
 
     # step 3 : construct the new re-parametrized spline ==============================
-    new_points = np.zeros((M + 1, 2))
-    for j in range(M + 1):
-        new_points[j, 0] = x_ref(t_tilde[j])
-        new_points[j, 1] = y_ref(t_tilde[j])
+    new_points = np.column_stack((x_ref(t_tilde), y_ref(t_tilde)))
 
     if additional_ref_points is None:
         return new_points, sigma
@@ -126,4 +179,248 @@ def uniform_spline_from_points(
         return new_points, sigma, additional_results
 
 
-# TODO: add new function to construct a uniform spline from coeffs_x, coeffs_y
+class UniformSpline:
+    """
+    Arc length parametrized representation of a path of third order splines (e.g. as
+    returned by calc_splines() or create_raceline()). For every spline, a lookup table
+    of the arc length at equidistant values of the spline parameter t is computed once
+    using Gauss-Legendre quadrature. The spline parameter corresponding to an arbitrary
+    arc length s is then obtained by linear interpolation in the lookup table followed
+    by Newton iterations, all vectorized over the queried arc lengths.
+
+    Headings and curvatures are returned as by calc_head_curv_an().
+
+    :param coeffs_x: coefficient matrix of the x splines with size (no_splines x 4).
+    :type coeffs_x: np.ndarray
+    :param coeffs_y: coefficient matrix of the y splines with size (no_splines x 4).
+    :type coeffs_y: np.ndarray
+    :param closed: whether the path is closed (arc lengths are wrapped) or not (arc
+    lengths are clipped to [0, length]).
+    :type closed: bool
+    :param no_lut_points: number of lookup table points per spline.
+    :type no_lut_points: int
+    :param gl_order: number of Gauss-Legendre nodes per lookup table interval.
+    :type gl_order: int
+    :param no_iters: number of Newton iterations after the lookup.
+    :type no_iters: int
+    """
+
+    def __init__(
+        self,
+        coeffs_x: np.ndarray,
+        coeffs_y: np.ndarray,
+        closed: bool = False,
+        no_lut_points: int = 16,
+        gl_order: int = 8,
+        no_iters: int = 2,
+    ):
+        if coeffs_x.shape[0] != coeffs_y.shape[0]:
+            raise ValueError("Coefficient matrices must have the same length!")
+
+        if not (coeffs_x.ndim == 2 and coeffs_y.ndim == 2):
+            raise ValueError("Coefficient matrices do not have two dimensions!")
+
+        self.coeffs_x = np.ascontiguousarray(coeffs_x, dtype=float)
+        self.coeffs_y = np.ascontiguousarray(coeffs_y, dtype=float)
+        self.closed = closed
+        self.no_splines = coeffs_x.shape[0]
+        self.no_iters = no_iters
+        self._gl_nodes, self._gl_weights = np.polynomial.legendre.leggauss(gl_order)
+
+        # lookup table: arc length within every spline at equidistant t values
+        self.t_lut = np.linspace(0.0, 1.0, no_lut_points)
+        ind_spls = np.repeat(np.arange(self.no_splines), no_lut_points - 1)
+        t_start = np.tile(self.t_lut[:-1], self.no_splines)
+        t_end = np.tile(self.t_lut[1:], self.no_splines)
+        self.s_lut = np.zeros((self.no_splines, no_lut_points))
+        self.s_lut[:, 1:] = np.cumsum(
+            self._length(ind_spls, t_start, t_end).reshape(self.no_splines, -1),
+            axis=1,
+        )
+
+        self.spline_lengths = self.s_lut[:, -1]
+        self.s_splines = np.insert(np.cumsum(self.spline_lengths), 0, 0.0)
+        self.length = self.s_splines[-1]
+
+    def spline_params(self, s: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the spline indices and spline parameters t corresponding to the given arc
+        lengths.
+
+        :param s: arc lengths, shape=(M,)
+        :type s: np.ndarray
+
+        :return: spline indices and spline parameters t, both of shape (M,)
+        """
+        s = np.atleast_1d(np.asarray(s, dtype=float))
+        if self.closed:
+            s = np.mod(s, self.length)
+        else:
+            s = np.clip(s, 0.0, self.length)
+
+        ind_spls = np.clip(
+            np.searchsorted(self.s_splines, s, side="right") - 1,
+            0,
+            self.no_splines - 1,
+        )
+        s_loc = s - self.s_splines[ind_spls]
+
+        # linear interpolation within the lookup table as initial guess
+        s_lut = self.s_lut[ind_spls]
+        ind_lut = np.clip(
+            np.sum(s_lut <= s_loc[:, np.newaxis], axis=1) - 1, 0, self.t_lut.size - 2
+        )
+        rows = np.arange(s.size)
+        s_lut_start = s_lut[rows, ind_lut]
+        t_lut_start = self.t_lut[ind_lut]
+        t = t_lut_start + (s_loc - s_lut_start) / (
+            s_lut[rows, ind_lut + 1] - s_lut_start
+        ) * (self.t_lut[1] - self.t_lut[0])
+
+        # Newton iterations on the arc length within the lookup table interval
+        for _ in range(self.no_iters):
+            s_error = s_lut_start + self._length(ind_spls, t_lut_start, t) - s_loc
+            t = np.clip(t - s_error / self._speed(ind_spls, t), 0.0, 1.0)
+
+        return ind_spls, t
+
+    def position(self, s: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the position at the given arc lengths.
+
+        :param s: arc lengths, shape=(M,)
+        :type s: np.ndarray
+
+        :return: positions [x, y], shape=(M, 2)
+        """
+        ind_spls, t = self.spline_params(s)
+
+        return self._position(ind_spls, t)
+
+    def heading(self, s: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the heading at the given arc lengths.
+
+        :param s: arc lengths, shape=(M,)
+        :type s: np.ndarray
+
+        :return: headings, shape=(M,)
+        """
+        ind_spls, t = self.spline_params(s)
+
+        return calc_head_curv_an(
+            coeffs_x=self.coeffs_x,
+            coeffs_y=self.coeffs_y,
+            ind_spls=ind_spls,
+            t_spls=t,
+            calc_curv=False,
+        )[0]
+
+    def curvature(self, s: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the curvature at the given arc lengths.
+
+        :param s: arc lengths, shape=(M,)
+        :type s: np.ndarray
+
+        :return: curvatures, shape=(M,)
+        """
+        ind_spls, t = self.spline_params(s)
+
+        return calc_head_curv_an(
+            coeffs_x=self.coeffs_x,
+            coeffs_y=self.coeffs_y,
+            ind_spls=ind_spls,
+            t_spls=t,
+        )[1]
+
+    def __call__(self, s: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate position, heading and curvature at the given arc lengths (the spline
+        parameters are only computed once).
+
+        :param s: arc lengths, shape=(M,)
+        :type s: np.ndarray
+
+        :return: positions [x, y] of shape (M, 2), headings and curvatures of shape (M,)
+        """
+        ind_spls, t = self.spline_params(s)
+
+        pos = self._position(ind_spls, t)
+        psi, kappa = calc_head_curv_an(
+            coeffs_x=self.coeffs_x,
+            coeffs_y=self.coeffs_y,
+            ind_spls=ind_spls,
+            t_spls=t,
+        )
+
+        return pos, psi, kappa
+
+    def _position(self, ind_spls: np.ndarray, t: np.ndarray) -> np.ndarray:
+        # positions [x, y] on the splines at the spline parameters t (Horner's scheme)
+        cx = self.coeffs_x[ind_spls]
+        cy = self.coeffs_y[ind_spls]
+
+        return np.column_stack(
+            (
+                ((cx[:, 3] * t + cx[:, 2]) * t + cx[:, 1]) * t + cx[:, 0],
+                ((cy[:, 3] * t + cy[:, 2]) * t + cy[:, 1]) * t + cy[:, 0],
+            )
+        )
+
+    def _speed(self, ind_spls: np.ndarray, t: np.ndarray) -> np.ndarray:
+        # norm of the first derivative of the splines w.r.t. t
+        cx = self.coeffs_x[ind_spls]
+        cy = self.coeffs_y[ind_spls]
+
+        return np.hypot(
+            (3 * cx[..., 3] * t + 2 * cx[..., 2]) * t + cx[..., 1],
+            (3 * cy[..., 3] * t + 2 * cy[..., 2]) * t + cy[..., 1],
+        )
+
+    def _length(
+        self, ind_spls: np.ndarray, t_start: np.ndarray, t_end: np.ndarray
+    ) -> np.ndarray:
+        # arc length of the splines between t_start and t_end (Gauss-Legendre quadrature)
+        t_nodes = t_start[:, np.newaxis] + 0.5 * (t_end - t_start)[:, np.newaxis] * (
+            self._gl_nodes + 1.0
+        )
+
+        return (
+            0.5
+            * (t_end - t_start)
+            * np.sum(
+                self._gl_weights * self._speed(ind_spls[:, np.newaxis], t_nodes), axis=1
+            )
+        )
+
+
+def uniform_spline_from_coeffs(
+    coeffs_x: np.ndarray,
+    coeffs_y: np.ndarray,
+    closed: bool = False,
+    no_lut_points: int = 16,
+) -> UniformSpline:
+    """
+    Constructs an arc length parametrized spline directly from the spline coefficients
+    (e.g. as returned by calc_splines() or create_raceline()), i.e. without resampling
+    points and fitting a new spline.
+
+    :param coeffs_x: coefficient matrix of the x splines with size (no_splines x 4).
+    :type coeffs_x: np.ndarray
+    :param coeffs_y: coefficient matrix of the y splines with size (no_splines x 4).
+    :type coeffs_y: np.ndarray
+    :param closed: whether the path is closed or not.
+    :type closed: bool
+    :param no_lut_points: number of arc length lookup table points per spline.
+    :type no_lut_points: int
+
+    :return: the arc length parametrized spline, whose total length is given by its
+    attribute length.
+    """
+    return UniformSpline(
+        coeffs_x=coeffs_x,
+        coeffs_y=coeffs_y,
+        closed=closed,
+        no_lut_points=no_lut_points,
+    )
@@ -0,0 +1,187 @@
+import json
+import os
+import struct
+
+import numpy as np
+
+from ._write_atomic import write_atomic
+
+# file layout: fixed-size preamble (magic bytes, format version, header length), JSON header (padded with spaces such
+# that the data starts at a multiple of DATA_ALIGNMENT bytes), data (column by column, little-endian)
+MAGIC = b"TPHTRAJ\x00"
+VERSION = 1
+PREAMBLE = struct.Struct("<8sII")
+DATA_ALIGNMENT = 64
+
+# column names used if the trajectory is given in the usual format [s, x, y, psi, kappa, vx, ax]
+COLUMNS_DEFAULT = ["s_m", "x_m", "y_m", "psi_rad", "kappa_radpm", "vx_mps", "ax_mps2"]
+
+
+def write_trajectory(
+    file_path: str,
+    trajectory: np.ndarray,
+    columns: list = None,
+    dtype: type = np.float64,
+    closed: bool = False,
+    s_tot: float = None,
+    metadata: dict = None,
+) -> None:
+    """
+    .. description::
+    Write a trajectory (e.g. a raceline with velocity profile) into a compact binary file that can be read without any
+    parsing effort by read_trajectory(). The data is stored column by column after a JSON header containing the column
+    names, the data type and further metadata.
+
+    .. inputs::
+    :param file_path:   path of the file that is written (an existing file is replaced atomically).
+    :type file_path:    str
+    :param trajectory:  trajectory with one point per row, e.g. [s, x, y, psi, kappa, vx, ax].
+    :type trajectory:   np.ndarray
+    :param columns:     names of the columns. Only optional if the trajectory consists of the seven columns
+                        [s, x, y, psi, kappa, vx, ax].
+    :type columns:      list
+    :param dtype:       data type the values are stored in, np.float64 or np.float32.
+    :type dtype:        type
+    :param closed:      flag showing if the trajectory is closed (e.g. raceline of a circuit).
+    :type closed:       bool
+    :param s_tot:       total length of the trajectory in m (should include the closing element if closed).
+    :type s_tot:        float
+    :param metadata:    further JSON-serializable information stored in the header (e.g. track name, vehicle
+                        parameters).
+    :type metadata:     dict
+
+    .. notes::
+    trajectory input should be unclosed if closed is True, s_tot then provides the length including the closing
+    element.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # CHECK INPUTS -----------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    trajectory = np.asarray(trajectory)
+
+    if trajectory.ndim == 1:
+        trajectory = trajectory[:, np.newaxis]
+
+    if trajectory.ndim != 2:
+        raise RuntimeError("Trajectory must have one or two dimensions!")
+
+    if columns is None:
+        if trajectory.shape[1] != len(COLUMNS_DEFAULT):
+            raise RuntimeError(
+                "Column names must be provided if trajectory is not given as [s, x, y, psi, kappa, vx, ax]!"
+            )
+
+        columns = COLUMNS_DEFAULT
+
+    if len(columns) != trajectory.shape[1]:
+        raise RuntimeError("Number of column names does not match trajectory!")
+
+    dtype = np.dtype(dtype)
+
+    if dtype not in (np.float64, np.float32):
+        raise RuntimeError("Trajectory can only be stored as float64 or float32!")
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # CREATE HEADER ----------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    header = {
+        "columns": [str(col) for col in columns],
+        "dtype": dtype.newbyteorder("<").str,
+        "n_rows": trajectory.shape[0],
+        "closed": bool(closed),
+        "s_tot": None if s_tot is None else float(s_tot),
+        "metadata": {} if metadata is None else metadata,
+    }
+
+    header_bytes = json.dumps(header).encode("utf-8")
+
+    # pad header such that the data is aligned
+    header_len = PREAMBLE.size + len(header_bytes)
+    header_bytes += b" " * (-header_len % DATA_ALIGNMENT)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # WRITE FILE -------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    # column-oriented storage, i.e. transposed trajectory in C order
+    data = np.ascontiguousarray(trajectory.T, dtype=header["dtype"])
+
+    def write_fct(fh):
+        fh.write(PREAMBLE.pack(MAGIC, VERSION, len(header_bytes)))
+        fh.write(header_bytes)
+        fh.write(data.tobytes())
+
+    write_atomic(path=file_path, write_fct=write_fct)
+
+
+def read_trajectory(file_path: str, mmap: bool = True) -> tuple:
+    """
+    .. description::
+    Read a trajectory file written by write_trajectory(). By default, the data is memory-mapped, i.e. reading is
+    (almost) free of cost and processes reading the same file share the according memory pages.
+
+    .. inputs::
+    :param file_path:   path of the trajectory file.
+    :type file_path:    str
+    :param mmap:        flag to memory-map the data (read-only) instead of loading it into memory.
+    :type mmap:         bool
+
+    .. outputs::
+    :return trajectory: trajectory with one point per row (columns are contiguous in memory).
+    :rtype trajectory:  np.ndarray
+    :return header:     header information: columns (list of column names), dtype, n_rows, closed, s_tot, metadata.
+    :rtype header:      dict
+
+    .. notes::
+    A single column can be accessed by trajectory[:, header["columns"].index(name)] without copying.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # READ HEADER ------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    with open(file_path, "rb") as fh:
+        preamble = fh.read(PREAMBLE.size)
+
+        if len(preamble) != PREAMBLE.size:
+            raise RuntimeError("File is too short to be a trajectory file!")
+
+        magic, version, header_len = PREAMBLE.unpack(preamble)
+
+        if magic != MAGIC:
+            raise RuntimeError("File is not a trajectory file!")
+
+        if version > VERSION:
+            raise RuntimeError(
+                "Trajectory file version %i is not supported (max. version %i)!"
+                % (version, VERSION)
+            )
+
+        header = json.loads(fh.read(header_len).decode("utf-8"))
+
+    offset = PREAMBLE.size + header_len
+    shape = (len(header["columns"]), header["n_rows"])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # READ DATA --------------------------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------------------------------------
+
+    if os.path.getsize(file_path) < offset + np.dtype(header["dtype"]).itemsize * (
+        shape[0] * shape[1]
+    ):
+        raise RuntimeError("Trajectory file is truncated!")
+
+    if mmap and shape[0] * shape[1] > 0:
+        data = np.memmap(
+            file_path, dtype=header["dtype"], mode="r", offset=offset, shape=shape
+        )
+    else:
+        data = np.fromfile(
+            file_path, dtype=header["dtype"], count=shape[0] * shape[1], offset=offset
+        ).reshape(shape)
+
+    # data is stored column by column -> transpose to get one point per row
+    return data.T, header